@@ -0,0 +1,60 @@
+"""
+Compares the query latency of ContractionHierarchy against plain dijkstra on a grid shaped road-like graph.
+
+Usage:
+    python -m benchmarks.contraction --width 60 --queries 200 --seed 0
+"""
+import argparse
+import random
+import time
+from statistics import mean, median
+
+from src.sugraph.Data import Graph
+from src.sugraph.Algorithms.ShortestPath import dijkstra
+from src.sugraph.Algorithms.ContractionHierarchy import ContractionHierarchy
+
+from .generators import grid
+
+
+def _time_queries(function, pairs):
+    latencies = []
+    results = []
+    for start, end in pairs:
+        begin = time.perf_counter()
+        results.append(function(start, end)[1])
+        latencies.append(time.perf_counter() - begin)
+    return latencies, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=60)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = Graph(*grid(args.width, args.seed))
+
+    begin = time.perf_counter()
+    hierarchy = ContractionHierarchy.build(graph)
+    build_time = time.perf_counter() - begin
+
+    rng = random.Random(args.seed)
+    pairs = [(rng.choice(graph.vertices), rng.choice(graph.vertices)) for _ in range(args.queries)]
+
+    dijkstra_latencies, dijkstra_results = _time_queries(lambda start, end: dijkstra(graph, start, end), pairs)
+    hierarchy_latencies, hierarchy_results = _time_queries(hierarchy.query, pairs)
+
+    if any(abs(a - b) > 1e-9 for a, b in zip(dijkstra_results, hierarchy_results)):
+        raise Exception("Contraction hierarchy and dijkstra disagree on a path length")
+
+    print("vertices: %d  edges: %d  shortcuts: %d  build: %.2fs" % (graph.graph_size, graph.num_edges,
+                                                                     hierarchy.num_shortcuts, build_time))
+    print("%-22s %12s %12s" % ("algorithm", "mean (ms)", "median (ms)"))
+    for name, latencies in (("dijkstra", dijkstra_latencies), ("contraction hierarchy", hierarchy_latencies)):
+        print("%-22s %12.3f %12.3f" % (name, 1000 * mean(latencies), 1000 * median(latencies)))
+    print("speedup (mean): %.1fx" % (mean(dijkstra_latencies) / mean(hierarchy_latencies)))
+
+
+if (__name__ == "__main__"):
+    main()
@@ -0,0 +1,133 @@
+"""
+Seeded synthetic graph generators shared by the benchmarks.
+
+Every generator returns a list of vertex IDs and a list of (source, target, weight) edges, so that benchmarks can
+time graph construction separately from generation. The same arguments always produce the same graph.
+"""
+import random
+from typing import List, Tuple
+
+Edges = List[Tuple[int, int, float]]
+
+
+def erdos_renyi(num_vertices: int, average_degree: float, seed: int) -> Tuple[List[int], Edges]:
+    """
+    Creates a directed G(n, m) random graph with m = num_vertices * average_degree edges between uniformly
+    chosen end points, weighted uniformly in [1, 10).
+
+    Params:
+        num_vertices (int): Number of vertices
+        average_degree (float): Average out-degree
+        seed (int): Seed of the generator
+
+    Returns:
+        Tuple[List[int], Edges]: vertex IDs 1..num_vertices and edges
+    """
+    rng = random.Random(seed)
+
+    edges = [(rng.randint(1, num_vertices), rng.randint(1, num_vertices), 1 + 9 * rng.random())
+             for _ in range(int(num_vertices * average_degree))]
+
+    return list(range(1, num_vertices + 1)), edges
+
+
+def grid(width: int, seed: int) -> Tuple[List[int], Edges]:
+    """
+    Creates a road-like width x width grid with edges in both directions between horizontal and vertical
+    neighbours, weighted uniformly in [1, 2).
+
+    Params:
+        width (int): Number of vertices along a side of the grid
+        seed (int): Seed for the edge weights
+
+    Returns:
+        Tuple[List[int], Edges]: vertex IDs 1..width * width and edges
+    """
+    rng = random.Random(seed)
+
+    edges = []
+    for y in range(width):
+        for x in range(width):
+            vertex = y * width + x + 1
+            if (x + 1 < width):
+                weight = 1 + rng.random()
+                edges.append((vertex, vertex + 1, weight))
+                edges.append((vertex + 1, vertex, weight))
+            if (y + 1 < width):
+                weight = 1 + rng.random()
+                edges.append((vertex, vertex + width, weight))
+                edges.append((vertex + width, vertex, weight))
+
+    return list(range(1, width * width + 1)), edges
+
+
+def power_law(num_vertices: int, edges_per_vertex: int, seed: int) -> Tuple[List[int], Edges]:
+    """
+    Creates a Barabasi-Albert preferential attachment graph, whose degrees follow a power law. Every new vertex
+    links to edges_per_vertex distinct earlier vertices chosen proportionally to their degree, with edges in both
+    directions weighted uniformly in [1, 10).
+
+    Params:
+        num_vertices (int): Number of vertices
+        edges_per_vertex (int): Number of earlier vertices every new vertex links to
+        seed (int): Seed of the generator
+
+    Returns:
+        Tuple[List[int], Edges]: vertex IDs 1..num_vertices and edges
+    """
+    rng = random.Random(seed)
+
+    edges = []
+    endpoints = list(range(1, edges_per_vertex + 1))
+
+    for vertex in range(edges_per_vertex + 1, num_vertices + 1):
+        targets = set()
+        while (len(targets) < edges_per_vertex):
+            targets.add(rng.choice(endpoints))
+
+        for target in targets:
+            weight = 1 + 9 * rng.random()
+            edges.append((vertex, target, weight))
+            edges.append((target, vertex, weight))
+            endpoints.append(target)
+            endpoints.append(vertex)
+
+    return list(range(1, num_vertices + 1)), edges
+
+
+def layered_flow_network(layers: int, width: int, seed: int, out_degree: int = 3,
+                         max_capacity: int = 100) -> Tuple[List[int], Edges]:
+    """
+    Creates a flow network of layers x width vertices between a source and a sink. The source feeds every
+    vertex of the first layer, every vertex links to out_degree random vertices of the next layer, and every
+    vertex of the last layer drains into the sink. Capacities are integers in [1, max_capacity].
+
+    Params:
+        layers (int): Number of layers
+        width (int): Number of vertices per layer
+        seed (int): Seed of the generator
+        out_degree (int): Number of edges from every vertex to the next layer
+        max_capacity (int): Largest capacity
+
+    Returns:
+        Tuple[List[int], Edges]: vertex IDs 1..layers * width + 2, the source being the first and the sink the
+        last, and edges
+    """
+    rng = random.Random(seed)
+
+    source = 1
+    sink = layers * width + 2
+
+    def vertex(layer: int, position: int) -> int:
+        return 2 + layer * width + position
+
+    edges = [(source, vertex(0, position), rng.randint(1, max_capacity)) for position in range(width)]
+
+    for layer in range(layers - 1):
+        for position in range(width):
+            for target in rng.sample(range(width), min(out_degree, width)):
+                edges.append((vertex(layer, position), vertex(layer + 1, target), rng.randint(1, max_capacity)))
+
+    edges.extend((vertex(layers - 1, position), sink, rng.randint(1, max_capacity)) for position in range(width))
+
+    return list(range(1, sink + 1)), edges
@@ -0,0 +1,331 @@
+"""
+Times graph construction, IO and every algorithm on seeded synthetic graphs of several sizes, writes the results
+as JSON and compares them against an earlier run.
+
+Usage:
+    python -m benchmarks.suite --scale small --output results.json
+    python -m benchmarks.suite --scale small --output new.json --baseline results.json --threshold 0.2
+    python -m benchmarks.suite --compare results.json new.json --threshold 0.2
+
+A case regresses when its time grows by more than threshold (0.2 is 20%) over the baseline; the process then
+exits with status 1, so that the comparison can gate a commit.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from math import isqrt
+from typing import Callable, Dict, List, Tuple
+
+from src.sugraph.Data import Graph, read_graph, write_graph
+from src.sugraph.Algorithms.ShortestPath import belmannford, dijkstra, bidirectional_dijkstra, astar, floydwarshall
+from src.sugraph.Algorithms.Traversal import BFS, DFS, BFS_levels
+from src.sugraph.Algorithms.Flow import fordfulkerson, dinic, push_relabel
+from src.sugraph.Algorithms.Landmarks import LandmarkIndex, alt
+from src.sugraph.Algorithms.ContractionHierarchy import ContractionHierarchy
+from src.sugraph.Algorithms.Batch import batch_dijkstra
+from src.sugraph.Algorithms.Components import weakly_connected_components, strongly_connected_components, \
+    _weak_labels, _strong_labels
+
+from .generators import erdos_renyi, grid, power_law, layered_flow_network
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SCALES = {
+    "small": (1000,),
+    "medium": (1000, 10000),
+    "large": (1000, 10000, 100000),
+}
+
+NUM_QUERIES = 10
+
+# Largest number of vertices the algorithms that need O(V^2) memory or O(VE) time are run on
+DENSE_LIMIT = 1000
+
+# Largest number of vertices contraction hierarchies are built for, their preprocessing takes a minute at 10000
+HIERARCHY_LIMIT = 1000
+
+NUM_LANDMARKS = 8
+
+
+def _graphs(size: int, seed: int) -> Dict[str, Tuple[List[int], list]]:
+    """
+    A helper function to generate the vertex and edge lists of every generator at about size vertices.
+    """
+    return {
+        "erdos_renyi": erdos_renyi(size, 5, seed),
+        "grid": grid(isqrt(size), seed),
+        "power_law": power_law(size, 3, seed),
+    }
+
+
+def _pairs(vertices: List[int], seed: int) -> List[Tuple[int, int]]:
+    rng = random.Random(seed)
+    return [(rng.choice(vertices), rng.choice(vertices)) for _ in range(NUM_QUERIES)]
+
+
+def _grid_heuristic(width: int) -> Callable[[int, int], float]:
+    """
+    A helper function to create the Manhattan distance A* heuristic of a grid, admissible as grid edges weigh at
+    least 1.
+    """
+    def heuristic(vertex_id: int, end: int) -> float:
+        y1, x1 = divmod(vertex_id - 1, width)
+        y2, x2 = divmod(end - 1, width)
+        return abs(x2 - x1) + abs(y2 - y1)
+
+    return heuristic
+
+
+def _uncached(function: Callable[[Graph], object], graph: Graph) -> Callable[[], object]:
+    """
+    A helper function to time a component search without the labels cached by its previous repetition.
+    """
+    def case():
+        _weak_labels.pop(graph, None)
+        _strong_labels.pop(graph, None)
+        return function(graph)
+
+    return case
+
+
+def _write_text_formats(edges: list, size: int, directory: str) -> Dict[str, str]:
+    """
+    A helper function to write the edges of a graph as GraphML, CSV and Matrix Market files for the reader cases.
+
+    Returns:
+        Dict[str, str]: path of the file of every format
+    """
+    paths = {name: os.path.join(directory, "graph_%d.%s" % (size, name)) for name in ("graphml", "csv", "mtx")}
+
+    with open(paths["graphml"], "w") as file:
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                   '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+                   '<key id="w" for="edge" attr.name="weight" attr.type="double"/>\n'
+                   '<graph edgedefault="directed">\n')
+        file.writelines('<node id="%d"/>\n' % vertex for vertex in range(1, size + 1))
+        file.writelines('<edge source="%d" target="%d"><data key="w">%r</data></edge>\n' % edge for edge in edges)
+        file.write('</graph>\n</graphml>\n')
+
+    with open(paths["csv"], "w") as file:
+        file.write("source,target,weight\n")
+        file.writelines("%d,%d,%r\n" % edge for edge in edges)
+
+    with open(paths["mtx"], "w") as file:
+        file.write("%%%%MatrixMarket matrix coordinate real general\n%d %d %d\n" % (size, size, len(edges)))
+        file.writelines("%d %d %r\n" % edge for edge in edges)
+
+    return paths
+
+
+def _cases(size: int, seed: int, directory: str) -> Dict[str, Callable[[], object]]:
+    """
+    A helper function to prepare the benchmark cases of one size.
+
+    Params:
+        size (int): Approximate number of vertices of the generated graphs
+        seed (int): Seed of the generators and query pairs
+        directory (str): Directory for the files of the IO cases
+
+    Returns:
+        Dict[str, Callable[[], object]]: function to be timed for every case name
+    """
+    cases = {}
+
+    for name, (vertices, edges) in _graphs(size, seed).items():
+        suffix = "%s/n=%d" % (name, len(vertices))
+        graph = Graph(vertices, edges)
+        pairs = _pairs(vertices, seed)
+
+        cases["construction/constructor/" + suffix] = lambda vertices=vertices, edges=edges: Graph(vertices, edges)
+        cases["construction/from_arrays/" + suffix] = lambda edges=edges: Graph.from_arrays(
+            [edge[0] for edge in edges], [edge[1] for edge in edges], [edge[2] for edge in edges])
+
+        for function in (dijkstra, bidirectional_dijkstra, BFS, DFS):
+            cases["query/%s/%s" % (function.__name__, suffix)] = \
+                lambda function=function, graph=graph, pairs=pairs: [function(graph, *pair) for pair in pairs]
+
+        heuristic = _grid_heuristic(isqrt(size)) if name == "grid" else None
+        cases["query/astar/" + suffix] = \
+            lambda graph=graph, pairs=pairs, heuristic=heuristic: [astar(graph, *pair, heuristic) for pair in pairs]
+
+        cases["query/BFS_levels/" + suffix] = lambda graph=graph, start=pairs[0][0]: BFS_levels(graph, start)
+        cases["query/batch_dijkstra/" + suffix] = \
+            lambda graph=graph, pairs=pairs: batch_dijkstra(graph, pairs, max_workers=1)
+
+        cases["preprocess/landmarks/" + suffix] = \
+            lambda graph=graph: LandmarkIndex.build(graph, NUM_LANDMARKS, seed)
+        index = LandmarkIndex.build(graph, NUM_LANDMARKS, seed)
+        cases["query/alt/" + suffix] = \
+            lambda graph=graph, pairs=pairs, index=index: [alt(graph, *pair, index) for pair in pairs]
+
+        if (name == "grid" and len(vertices) <= HIERARCHY_LIMIT):
+            cases["preprocess/contraction_hierarchy/" + suffix] = \
+                lambda graph=graph: ContractionHierarchy.build(graph)
+            hierarchy = ContractionHierarchy.build(graph)
+            cases["query/contraction_hierarchy/" + suffix] = \
+                lambda pairs=pairs, hierarchy=hierarchy: [hierarchy.query(*pair) for pair in pairs]
+
+        # A graph of its own, so that the cached labels don't let the query cases skip unreachable pairs
+        components_graph = Graph(vertices, edges)
+        for function in (weakly_connected_components, strongly_connected_components):
+            cases["components/%s/%s" % (function.__name__, suffix)] = _uncached(function, components_graph)
+
+        cases["query/belmannford_spfa/" + suffix] = \
+            lambda graph=graph, pair=pairs[0]: belmannford(graph, *pair, mode="spfa")
+
+        if (len(vertices) <= DENSE_LIMIT):
+            cases["query/belmannford/" + suffix] = lambda graph=graph, pair=pairs[0]: belmannford(graph, *pair)
+
+            if (np is not None):
+                cases["all_pairs/floydwarshall/" + suffix] = lambda graph=graph: floydwarshall(graph)
+
+    vertices, edges = erdos_renyi(size, 5, seed)
+    graph = Graph(vertices, edges)
+    suffix = "erdos_renyi/n=%d" % size
+
+    binary_path = os.path.join(directory, "graph_%d.sgb" % size)
+    text_path = os.path.join(directory, "graph_%d.txt" % size)
+    with open(text_path, "w") as file:
+        file.writelines("%d %d %r\n" % edge for edge in edges)
+
+    cases["io/write_binary/" + suffix] = lambda graph=graph, path=binary_path: write_graph(graph, path)
+    write_graph(graph, binary_path)
+    cases["io/read_binary/" + suffix] = lambda path=binary_path: read_graph(path)
+    cases["io/read_edgelist/" + suffix] = lambda path=text_path: read_graph(path)
+
+    for name, path in _write_text_formats(edges, size, directory).items():
+        cases["io/read_%s/%s" % (name, suffix)] = lambda path=path: read_graph(path)
+
+    layers = max(2, isqrt(size) // 2)
+    vertices, edges = layered_flow_network(layers, max(1, size // layers), seed)
+    network = Graph(vertices, edges)
+    source, sink = vertices[0], vertices[-1]
+    suffix = "layered/n=%d" % len(vertices)
+
+    for function in (dinic, push_relabel):
+        cases["flow/%s/%s" % (function.__name__, suffix)] = \
+            lambda function=function: function(network, source, sink)
+
+    if (len(vertices) <= DENSE_LIMIT):
+        cases["flow/fordfulkerson/" + suffix] = lambda: fordfulkerson(network, source, sink)
+
+    return cases
+
+
+def run(scale: str, seed: int, repeat: int, selection: str | None = None) -> Dict[str, dict]:
+    """
+    Runs every benchmark case of a scale.
+
+    Params:
+        scale (str): Key of SCALES
+        seed (int): Seed of the generators and query pairs
+        repeat (int): Number of times every case is timed, the fastest time is reported
+        selection (str | None): Only cases whose name contains this string are run
+
+    Returns:
+        Dict[str, dict]: for every case name, the fastest time in seconds and the times of every repetition
+    """
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SCALES[scale]:
+            for name, function in _cases(size, seed, directory).items():
+                if (selection is not None and selection not in name):
+                    continue
+
+                times = []
+                for _ in range(repeat):
+                    begin = time.perf_counter()
+                    function()
+                    times.append(time.perf_counter() - begin)
+
+                results[name] = {"seconds": min(times), "repeats": times}
+                print("%-60s %10.4f s" % (name, min(times)), flush=True)
+
+    return results
+
+
+def compare(baseline: Dict[str, dict], current: Dict[str, dict], threshold: float) -> List[str]:
+    """
+    Compares the cases two runs have in common and prints the ratio of their times.
+
+    Params:
+        baseline (Dict[str, dict]): Results of the earlier run
+        current (Dict[str, dict]): Results of the later run
+        threshold (float): Largest accepted relative slowdown
+
+    Returns:
+        List[str]: names of the cases slower than (1 + threshold) times their baseline
+    """
+    regressions = []
+
+    print("%-60s %10s %10s %8s" % ("case", "baseline", "current", "ratio"))
+    for name in sorted(baseline.keys() & current.keys()):
+        old = baseline[name]["seconds"]
+        new = current[name]["seconds"]
+        ratio = new / old if old > 0 else 1.0
+
+        status = ""
+        if (ratio > 1 + threshold):
+            regressions.append(name)
+            status = "  REGRESSION"
+
+        print("%-60s %10.4f %10.4f %8.2f%s" % (name, old, new, ratio, status))
+
+    return regressions
+
+
+def _load(file_path: str) -> Dict[str, dict]:
+    with open(file_path) as file:
+        return json.load(file)["results"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", default=None, help="only run cases whose name contains this string")
+    parser.add_argument("--output", default=None, help="JSON file the results are written to")
+    parser.add_argument("--baseline", default=None, help="JSON file of an earlier run to compare against")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), default=None,
+                        help="compare two result files without running")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    if (args.compare is not None):
+        regressions = compare(_load(args.compare[0]), _load(args.compare[1]), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    results = run(args.scale, args.seed, args.repeat, args.filter)
+
+    if (args.output is not None):
+        with open(args.output, "w") as file:
+            json.dump({
+                "meta": {
+                    "scale": args.scale,
+                    "seed": args.seed,
+                    "repeat": args.repeat,
+                    "python": platform.python_version(),
+                    "numpy": np.__version__ if np is not None else None,
+                    "platform": platform.platform(),
+                    "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                },
+                "results": results,
+            }, file, indent=2)
+
+    if (args.baseline is not None):
+        regressions = compare(_load(args.baseline), results, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if (__name__ == "__main__"):
+    main()
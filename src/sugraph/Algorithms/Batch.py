@@ -0,0 +1,149 @@
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from math import inf
+from typing import Tuple, List, Dict, Iterable
+
+from ..Data import Graph
+from ..Data.Shared import _share_arrays, _attach_arrays
+from .ShortestPath import _get_index, _shortest_path_tree, _slot_path
+
+_worker_csr = None
+
+
+def _init_worker(descriptor: List[Tuple[str, str, int]]) -> None:
+    """
+    A helper function run once in every worker process, attaching to the shared CSR arrays.
+    """
+    global _worker_csr
+    _worker_csr = _attach_arrays(descriptor)
+
+
+def _search(offsets, targets, weights, source_index: int, target_indices: List[int] | None):
+    """
+    A helper function running Dijkstra from one source, stopping once every requested target is settled.
+
+    Params:
+        offsets, targets, weights: CSR arrays of the graph
+        source_index (int): Slot index of the source vertex
+        target_indices (List[int] | None): Slot indices of the targets, None to search the whole graph
+
+    Returns:
+        List[Tuple[float, List[int]]] | Tuple[List[float], List[int]]: distance and slot index path of every
+        target, or the distance and parent arrays of the whole graph if target_indices is None
+    """
+    distances, parents = _shortest_path_tree(offsets, targets, weights, len(offsets) - 1, source_index,
+                                             target_indices)
+
+    if (target_indices is None):
+        return distances, parents
+
+    return [(distances[target_index], _slot_path(parents, source_index, target_index))
+            if distances[target_index] != inf else (inf, [])
+            for target_index in target_indices]
+
+
+def _worker_search(task: Tuple[int, List[int] | None]):
+    """
+    A helper function running _search in a worker process on the shared CSR arrays.
+    """
+    offsets, targets, weights = _worker_csr[1]
+    return _search(offsets, targets, weights, task[0], task[1])
+
+
+def _run(graph: Graph, tasks: List[Tuple[int, List[int] | None]], max_workers: int | None) -> list:
+    """
+    A helper function running search tasks, in a process pool sharing the CSR arrays unless a single worker is
+    requested.
+
+    Params:
+        graph (Graph): Graph to be searched for
+        tasks (List[Tuple[int, List[int] | None]]): (source index, target indices) of every search
+        max_workers (int): Number of worker processes, None for one per CPU, 1 to search in this process
+
+    Returns:
+        list: result of _search for every task, in task order
+    """
+    offsets, targets, weights = graph.csr
+
+    workers = max_workers or os.cpu_count() or 1
+
+    if (workers == 1 or len(tasks) <= 1):
+        return [_search(offsets, targets, weights, source_index, target_indices)
+                for source_index, target_indices in tasks]
+
+    blocks, descriptor = _share_arrays((offsets, targets, weights))
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(descriptor,)) as executor:
+            chunksize = max(1, len(tasks) // (4 * workers))
+            return list(executor.map(_worker_search, tasks, chunksize=chunksize))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def batch_dijkstra(graph: Graph, pairs: Iterable[Tuple[int, int]],
+                   max_workers: int | None = None) -> List[Tuple[Tuple[int], float]]:
+    """
+    Finds the shortest paths of many (start, end) pairs.
+
+    Pairs are grouped by start vertex, so every start vertex is searched once and its search stops as soon as all
+    of its end vertices are settled. The searches are spread over a pool of worker processes, the CSR arrays of
+    the graph are passed to the workers once through shared memory.
+
+    Params:
+        graph (Graph): Graph to be searched for, edge weights should be non-negative
+        pairs (Iterable[Tuple[int, int]]): (start, end) vertex id pairs
+        max_workers (int): Number of worker processes, None for one per CPU, 1 to search in this process
+
+    Returns:
+        List[Tuple[Tuple[int], float]]: path and its length for every pair, in the order of pairs, an empty path
+        and inf if end is unreachable
+    """
+    if(not isinstance(graph, Graph)):
+        raise Exception("Graph should be an instance of Graph class")
+
+    pairs = list(pairs)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for start, end in pairs:
+        groups[_get_index(graph, start)].append(_get_index(graph, end))
+
+    tasks = [(source_index, list(dict.fromkeys(target_indices))) for source_index, target_indices in groups.items()]
+    results = _run(graph, tasks, max_workers)
+
+    answers = {}
+    for (source_index, target_indices), task_results in zip(tasks, results):
+        for target_index, (distance, path) in zip(target_indices, task_results):
+            answers[source_index, target_index] = (tuple(graph.get_vertex_id(index) for index in path), distance)
+
+    return [answers[graph.get_vertex_index(start), graph.get_vertex_index(end)] for start, end in pairs]
+
+
+def multi_source_dijkstra(graph: Graph, sources: Iterable[int],
+                          max_workers: int | None = None) -> Dict[int, Tuple[List[float], List[int]]]:
+    """
+    Computes the full shortest path tree of many start vertices.
+
+    The searches are spread over a pool of worker processes, the CSR arrays of the graph are passed to the
+    workers once through shared memory.
+
+    Params:
+        graph (Graph): Graph to be searched for, edge weights should be non-negative
+        sources (Iterable[int]): ids of the start vertices
+        max_workers (int): Number of worker processes, None for one per CPU, 1 to search in this process
+
+    Returns:
+        Dict[int, Tuple[List[float], List[int]]]: for every start vertex id, the distance and parent slot index of
+        every slot index, inf and -1 for unreachable vertices
+    """
+    if(not isinstance(graph, Graph)):
+        raise Exception("Graph should be an instance of Graph class")
+
+    sources = list(dict.fromkeys(sources))
+    tasks = [(_get_index(graph, source), None) for source in sources]
+
+    return dict(zip(sources, _run(graph, tasks, max_workers)))
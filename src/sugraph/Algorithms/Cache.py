@@ -0,0 +1,225 @@
+import dataclasses
+from collections import OrderedDict
+from math import inf
+from typing import Any, Tuple, List
+
+from ..Data import Graph
+from .ShortestPath import dijkstra, _get_index, _reconstruct_path, _shortest_path_tree
+from .Traversal import BFS, BFS_levels, _trace_path
+
+
+@dataclasses.dataclass
+class CacheStats():
+    """
+    Counters of a QueryCache.
+
+    Attributes:
+        hits (int): Number of queries answered from the cache, either from a cached result or a cached tree
+        misses (int): Number of queries that had to search the graph
+        evictions (int): Number of entries dropped to stay within the size limit
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class QueryCache():
+    """
+    Opt-in memoization of dijkstra and BFS queries, bounded by the total size of the cached results and evicting
+    the least recently used entries first.
+
+    Entries are keyed by (graph, graph version, algorithm, source, target), so every change of a graph leaves
+    its older entries unreachable until they are evicted. Once tree_threshold distinct targets have been
+    queried from the same source at the same version, the whole single source tree is computed and cached,
+    and every later target from that source is answered from it.
+
+    The size of an entry is the number of values it holds: the vertices of a path, or two per vertex for a
+    tree. Cached entries hold a reference to their graph, call clear to release it.
+
+    Protected Variables:
+        _entries (OrderedDict[tuple, Tuple[Any, int]]): Cached value and size of every key, least recently used
+            first
+        _size (int): Total size of the entries
+    """
+
+    def __init__(self, max_size: int = 1 << 22, tree_threshold: int = 2):
+        """
+        Constructor
+
+        Params:
+            max_size (int): Largest total size of the entries
+            tree_threshold (int): Number of distinct targets queried from a source before its whole tree is
+                computed, 1 to compute trees on the first query
+        """
+        self.max_size = max_size
+        self.tree_threshold = tree_threshold
+        self.stats = CacheStats()
+
+        self._entries: OrderedDict[tuple, Tuple[Any, int]] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """
+        Retrieves the total size of the cached entries.
+
+        Returns:
+            int: Sum of the sizes of the entries, at most max_size
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """
+        Drops every entry, the counters are kept.
+        """
+        self._entries.clear()
+        self._size = 0
+
+    def dijkstra(self, graph: Graph, start: int, end: int) -> Tuple[Tuple[int], float]:
+        """
+        Cached version of ShortestPath.dijkstra.
+
+        Params:
+            graph (Graph): Graph to be searched for
+            start (int): id of the start vertex
+            end (int): id of the end vertex
+
+        Returns:
+            Tuple[Tuple[int], float]: path from start vertex to end vertex and its length,
+            an empty path and inf if end is unreachable
+        """
+        key = (graph, graph.version, "dijkstra", start)
+
+        result = self._get(key + (end,))
+        if (result is not None):
+            return result
+
+        tree = self._get(key + (None,))
+        if (tree is None):
+            tree = self._miss(key, lambda: _shortest_path_tree(*graph.csr, graph.graph_size,
+                                                               _get_index(graph, start)))
+
+            if (tree is None):
+                result = dijkstra(graph, start, end)
+                self._put(key + (end,), result, len(result[0]) + 1)
+                return result
+
+        distances, parents = tree
+        end_index = _get_index(graph, end)
+
+        if (distances[end_index] == inf):
+            return tuple(), inf
+
+        return _reconstruct_path(graph, parents, graph.get_vertex_index(start), end_index), distances[end_index]
+
+    def bfs(self, graph: Graph | List[List[float]], start: int, end: int) -> Tuple[int]:
+        """
+        Cached version of Traversal.BFS, adjacency matrices are passed through to BFS without caching.
+
+        Params:
+            graph (Graph | List[List[float]]): Graph to be searched for
+            start (int): id of the start vertex
+            end (int): id of the end vertex
+
+        Returns:
+            Tuple[int]: path from start vertex to end vertex
+        """
+        if (not isinstance(graph, Graph)):
+            return BFS(graph, start, end)
+
+        key = (graph, graph.version, "bfs", start)
+
+        result = self._get(key + (end,))
+        if (result is not None):
+            return result
+
+        tree = self._get(key + (None,))
+        if (tree is None):
+            tree = self._miss(key, lambda: BFS_levels(graph, start))
+
+            if (tree is None):
+                result = BFS(graph, start, end)
+                self._put(key + (end,), result, len(result) + 1)
+                return result
+
+        levels, parents = tree
+        end_index = graph.get_vertex_index(end)
+
+        if (end_index is None or end_index == graph.get_vertex_index(start) or levels[end_index] == -1):
+            return tuple()
+
+        return _trace_path(graph.vertices, parents, end_index)
+
+    def _get(self, key: tuple) -> Any:
+        """
+        A helper function to look up a result or tree, counting a hit and marking it recently used if found.
+
+        Returns:
+            Any: the cached value, None if missing
+        """
+        entry = self._entries.get(key)
+
+        if (entry is None):
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+
+        return entry[0]
+
+    def _miss(self, key: tuple, compute_tree) -> Any:
+        """
+        A helper function to count a miss for the source of key, computing and caching its tree once
+        tree_threshold targets have missed.
+
+        Params:
+            key (tuple): (graph, version, algorithm, source) of the query
+            compute_tree (Callable[[], Tuple]): Computes the tree of the source
+
+        Returns:
+            Any: the tree if it was computed, None if the query should be searched on its own
+        """
+        self.stats.misses += 1
+
+        count_key = key + ("misses",)
+        count = 1
+
+        entry = self._entries.pop(count_key, None)
+        if (entry is not None):
+            self._size -= entry[1]
+            count += entry[0]
+
+        if (count < self.tree_threshold):
+            self._put(count_key, count, 1)
+            return None
+
+        tree = compute_tree()
+        self._put(key + (None,), tree, 2 * len(tree[0]))
+
+        return tree
+
+    def _put(self, key: tuple, value: Any, size: int) -> None:
+        """
+        A helper function to insert an entry and evict least recently used entries beyond max_size.
+
+        Params:
+            key (tuple): Key of the entry
+            value (Any): Value to be cached
+            size (int): Size of the value
+        """
+        if (size > self.max_size):
+            return
+
+        if (key in self._entries):
+            self._size -= self._entries.pop(key)[1]
+
+        self._entries[key] = (value, size)
+        self._size += size
+
+        while (self._size > self.max_size):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+            self.stats.evictions += 1
@@ -0,0 +1,236 @@
+from array import array
+from typing import Tuple
+from weakref import WeakKeyDictionary
+
+from ..Data import Graph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Latest labels computed for every graph, as (graph version, number of components, labels)
+_weak_labels: "WeakKeyDictionary[Graph, Tuple[int, int, array]]" = WeakKeyDictionary()
+_strong_labels: "WeakKeyDictionary[Graph, Tuple[int, int, array]]" = WeakKeyDictionary()
+
+
+def _weak_components_python(offsets, targets, size: int) -> Tuple[int, array]:
+    """
+    A helper function running union-find with union by size and path halving over the CSR arrays, used when
+    numpy is not installed. See weakly_connected_components for the return value.
+    """
+    parent = list(range(size))
+    sizes = size * [1]
+
+    for source in range(size):
+        for position in range(offsets[source], offsets[source + 1]):
+            a = source
+            while (parent[a] != a):
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+
+            b = targets[position]
+            while (parent[b] != b):
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+
+            if (a == b):
+                continue
+
+            if (sizes[a] < sizes[b]):
+                a, b = b, a
+
+            parent[b] = a
+            sizes[a] += sizes[b]
+
+    labels = array('q', [-1]) * size
+    root_labels = {}
+
+    for vertex in range(size):
+        root = vertex
+        while (parent[root] != root):
+            root = parent[root]
+
+        labels[vertex] = root_labels.setdefault(root, len(root_labels))
+
+    return len(root_labels), labels
+
+
+def _weak_components_numpy(offsets, targets, size: int):
+    """
+    A helper function running vectorized union-find over the edge arrays: every round hooks the root of the
+    larger end point of every edge under the smaller root with np.minimum.at, then compresses every path with
+    pointer jumping until every vertex points at its root. See weakly_connected_components for the return value.
+    """
+    offsets = np.frombuffer(offsets, dtype=np.int64)
+    sources = np.repeat(np.arange(size), np.diff(offsets))
+    targets = np.frombuffer(targets, dtype=np.int64)
+
+    parent = np.arange(size)
+
+    while True:
+        source_roots = parent[sources]
+        target_roots = parent[targets]
+
+        pending = source_roots != target_roots
+        if (not pending.any()):
+            break
+
+        source_roots = source_roots[pending]
+        target_roots = target_roots[pending]
+        np.minimum.at(parent, np.maximum(source_roots, target_roots), np.minimum(source_roots, target_roots))
+
+        while True:
+            grandparent = parent[parent]
+            if (np.array_equal(grandparent, parent)):
+                break
+            parent = grandparent
+
+    roots, labels = np.unique(parent, return_inverse=True)
+
+    return len(roots), labels
+
+
+def weakly_connected_components(graph: Graph) -> Tuple[int, "np.ndarray | array"]:
+    """
+    Finds the weakly connected components of a graph, the components when edge directions are ignored, in
+    O((V + E) log V) with numpy and in near linear time without.
+
+    Components are numbered from 0 in order of the smallest slot index they contain. The labels are cached until
+    the graph changes, and while they are, shortest path and traversal queries between different components
+    return without searching.
+
+    Params:
+        graph (Graph): Graph whose components are to be found
+
+    Returns:
+        Tuple[int, np.ndarray | array]: number of components and the component of every slot index, a numpy array
+        if numpy is installed. The labels are shared with the cache and should not be modified
+    """
+    if(not isinstance(graph, Graph)):
+        raise Exception("Graph should be an instance of Graph class")
+
+    cached = _weak_labels.get(graph)
+    if (cached is not None and cached[0] == graph.version):
+        return cached[1], cached[2]
+
+    offsets, targets, _ = graph.csr
+
+    if (np is not None):
+        count, labels = _weak_components_numpy(offsets, targets, graph.graph_size)
+    else:
+        count, labels = _weak_components_python(offsets, targets, graph.graph_size)
+
+    _weak_labels[graph] = (graph.version, count, labels)
+
+    return count, labels
+
+
+def strongly_connected_components(graph: Graph) -> Tuple[int, array]:
+    """
+    Finds the strongly connected components of a graph with an iterative version of Tarjan's algorithm in
+    O(V + E), without recursion so that long paths don't hit the recursion limit.
+
+    Components are numbered from 0 in the order Tarjan's algorithm completes them, which is a reverse
+    topological order: for every edge from u to v, labels[u] >= labels[v]. Hence end can't be reached from start
+    if labels[start] < labels[end]. The labels are cached until the graph changes, and while they are, shortest
+    path and traversal queries use this test to return without searching.
+
+    Params:
+        graph (Graph): Graph whose components are to be found
+
+    Returns:
+        Tuple[int, array]: number of components and the component of every slot index. The labels are shared
+        with the cache and should not be modified
+    """
+    if(not isinstance(graph, Graph)):
+        raise Exception("Graph should be an instance of Graph class")
+
+    cached = _strong_labels.get(graph)
+    if (cached is not None and cached[0] == graph.version):
+        return cached[1], cached[2]
+
+    size = graph.graph_size
+    offsets, targets, _ = graph.csr
+
+    order = size * [-1]
+    low = size * [0]
+    on_stack = bytearray(size)
+    labels = array('q', [-1]) * size
+
+    next_position = list(offsets[:-1])
+    component_stack = []
+    counter = 0
+    count = 0
+
+    for root in range(size):
+        if (order[root] != -1):
+            continue
+
+        order[root] = low[root] = counter
+        counter += 1
+        component_stack.append(root)
+        on_stack[root] = 1
+
+        call_stack = [root]
+
+        while call_stack:
+            vertex = call_stack[-1]
+            position = next_position[vertex]
+
+            if (position < offsets[vertex + 1]):
+                next_position[vertex] = position + 1
+                target = targets[position]
+
+                if (order[target] == -1):
+                    order[target] = low[target] = counter
+                    counter += 1
+                    component_stack.append(target)
+                    on_stack[target] = 1
+                    call_stack.append(target)
+                elif (on_stack[target] and order[target] < low[vertex]):
+                    low[vertex] = order[target]
+                continue
+
+            call_stack.pop()
+
+            if (call_stack and low[vertex] < low[call_stack[-1]]):
+                low[call_stack[-1]] = low[vertex]
+
+            if (low[vertex] == order[vertex]):
+                while True:
+                    member = component_stack.pop()
+                    on_stack[member] = 0
+                    labels[member] = count
+                    if (member == vertex):
+                        break
+                count += 1
+
+    _strong_labels[graph] = (graph.version, count, labels)
+
+    return count, labels
+
+
+def _unreachable(graph: Graph, start_index: int, end_index: int) -> bool:
+    """
+    A helper function to tell in O(1) whether the component labels cached for the current version of a graph
+    prove that end can't be reached from start. Without cached labels nothing is proven.
+
+    Params:
+        graph (Graph): Graph being searched
+        start_index (int): Slot index of the start vertex
+        end_index (int): Slot index of the end vertex
+
+    Returns:
+        bool: True if no path from start to end exists, False if one may exist
+    """
+    cached = _strong_labels.get(graph)
+    if (cached is not None and cached[0] == graph.version and cached[2][start_index] < cached[2][end_index]):
+        return True
+
+    cached = _weak_labels.get(graph)
+    if (cached is not None and cached[0] == graph.version and cached[2][start_index] != cached[2][end_index]):
+        return True
+
+    return False
@@ -0,0 +1,357 @@
+from array import array
+from heapq import heappush, heappop
+from math import inf
+from typing import Tuple, List, Dict
+
+from ..Data import Graph
+from ..Data.Graph import _build_csr
+from .Instrumentation import SearchStats, _instrumented
+from .ShortestPath import _get_index
+from .Components import _unreachable
+
+
+class ContractionHierarchy():
+    """
+    Contraction Hierarchies index for fast point to point shortest path queries on static graphs.
+
+    Vertices are contracted one by one in order of importance. Contracting a vertex v removes it from the
+    remaining graph and inserts a shortcut u -> w for every pair of remaining neighbours whose shortest path
+    runs through v. A query then runs a bidirectional Dijkstra search that only follows edges towards more
+    important vertices, and shortcuts are unpacked into the original vertices of the path. Vertices reached
+    suboptimally through a less important vertex are not expanded (stall-on-demand).
+
+    Shortcuts are only valid for the edges the hierarchy was built with, so queries raise once the graph has
+    changed and the hierarchy has to be built again.
+
+    Protected Variables:
+        _graph (Graph): Graph the hierarchy was built for
+        _version (int): Version of _graph the hierarchy was built at
+        _rank (array[int]): Contraction order of every vertex, indexed by slot index
+        _upward (Tuple[array, array, array]): CSR arrays of the edges v -> w with rank[w] > rank[v]
+        _downward (Tuple[array, array, array]): CSR arrays of the reversed edges u -> v with rank[u] > rank[v],
+            stored at row v
+        _middle (Dict[int, int]): Middle vertex of every shortcut u -> w, keyed by u * graph_size + w
+        _ids (List[int]): Vertex ID of every slot index
+    """
+
+    def __init__(self, graph: Graph, rank: array, upward: Tuple[array, array, array],
+                 downward: Tuple[array, array, array], middle: Dict[int, int]):
+        """
+        Constructor, use ContractionHierarchy.build to create a hierarchy.
+
+        Params:
+            graph (Graph): Graph the hierarchy was built for
+            rank (array[int]): Contraction order of every vertex
+            upward (Tuple[array, array, array]): CSR arrays of the upward edges
+            downward (Tuple[array, array, array]): CSR arrays of the reversed downward edges
+            middle (Dict[int, int]): Middle vertex of every shortcut
+        """
+        self._graph = graph
+        self._version = graph.version
+        self._rank = rank
+        self._upward = upward
+        self._downward = downward
+        self._middle = middle
+        self._ids = graph.vertices
+
+    @staticmethod
+    def build(graph: Graph, max_settled: int = 500) -> "ContractionHierarchy":
+        """
+        Orders the vertices of a graph and contracts them, inserting the necessary shortcuts.
+
+        The next vertex to be contracted is the one with the smallest priority: twice the edge difference
+        (shortcuts added minus edges removed) plus the number of its already contracted neighbours and its
+        depth in the hierarchy. Priorities are updated lazily.
+        Shortcuts are avoided when a witness search finds a path at least as short that avoids the vertex.
+
+        Params:
+            graph (Graph): Graph to be preprocessed, edge weights should be non-negative
+            max_settled (int): Number of vertices a single witness search may settle before giving up, smaller
+                values speed up preprocessing at the cost of unnecessary shortcuts
+
+        Returns:
+            ContractionHierarchy: Hierarchy for the graph
+        """
+        if(not isinstance(graph, Graph)):
+            raise Exception("Graph should be an instance of Graph class")
+
+        size = graph.graph_size
+        offsets, targets, weights = graph.csr
+
+        out_edges: List[Dict[int, float] | None] = [{} for _ in range(size)]
+        in_edges: List[Dict[int, float] | None] = [{} for _ in range(size)]
+
+        for source in range(size):
+            for position in range(offsets[source], offsets[source + 1]):
+                target = targets[position]
+                weight = weights[position]
+
+                if (target != source and weight < out_edges[source].get(target, inf)):
+                    out_edges[source][target] = weight
+                    in_edges[target][source] = weight
+
+        def witness_distances(source: int, excluded: int, max_distance: float) -> Dict[int, float]:
+            distances = {source: 0}
+            queue = [(0, source)]
+            settled = 0
+
+            while queue:
+                current_distance, current = heappop(queue)
+
+                if (current_distance > distances[current]):
+                    continue
+
+                if (current_distance > max_distance or settled == max_settled):
+                    break
+
+                settled += 1
+
+                for target, weight in out_edges[current].items():
+                    if (target == excluded):
+                        continue
+
+                    new_distance = current_distance + weight
+                    if (new_distance < distances.get(target, inf)):
+                        distances[target] = new_distance
+                        heappush(queue, (new_distance, target))
+
+            return distances
+
+        def shortcuts(vertex: int) -> List[Tuple[int, int, float]]:
+            needed = []
+            outgoing = out_edges[vertex]
+
+            if (not outgoing):
+                return needed
+
+            max_outgoing = max(outgoing.values())
+
+            for source, in_weight in in_edges[vertex].items():
+                distances = witness_distances(source, vertex, in_weight + max_outgoing)
+
+                for target, out_weight in outgoing.items():
+                    if (target != source and distances.get(target, inf) > in_weight + out_weight):
+                        needed.append((source, target, in_weight + out_weight))
+
+            return needed
+
+        contracted_neighbours = size * [0]
+        levels = size * [0]
+
+        def priority(vertex: int, needed: List[Tuple[int, int, float]]) -> int:
+            return (2 * (len(needed) - len(in_edges[vertex]) - len(out_edges[vertex]))
+                    + contracted_neighbours[vertex] + levels[vertex])
+
+        queue = [(priority(vertex, shortcuts(vertex)), vertex) for vertex in range(size)]
+        queue.sort()
+
+        rank = array('q', bytes(8 * size))
+        middle: Dict[int, int] = {}
+
+        up_sources, up_targets, up_weights = array('q'), array('q'), array('d')
+        down_sources, down_targets, down_weights = array('q'), array('q'), array('d')
+
+        order = 0
+        while queue:
+            _, vertex = heappop(queue)
+
+            added = shortcuts(vertex)
+
+            current_priority = priority(vertex, added)
+            if (queue and current_priority > queue[0][0]):
+                heappush(queue, (current_priority, vertex))
+                continue
+
+            rank[vertex] = order
+            order += 1
+
+            for target, weight in out_edges[vertex].items():
+                up_sources.append(vertex)
+                up_targets.append(target)
+                up_weights.append(weight)
+
+                del in_edges[target][vertex]
+                contracted_neighbours[target] += 1
+                levels[target] = max(levels[target], levels[vertex] + 1)
+
+            for source, weight in in_edges[vertex].items():
+                down_sources.append(vertex)
+                down_targets.append(source)
+                down_weights.append(weight)
+
+                del out_edges[source][vertex]
+                contracted_neighbours[source] += 1
+                levels[source] = max(levels[source], levels[vertex] + 1)
+
+            for source, target, weight in added:
+                if (weight < out_edges[source].get(target, inf)):
+                    out_edges[source][target] = weight
+                    in_edges[target][source] = weight
+                    middle[source * size + target] = vertex
+
+            out_edges[vertex] = None
+            in_edges[vertex] = None
+
+        upward = _build_csr(size, up_sources, up_targets, up_weights)
+        downward = _build_csr(size, down_sources, down_targets, down_weights)
+
+        return ContractionHierarchy(graph, rank, upward, downward, middle)
+
+    @property
+    def num_shortcuts(self) -> int:
+        """
+        Retrieves the number of shortcuts inserted during contraction.
+
+        Returns:
+            int: Number of shortcuts in the hierarchy
+        """
+        return len(self._middle)
+
+    @_instrumented
+    def query(self, start: int, end: int, stats: SearchStats | None = None) -> Tuple[Tuple[int], float]:
+        """
+        Finds the shortest path from start vertex to end vertex.
+
+        Params:
+            start (int): id of the start vertex
+            end (int): id of the end vertex
+            stats (SearchStats): Optional counters to be filled in by the search, settled counts both sides
+
+        Raises:
+            Exception: If the graph has changed since the hierarchy was built
+
+        Returns:
+            Tuple[Tuple[int], float]: path from start vertex to end vertex and its length,
+            an empty path and inf if end is unreachable
+        """
+        if (self._graph.version != self._version):
+            raise Exception("Contraction hierarchy is out of date, the graph has changed since it was built")
+
+        start_index = _get_index(self._graph, start)
+        end_index = _get_index(self._graph, end)
+
+        if (start_index == end_index):
+            return (start,), 0
+
+        if (_unreachable(self._graph, start_index, end_index)):
+            return tuple(), inf
+
+        if (stats is not None):
+            stats.lap("prepare")
+
+        csrs = (self._upward, self._downward)
+        distances = ({start_index: 0}, {end_index: 0})
+        parents = ({start_index: -1}, {end_index: -1})
+        settled = (set(), set())
+        queues = ([(0, start_index)], [(0, end_index)])
+
+        best_distance = inf
+        meeting_index = -1
+
+        side = 1
+        while True:
+            if (queues[1 - side] and queues[1 - side][0][0] < best_distance):
+                side = 1 - side
+            elif (not (queues[side] and queues[side][0][0] < best_distance)):
+                break
+
+            current_distance, current_index = heappop(queues[side])
+
+            if (current_index in settled[side]):
+                if (stats is not None):
+                    stats.pops += 1
+                continue
+
+            settled[side].add(current_index)
+
+            if (stats is not None):
+                stats.settled += 1
+                stats.pops += 1
+
+            other_distance = distances[1 - side].get(current_index, inf)
+            if (current_distance + other_distance < best_distance):
+                best_distance = current_distance + other_distance
+                meeting_index = current_index
+
+            side_distances = distances[side]
+
+            offsets, targets, weights = csrs[1 - side]
+            stalled = False
+            for position in range(offsets[current_index], offsets[current_index + 1]):
+                if (side_distances.get(targets[position], inf) + weights[position] < current_distance):
+                    stalled = True
+                    break
+
+            if (stalled):
+                continue
+
+            offsets, targets, weights = csrs[side]
+
+            if (stats is not None):
+                stats.relaxed += offsets[current_index + 1] - offsets[current_index]
+
+            for position in range(offsets[current_index], offsets[current_index + 1]):
+                target = targets[position]
+                new_distance = current_distance + weights[position]
+
+                if (new_distance < side_distances.get(target, inf)):
+                    side_distances[target] = new_distance
+                    parents[side][target] = current_index
+                    heappush(queues[side], (new_distance, target))
+
+        if (stats is not None):
+            stats.pushes = stats.pops + len(queues[0]) + len(queues[1])
+            stats.lap("search")
+
+        if (meeting_index == -1):
+            return tuple(), inf
+
+        hierarchy_path = []
+        temp = meeting_index
+        while (temp != -1):
+            hierarchy_path.append(temp)
+            temp = parents[0][temp]
+        hierarchy_path.reverse()
+
+        temp = parents[1][meeting_index]
+        while (temp != -1):
+            hierarchy_path.append(temp)
+            temp = parents[1][temp]
+
+        path = self._unpack(hierarchy_path)
+
+        if (stats is not None):
+            stats.lap("path")
+
+        return path, best_distance
+
+    def _unpack(self, hierarchy_path: List[int]) -> Tuple[int]:
+        """
+        A helper function to replace the shortcuts of a path by the original edges they stand for.
+
+        Params:
+            hierarchy_path (List[int]): Slot indices of a path in the hierarchy
+
+        Returns:
+            Tuple[int]: path of vertex IDs in the original graph
+        """
+        size = self._graph.graph_size
+        ids = self._ids
+        middle = self._middle
+
+        path = [ids[hierarchy_path[0]]]
+
+        for i in range(len(hierarchy_path) - 1):
+            stack = [(hierarchy_path[i], hierarchy_path[i + 1])]
+
+            while stack:
+                source, target = stack.pop()
+                middle_index = middle.get(source * size + target)
+
+                if (middle_index is None):
+                    path.append(ids[target])
+                else:
+                    stack.append((middle_index, target))
+                    stack.append((source, middle_index))
+
+        return tuple(path)
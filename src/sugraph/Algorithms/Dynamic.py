@@ -0,0 +1,208 @@
+from heapq import heappush, heappop
+from math import inf
+from typing import Tuple, List, Dict
+
+from ..Data import Graph
+from .ShortestPath import _get_index, _reconstruct_path, _shortest_path_tree
+
+
+class DynamicShortestPaths():
+    """
+    Shortest path trees of a changing graph, kept up to date across edge additions and weight changes.
+
+    Trees are computed on first use of a source. When the graph changes, every cached tree is repaired from
+    the edge changes reported by graph.changes_since instead of being recomputed, in the manner of
+    Ramalingam and Reps: vertices whose tree path used an edge that got heavier are detached and re-attached
+    through their in-edges, then the edges that got lighter or were added are relaxed, and in both cases a
+    Dijkstra search only propagates through the vertices whose distance changes. If the graph no longer
+    knows its changes, the trees are recomputed on next use.
+
+    Edge weights should be non-negative.
+
+    Protected Variables:
+        _graph (Graph): Graph the trees are computed for
+        _trees (Dict[int, Tuple[List[float], List[int]]]): Distance and parent slot index of every vertex,
+            keyed by the slot index of the source
+        _version (int): Version of _graph the trees are valid for
+    """
+
+    def __init__(self, graph: Graph):
+        """
+        Constructor
+
+        Params:
+            graph (Graph): Graph to compute shortest paths on
+        """
+        if(not isinstance(graph, Graph)):
+            raise Exception("Graph should be an instance of Graph class")
+
+        self._graph = graph
+        self._trees: Dict[int, Tuple[List[float], List[int]]] = {}
+        self._version = graph.version
+
+    @property
+    def version(self) -> int:
+        """
+        Retrieves the version of the graph the cached trees were last brought up to date with.
+
+        Returns:
+            int: Version of graph, smaller than graph.version if the graph changed since the last query
+        """
+        return self._version
+
+    def tree(self, source: int) -> Tuple[List[float], List[int]]:
+        """
+        Retrieves the shortest path tree of a source vertex for the current graph.
+
+        Params:
+            source (int): id of the source vertex
+
+        Returns:
+            Tuple[List[float], List[int]]: distance from the source and parent slot index of every slot index,
+            inf and -1 for unreachable vertices. The lists are owned by the cache and updated in place
+        """
+        self._synchronize()
+
+        source_index = _get_index(self._graph, source)
+
+        if (source_index not in self._trees):
+            self._trees[source_index] = _shortest_path_tree(*self._graph.csr, self._graph.graph_size, source_index)
+
+        return self._trees[source_index]
+
+    def query(self, start: int, end: int) -> Tuple[Tuple[int], float]:
+        """
+        Finds the shortest path from start vertex to end vertex from the cached tree of start vertex.
+
+        Params:
+            start (int): id of the start vertex
+            end (int): id of the end vertex
+
+        Returns:
+            Tuple[Tuple[int], float]: path from start vertex to end vertex and its length,
+            an empty path and inf if end is unreachable
+        """
+        distances, parents = self.tree(start)
+        end_index = _get_index(self._graph, end)
+
+        if (distances[end_index] == inf):
+            return tuple(), inf
+
+        return _reconstruct_path(self._graph, parents, self._graph.get_vertex_index(start), end_index), \
+            distances[end_index]
+
+    def discard(self, source: int) -> None:
+        """
+        Drops the cached tree of a source vertex.
+
+        Params:
+            source (int): id of the source vertex
+        """
+        self._trees.pop(self._graph.get_vertex_index(source), None)
+
+    def _synchronize(self) -> None:
+        """
+        A helper function to bring every cached tree up to date with the current version of the graph.
+        """
+        graph = self._graph
+
+        if (self._version == graph.version):
+            return
+
+        changes = graph.changes_since(self._version)
+        self._version = graph.version
+
+        if (changes is None):
+            self._trees.clear()
+            return
+
+        net_changes: Dict[Tuple[int, int], List[float]] = {}
+        for source_index, target_index, old_weight, new_weight in changes:
+            change = net_changes.setdefault((source_index, target_index), [old_weight, new_weight])
+            change[1] = new_weight
+
+        increases = [edge for edge, (old_weight, new_weight) in net_changes.items() if new_weight > old_weight]
+        decreases = [(edge, new_weight) for edge, (old_weight, new_weight) in net_changes.items()
+                     if new_weight < old_weight]
+
+        for distances, parents in self._trees.values():
+            self._repair(distances, parents, increases, decreases)
+
+    def _repair(self, distances: List[float], parents: List[int],
+                increases: List[Tuple[int, int]], decreases: List[Tuple[Tuple[int, int], float]]) -> None:
+        """
+        A helper function to update one shortest path tree in place after edge weight changes.
+
+        Params:
+            distances (List[float]): Distances of the tree before the changes
+            parents (List[int]): Parents of the tree before the changes
+            increases (List[Tuple[int, int]]): (source index, target index) of the edges that got heavier
+            decreases (List[Tuple[Tuple[int, int], float]]): (source index, target index) and new weight of the
+                edges that got lighter or were added
+        """
+        graph = self._graph
+        size = graph.graph_size
+        offsets, targets, weights = graph.csr
+
+        if (len(distances) < size):
+            distances.extend((size - len(distances)) * [inf])
+            parents.extend((size - len(parents)) * [-1])
+
+        queue = []
+
+        detached = [target for source, target in increases if parents[target] == source]
+
+        if (detached):
+            children: List[List[int]] = [[] for _ in range(size)]
+            for vertex in range(size):
+                if (parents[vertex] != -1):
+                    children[parents[vertex]].append(vertex)
+
+            affected = set()
+            stack = detached
+            while stack:
+                vertex = stack.pop()
+                if (vertex not in affected):
+                    affected.add(vertex)
+                    stack.extend(children[vertex])
+
+            for vertex in affected:
+                distances[vertex] = inf
+                parents[vertex] = -1
+
+            reverse_offsets, sources, reverse_weights = graph.reverse_csr
+
+            for vertex in affected:
+                for position in range(reverse_offsets[vertex], reverse_offsets[vertex + 1]):
+                    source = sources[position]
+                    new_distance = distances[source] + reverse_weights[position]
+
+                    if (new_distance < distances[vertex]):
+                        distances[vertex] = new_distance
+                        parents[vertex] = source
+
+                if (distances[vertex] < inf):
+                    heappush(queue, (distances[vertex], vertex))
+
+        for (source, target), weight in decreases:
+            new_distance = distances[source] + weight
+
+            if (new_distance < distances[target]):
+                distances[target] = new_distance
+                parents[target] = source
+                heappush(queue, (new_distance, target))
+
+        while queue:
+            current_distance, current_index = heappop(queue)
+
+            if (current_distance > distances[current_index]):
+                continue
+
+            for position in range(offsets[current_index], offsets[current_index + 1]):
+                target = targets[position]
+                new_distance = current_distance + weights[position]
+
+                if (new_distance < distances[target]):
+                    distances[target] = new_distance
+                    parents[target] = current_index
+                    heappush(queue, (new_distance, target))
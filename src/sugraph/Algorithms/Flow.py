@@ -1,58 +1,580 @@
-from typing import Tuple
-from src.sugraph.Data import Graph
-from math import inf
-from Traversal import DFS
+import dataclasses
+from typing import Tuple, Dict, List, Set
+from array import array
+from collections import deque
+from ..Data import Graph
+from .Instrumentation import SearchStats, _instrumented
 
-def fordfulkerson(graph:Graph,start,end):
+def fordfulkerson(graph:Graph,start,end,stats:SearchStats|None=None):
     """
     Ford-Fulkerson Algorithm for finding Max Flow for integer capacities
 
+    Augmenting paths are searched on the sparse residual graph, only the returned flow matrix is dense, use
+    max_flow for large graphs.
+
     Args:
         graph(Graph): A weighted graph whose weights will be considered as capacities.
+        stats(SearchStats): Optional counters to be filled in, see max_flow
 
     Returns:
-        Tuple[Tuple[Tuple[float]],int] : Flow matrix and max flow value
+        Tuple[Tuple[Tuple[float]],int] : Net flow matrix indexed by slot index and max flow value
     """
-
-    capacities=graph.adjacency_matrix
+    result = max_flow(graph, start, end, "fordfulkerson", stats)
 
     flow_matrix=[[0]*graph.graph_size for _ in range(graph.graph_size)]
-    residual_graph=capacities.copy()
 
+    offsets, targets, _ = graph.csr
+
+    for source in range(graph.graph_size):
+        for position in range(offsets[source], offsets[source + 1]):
+            target = targets[position]
+
+            flow_matrix[source][target] += result.flow[position]
+            flow_matrix[target][source] -= result.flow[position]
+
+    return flow_matrix,result.value
+
+
+class ResidualGraph():
+    """
+    Residual network of a graph whose edge weights are capacities, stored as adjacency lists of edge ids.
+
+    Every edge of the graph at position p of its CSR arrays becomes the residual edge 2p, its reverse edge is
+    2p + 1, so the reverse of residual edge e is always e ^ 1 and the capacity left on edge 2p + 1 is the flow
+    on edge p. The residual edges leaving the vertex at slot
+    index u are adjacency[adjacency_offsets[u]:adjacency_offsets[u + 1]].
+
+    Attributes:
+        size (int): Number of vertices
+        head (array[int]): Slot index of the vertex every residual edge points to
+        capacity (array[float]): Remaining capacity of every residual edge
+        adjacency_offsets (array[int]): Start of the residual edge range of every vertex
+        adjacency (array[int]): Residual edge ids grouped by tail vertex
+    """
+
+    def __init__(self, graph: Graph):
+        """
+        Constructor, builds the residual network of a graph with zero flow in O(V + E).
+
+        Params:
+            graph (Graph): Graph whose edge weights are the capacities
+        """
+        offsets, targets, weights = graph.csr
+
+        self.size = graph.graph_size
+        num_edges = len(targets)
+
+        head = array('q', bytes(16 * num_edges))
+        capacity = array('d', bytes(16 * num_edges))
+        degrees = array('q', bytes(8 * (self.size + 1)))
+
+        for source in range(self.size):
+            for position in range(offsets[source], offsets[source + 1]):
+                target = targets[position]
+
+                head[2 * position] = target
+                head[2 * position + 1] = source
+                capacity[2 * position] = max(weights[position], 0)
+
+                degrees[source + 1] += 1
+                degrees[target + 1] += 1
+
+        for i in range(self.size):
+            degrees[i + 1] += degrees[i]
+
+        cursor = array('q', degrees)
+        adjacency = array('q', bytes(16 * num_edges))
+
+        for edge in range(2 * num_edges):
+            tail = head[edge ^ 1]
+            adjacency[cursor[tail]] = edge
+            cursor[tail] += 1
+
+        self.head = head
+        self.capacity = capacity
+        self.adjacency_offsets = degrees
+        self.adjacency = adjacency
+
+    def levels(self, source: int) -> List[int]:
+        """
+        Runs BFS from a vertex over residual edges with remaining capacity.
+
+        Params:
+            source (int): Slot index of the start vertex
+
+        Returns:
+            List[int]: number of residual edges from source to every vertex, -1 if unreachable
+        """
+        head = self.head
+        capacity = self.capacity
+        adjacency = self.adjacency
+        adjacency_offsets = self.adjacency_offsets
+
+        level = self.size * [-1]
+        level[source] = 0
+
+        queue = deque([source])
+
+        while queue:
+            vertex = queue.popleft()
+            next_level = level[vertex] + 1
+
+            for position in range(adjacency_offsets[vertex], adjacency_offsets[vertex + 1]):
+                edge = adjacency[position]
+                target = head[edge]
+
+                if (capacity[edge] > 0 and level[target] == -1):
+                    level[target] = next_level
+                    queue.append(target)
+
+        return level
+
+
+def _fordfulkerson(residual: ResidualGraph, source: int, sink: int, stats: SearchStats | None = None) -> float:
+    """
+    A helper function running Ford-Fulkerson with DFS augmenting paths on a residual graph in place.
+
+    Params:
+        residual (ResidualGraph): Residual graph to be augmented
+        source (int): Slot index of the source vertex
+        sink (int): Slot index of the sink vertex
+        stats (SearchStats): Optional counters to be filled in, pushes and pops count the DFS stack
+
+    Returns:
+        float: value of the maximum flow
+    """
+    head = residual.head
+    capacity = residual.capacity
+    adjacency = residual.adjacency
+    adjacency_offsets = residual.adjacency_offsets
+
+    max_flow = 0
+
+    while True:
+        parent_edge = residual.size * [-1]
+        visited = residual.size * [False]
+        visited[source] = True
+
+        stack = [source]
+
+        while stack and not visited[sink]:
+            vertex = stack.pop()
+
+            if (stats is not None):
+                stats.pops += 1
+                stats.relaxed += adjacency_offsets[vertex + 1] - adjacency_offsets[vertex]
+
+            for position in range(adjacency_offsets[vertex], adjacency_offsets[vertex + 1]):
+                edge = adjacency[position]
+                target = head[edge]
+
+                if (capacity[edge] > 0 and not visited[target]):
+                    visited[target] = True
+                    parent_edge[target] = edge
+                    stack.append(target)
+
+        if (stats is not None):
+            stats.pushes += len(stack)
+
+        if (not visited[sink]):
+            if (stats is not None):
+                stats.pushes += stats.pops
+            return max_flow
+
+        path = []
+        vertex = sink
+        while (vertex != source):
+            path.append(parent_edge[vertex])
+            vertex = head[parent_edge[vertex] ^ 1]
+
+        bottleneck = min(capacity[edge] for edge in path)
+
+        for edge in path:
+            capacity[edge] -= bottleneck
+            capacity[edge ^ 1] += bottleneck
+
+        max_flow += bottleneck
+
+        if (stats is not None):
+            stats.augmenting_paths += 1
+
+
+def _dinic(residual: ResidualGraph, source: int, sink: int, stats: SearchStats | None = None) -> float:
+    """
+    A helper function running Dinic's algorithm on a residual graph in place.
+
+    Params:
+        residual (ResidualGraph): Residual graph to be augmented
+        source (int): Slot index of the source vertex
+        sink (int): Slot index of the sink vertex
+        stats (SearchStats): Optional counters to be filled in, the level graph searches are timed as the
+            "levels" phase and the blocking flows as "search"
+
+    Returns:
+        float: value of the maximum flow
+    """
+    head = residual.head
+    capacity = residual.capacity
+    adjacency = residual.adjacency
+    adjacency_offsets = residual.adjacency_offsets
+
+    max_flow = 0
+
+    while True:
+        level = residual.levels(source)
+
+        if (stats is not None):
+            stats.lap("levels")
+
+        if (level[sink] == -1):
+            return max_flow
+
+        current_arc = list(adjacency_offsets[:-1])
+        path: List[int] = []
+        vertex = source
+
+        while True:
+            if (vertex == sink):
+                bottleneck = min(capacity[edge] for edge in path)
+
+                for edge in path:
+                    capacity[edge] -= bottleneck
+                    capacity[edge ^ 1] += bottleneck
+
+                max_flow += bottleneck
+
+                if (stats is not None):
+                    stats.augmenting_paths += 1
+
+                saturated = next(i for i, edge in enumerate(path) if capacity[edge] == 0)
+                del path[saturated:]
+                vertex = head[path[-1]] if path else source
+                continue
+
+            end = adjacency_offsets[vertex + 1]
+            position = current_arc[vertex]
+
+            while (position < end):
+                edge = adjacency[position]
+                if (capacity[edge] > 0 and level[head[edge]] == level[vertex] + 1):
+                    break
+                position += 1
+
+            current_arc[vertex] = position
+
+            if (position < end):
+                edge = adjacency[position]
+                path.append(edge)
+                vertex = head[edge]
+                continue
+
+            if (vertex == source):
+                if (stats is not None):
+                    stats.lap("search")
+                break
+
+            level[vertex] = -1
+            edge = path.pop()
+            vertex = head[edge ^ 1]
+            current_arc[vertex] += 1
+
+
+def _push_relabel(residual: ResidualGraph, source: int, sink: int, stats: SearchStats | None = None) -> float:
+    """
+    A helper function running highest-label push-relabel with the gap heuristic on a residual graph in place.
+
+    Params:
+        residual (ResidualGraph): Residual graph to be augmented
+        source (int): Slot index of the source vertex
+        sink (int): Slot index of the sink vertex
+        stats (SearchStats): Optional counters to be filled in, pushes and pops count the buckets of active
+            vertices
+
+    Returns:
+        float: value of the maximum flow
+    """
+    head = residual.head
+    capacity = residual.capacity
+    adjacency = residual.adjacency
+    adjacency_offsets = residual.adjacency_offsets
+
+    size = residual.size
+    max_height = 2 * size
+
+    height = size * [0]
+    height[source] = size
+
+    excess = size * [0]
+    count = (max_height + 2) * [0]
+    count[0] = size - 1
+    count[size] += 1
+
+    buckets: List[List[int]] = [[] for _ in range(max_height + 2)]
+    queued = size * [False]
+    highest = 0
+
+    for position in range(adjacency_offsets[source], adjacency_offsets[source + 1]):
+        edge = adjacency[position]
+        pushed = capacity[edge]
+
+        if (pushed > 0):
+            target = head[edge]
+            capacity[edge] = 0
+            capacity[edge ^ 1] += pushed
+            excess[target] += pushed
+            excess[source] -= pushed
+
+            if (target != sink and target != source and not queued[target]):
+                queued[target] = True
+                buckets[0].append(target)
+
+    current_arc = list(adjacency_offsets[:-1])
+
+    while highest >= 0:
+        if (not buckets[highest]):
+            highest -= 1
+            continue
+
+        vertex = buckets[highest].pop()
+
+        if (stats is not None):
+            stats.pops += 1
+
+        if (height[vertex] != highest):
+            buckets[height[vertex]].append(vertex)
+            highest = max(highest, height[vertex])
+            continue
+
+        queued[vertex] = False
+
+        while excess[vertex] > 0:
+            position = current_arc[vertex]
+
+            if (position == adjacency_offsets[vertex + 1]):
+                old_height = height[vertex]
+
+                new_height = max_height
+                for position in range(adjacency_offsets[vertex], adjacency_offsets[vertex + 1]):
+                    edge = adjacency[position]
+                    if (capacity[edge] > 0 and height[head[edge]] + 1 < new_height):
+                        new_height = height[head[edge]] + 1
+
+                count[old_height] -= 1
+
+                if (count[old_height] == 0 and old_height < size):
+                    for other in range(size):
+                        if (old_height < height[other] < size):
+                            count[height[other]] -= 1
+                            height[other] = size + 1
+                            count[size + 1] += 1
+                    new_height = max(new_height, size + 1)
+
+                height[vertex] = new_height
+                count[new_height] += 1
+                current_arc[vertex] = adjacency_offsets[vertex]
+
+                if (new_height >= max_height):
+                    break
+                continue
+
+            edge = adjacency[position]
+            target = head[edge]
+
+            if (capacity[edge] > 0 and height[vertex] == height[target] + 1):
+                pushed = min(excess[vertex], capacity[edge])
+
+                capacity[edge] -= pushed
+                capacity[edge ^ 1] += pushed
+                excess[vertex] -= pushed
+                excess[target] += pushed
+
+                if (target != sink and target != source and not queued[target]):
+                    queued[target] = True
+                    buckets[height[target]].append(target)
+                    highest = max(highest, height[target])
+            else:
+                current_arc[vertex] += 1
+
+    if (stats is not None):
+        stats.pushes += stats.pops
+
+    return excess[sink]
+
+
+@dataclasses.dataclass
+class FlowResult():
+    """
+    Maximum flow of a graph, stored per edge in O(V + E) memory.
+
+    Attributes:
+        graph (Graph): Graph whose edge weights are the capacities
+        value (float): Value of the maximum flow
+        flow (array[float]): Flow on every edge, aligned with the CSR arrays and the order of graph.edges
+        residual (ResidualGraph): Residual graph left by the computation
+    """
+    graph: Graph
+    value: float
+    flow: array
+    residual: ResidualGraph
+
+    def edge_flows(self) -> Dict[Tuple[int, int], float]:
+        """
+        Collects the flow between every pair of vertices carrying positive flow, parallel edges are summed.
+
+        Returns:
+            Dict[Tuple[int, int], float]: flow of every (source id, target id) pair carrying positive flow
+        """
+        offsets, targets, _ = self.graph.csr
+        ids = self.graph.vertices
+        flow = self.flow
+
+        flows: Dict[Tuple[int, int], float] = {}
+
+        for source in range(self.graph.graph_size):
+            for position in range(offsets[source], offsets[source + 1]):
+                if (flow[position] > 0):
+                    key = (ids[source], ids[targets[position]])
+                    flows[key] = flows.get(key, 0) + flow[position]
+
+        return flows
+
+    def min_cut(self, start: int) -> Tuple[Set[int], List[Tuple[int, int, float]]]:
+        """
+        Finds the minimum cut on the start side, the vertices still reachable from start in the residual graph.
+
+        Params:
+            start (int): id of the source vertex of the flow
 
-    max_flow=0
+        Returns:
+            Tuple[Set[int], List[Tuple[int, int, float]]] : ids of the vertices on the start side of the cut and
+            the edges crossing the cut with their capacities
+        """
+        level = self.residual.levels(self.graph.get_vertex_index(start))
 
-    path=DFS(residual_graph,start,end)
+        offsets, targets, weights = self.graph.csr
+        ids = self.graph.vertices
 
-    while path:
-        min_capacity=inf
-        for i in range(len(path)-1):
-            source=path[i]
-            target=path[i+1]
+        cut_edges = []
+        for source in range(self.graph.graph_size):
+            if (level[source] == -1):
+                continue
 
-            if(residual_graph[source-1][target-1]<min_capacity):
-                min_capacity=residual_graph[source-1][target-1]
+            for position in range(offsets[source], offsets[source + 1]):
+                if (level[targets[position]] == -1):
+                    cut_edges.append((ids[source], ids[targets[position]], weights[position]))
 
+        return {ids[vertex] for vertex in range(self.graph.graph_size) if level[vertex] != -1}, cut_edges
 
 
-        for i in range(len(path)-1):
-            source=path[i]
-            target=path[i+1]
+_METHODS = {"fordfulkerson": _fordfulkerson, "dinic": _dinic, "push_relabel": _push_relabel}
 
-            residual_graph[source-1][target-1]=residual_graph[source-1][target-1]-min_capacity
-            residual_graph[target-1][source-1]=residual_graph[target-1][source-1]+min_capacity
 
+@_instrumented
+def max_flow(graph: Graph, start: int, end: int, method: str = "dinic",
+             stats: SearchStats | None = None) -> FlowResult:
+    """
+    Computes a maximum flow from start to end without any V x V structure.
+
+    Args:
+        graph(Graph): A weighted graph whose weights will be considered as capacities.
+        start(int): id of the source vertex
+        end(int): id of the sink vertex
+        method(str): "dinic", "push_relabel" or "fordfulkerson"
+        stats(SearchStats): Optional counters to be filled in, "prepare" covers building the residual graph
+
+    Raises:
+        Exception: If method is unknown or start and end are missing or equal
+
+    Returns:
+        FlowResult : value of the flow and flow on every edge
+    """
+    if(not isinstance(graph, Graph)):
+        raise Exception("Graph should be an instance of Graph class")
+
+    if (method not in _METHODS):
+        raise Exception("method Should be one of \"dinic\", \"push_relabel\" or \"fordfulkerson\"")
+
+    source = graph.get_vertex_index(start)
+    sink = graph.get_vertex_index(end)
+
+    if (source is None or sink is None):
+        raise Exception("An End Point of Vertex Doesn't Exist in Vertex Set")
+
+    if (source == sink):
+        raise Exception("Start and end vertices of a flow should be different")
+
+    residual = ResidualGraph(graph)
+
+    if (stats is not None):
+        stats.lap("prepare")
+
+    value = _METHODS[method](residual, source, sink, stats)
+
+    if (stats is not None):
+        stats.lap("search")
+
+    return FlowResult(graph, value, residual.capacity[1::2], residual)
+
+
+def dinic(graph: Graph, start: int, end: int,
+          stats: SearchStats | None = None) -> Tuple[Dict[Tuple[int, int], float], float]:
+    """
+    Dinic's Algorithm for finding Max Flow, in O(V^2 E) independent of the capacity values.
 
-            flow_matrix[source-1][target-1]=flow_matrix[source-1][target-1] + min_capacity
-            flow_matrix[target-1][source-1]=-flow_matrix[source-1][target-1]
+    Every phase builds the BFS level graph of the residual network and saturates it with a blocking flow found
+    by DFS with current-arc pointers.
+
+    Args:
+        graph(Graph): A weighted graph whose weights will be considered as capacities.
+        start(int): id of the source vertex
+        end(int): id of the sink vertex
+        stats(SearchStats): Optional counters to be filled in, see max_flow
+
+    Returns:
+        Tuple[Dict[Tuple[int, int], float], float] : flow of every edge carrying flow and max flow value
+    """
+    result = max_flow(graph, start, end, "dinic", stats)
+    return result.edge_flows(), result.value
+
+
+def push_relabel(graph: Graph, start: int, end: int,
+                 stats: SearchStats | None = None) -> Tuple[Dict[Tuple[int, int], float], float]:
+    """
+    Highest-label Push-Relabel Algorithm with the gap heuristic for finding Max Flow, in O(V^2 sqrt(E)).
+
+    Args:
+        graph(Graph): A weighted graph whose weights will be considered as capacities.
+        start(int): id of the source vertex
+        end(int): id of the sink vertex
+        stats(SearchStats): Optional counters to be filled in, see max_flow
+
+    Returns:
+        Tuple[Dict[Tuple[int, int], float], float] : flow of every edge carrying flow and max flow value
+    """
+    result = max_flow(graph, start, end, "push_relabel", stats)
+    return result.edge_flows(), result.value
 
-        max_flow+=min_capacity
 
-        path=DFS(residual_graph,start,end)
+def min_cut(graph: Graph, start: int, end: int, method: str = "dinic",
+            stats: SearchStats | None = None) -> Tuple[Set[int], List[Tuple[int, int, float]], float]:
+    """
+    Finds a minimum start-end cut, whose capacity equals the max flow value.
 
+    Args:
+        graph(Graph): A weighted graph whose weights will be considered as capacities.
+        start(int): id of the source vertex
+        end(int): id of the sink vertex
+        method(str): "dinic", "push_relabel" or "fordfulkerson"
+        stats(SearchStats): Optional counters to be filled in, see max_flow
 
+    Returns:
+        Tuple[Set[int], List[Tuple[int, int, float]], float] : ids of the vertices on the start side of the cut,
+        the edges crossing the cut with their capacities and the capacity of the cut
+    """
+    result = max_flow(graph, start, end, method, stats)
+    source_side, cut_edges = result.min_cut(start)
 
-    return flow_matrix,max_flow
+    return source_side, cut_edges, result.value
 
 
 if __name__=="__main__":
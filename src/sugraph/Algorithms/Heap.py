@@ -0,0 +1,141 @@
+from typing import List, Tuple
+
+
+class IndexedHeap():
+    """
+    Binary min-heap over the integer keys 0..capacity-1 supporting decrease-key.
+
+    Every key is present at most once, its position inside the heap is tracked so that its priority can be
+    lowered in O(log n) instead of pushing a duplicate entry.
+
+    Protected Variables:
+        _heap (List[int]): Keys in heap order
+        _priorities (List[float]): Priority of every key, indexed by key
+        _positions (List[int]): Position of every key inside _heap, -1 if the key is not in the heap
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Constructor
+
+        Params:
+            capacity (int): Number of distinct keys the heap can hold, keys are in range(capacity)
+        """
+        self._heap: List[int] = []
+        self._priorities: List[float] = [0.0] * capacity
+        self._positions: List[int] = [-1] * capacity
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: int) -> bool:
+        return self._positions[key] != -1
+
+    def push(self, key: int, priority: float) -> None:
+        """
+        Inserts a key, or updates its priority if it is already in the heap.
+
+        Params:
+            key (int): Key to be inserted
+            priority (float): Priority of the key, smaller priorities are popped first
+        """
+        position = self._positions[key]
+
+        if (position == -1):
+            self._heap.append(key)
+            self._positions[key] = len(self._heap) - 1
+            self._priorities[key] = priority
+            self._sift_up(len(self._heap) - 1)
+
+        elif (priority < self._priorities[key]):
+            self._priorities[key] = priority
+            self._sift_up(position)
+
+        else:
+            self._priorities[key] = priority
+            self._sift_down(position)
+
+    def decrease_key(self, key: int, priority: float) -> None:
+        """
+        Lowers the priority of a key already in the heap.
+
+        Params:
+            key (int): Key to be updated
+            priority (float): New priority, should not be larger than the current one
+        """
+        self._priorities[key] = priority
+        self._sift_up(self._positions[key])
+
+    def pop(self) -> Tuple[int, float]:
+        """
+        Removes the key with the smallest priority.
+
+        Returns:
+            Tuple[int, float]: The key and its priority
+
+        Raises:
+            IndexError: If the heap is empty
+        """
+        heap = self._heap
+        top = heap[0]
+        last = heap.pop()
+
+        self._positions[top] = -1
+
+        if (heap):
+            heap[0] = last
+            self._positions[last] = 0
+            self._sift_down(0)
+
+        return top, self._priorities[top]
+
+    def _sift_up(self, position: int) -> None:
+        heap = self._heap
+        priorities = self._priorities
+        positions = self._positions
+
+        key = heap[position]
+        priority = priorities[key]
+
+        while (position > 0):
+            parent_position = (position - 1) >> 1
+            parent = heap[parent_position]
+
+            if (priorities[parent] <= priority):
+                break
+
+            heap[position] = parent
+            positions[parent] = position
+            position = parent_position
+
+        heap[position] = key
+        positions[key] = position
+
+    def _sift_down(self, position: int) -> None:
+        heap = self._heap
+        priorities = self._priorities
+        positions = self._positions
+
+        size = len(heap)
+        key = heap[position]
+        priority = priorities[key]
+
+        while (True):
+            child_position = 2 * position + 1
+            if (child_position >= size):
+                break
+
+            right_position = child_position + 1
+            if (right_position < size and priorities[heap[right_position]] < priorities[heap[child_position]]):
+                child_position = right_position
+
+            child = heap[child_position]
+            if (priority <= priorities[child]):
+                break
+
+            heap[position] = child
+            positions[child] = position
+            position = child_position
+
+        heap[position] = key
+        positions[key] = position
@@ -0,0 +1,176 @@
+import dataclasses
+import functools
+import inspect
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+@dataclasses.dataclass
+class SearchStats():
+    """
+    Counters and phase timings filled in by an algorithm when passed as its stats argument, or when it runs inside
+    an instrument block. Counters an algorithm has no use for stay 0.
+
+    Attributes:
+        settled (int): Number of vertices whose distance or level became final
+        relaxed (int): Number of edges examined
+        pushes (int): Number of entries inserted into the queue, heap or stack of the search, including
+            decrease-key updates of an indexed heap
+        pops (int): Number of entries removed from it, including stale heap entries that are skipped
+        augmenting_paths (int): Number of augmenting paths a flow algorithm pushed flow along
+        phases (Dict[str, float]): Seconds spent in every phase, e.g. "prepare" for graph conversion and setup,
+            "search" and "path" for path reconstruction
+    """
+    settled: int = 0
+    relaxed: int = 0
+    pushes: int = 0
+    pops: int = 0
+    augmenting_paths: int = 0
+    phases: Dict[str, float] = dataclasses.field(default_factory=dict)
+    _clock: float = dataclasses.field(default_factory=perf_counter, repr=False, compare=False)
+
+    def lap(self, phase: str) -> None:
+        """
+        Adds the time since the previous lap, or since the stats were created, to a phase.
+
+        Params:
+            phase (str): Name of the phase that just ended
+        """
+        now = perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._clock
+        self._clock = now
+
+    def merge(self, other: "SearchStats") -> None:
+        """
+        Adds the counters and phase timings of other stats to these.
+
+        Params:
+            other (SearchStats): Stats to be added
+        """
+        self.settled += other.settled
+        self.relaxed += other.relaxed
+        self.pushes += other.pushes
+        self.pops += other.pops
+        self.augmenting_paths += other.augmenting_paths
+
+        for phase, seconds in other.phases.items():
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+class Profile():
+    """
+    Stats of every instrumented call made inside an instrument block.
+
+    Attributes:
+        records (List[Tuple[str, SearchStats]]): Name of the algorithm and stats of every call, in the order the
+            calls finished
+        callback (Callable[[str, SearchStats], None] | None): Called with every record as soon as its call
+            finishes
+    """
+
+    def __init__(self, callback: Callable[[str, SearchStats], None] | None = None):
+        """
+        Constructor
+
+        Params:
+            callback (Callable[[str, SearchStats], None] | None): Called with every record as soon as its call
+                finishes
+        """
+        self.records: List[Tuple[str, SearchStats]] = []
+        self.callback = callback
+
+    def totals(self) -> Dict[str, SearchStats]:
+        """
+        Sums the stats of the recorded calls per algorithm.
+
+        Returns:
+            Dict[str, SearchStats]: merged stats of every algorithm that was called
+        """
+        totals: Dict[str, SearchStats] = {}
+
+        for name, stats in self.records:
+            totals.setdefault(name, SearchStats()).merge(stats)
+
+        return totals
+
+    def _record(self, name: str, stats: SearchStats) -> None:
+        self.records.append((name, stats))
+
+        if (self.callback is not None):
+            self.callback(name, stats)
+
+
+# Profiles of the instrument blocks currently open, innermost last. Shared by every thread of the process.
+_profiles: List[Profile] = []
+
+
+@contextmanager
+def instrument(callback: Callable[[str, SearchStats], None] | None = None) -> Iterator[Profile]:
+    """
+    Records stats for every instrumented algorithm called inside the block, whether or not a stats argument is
+    passed. Blocks can be nested, calls are recorded by the innermost block.
+
+    Usage:
+        with instrument() as profile:
+            dijkstra(graph, 1, 5)
+        print(profile.totals()["dijkstra"].phases)
+
+    Params:
+        callback (Callable[[str, SearchStats], None] | None): Called with the name of the algorithm and its stats
+            after every call, e.g. to forward them to a log
+
+    Returns:
+        Iterator[Profile]: profile collecting the stats of the block
+    """
+    profile = Profile(callback)
+    _profiles.append(profile)
+
+    try:
+        yield profile
+    finally:
+        _profiles.remove(profile)
+
+
+def _instrumented(function):
+    """
+    A helper function to decorate an algorithm that takes a stats argument. The algorithm always receives fresh
+    stats, which are added to the stats passed by the caller and recorded by the innermost instrument block once
+    the call finishes. Without either, the algorithm runs with stats None and pays for a single check per call.
+
+    Params:
+        function (Callable): Algorithm with a stats parameter defaulting to None
+
+    Returns:
+        Callable: the instrumented algorithm
+    """
+    name = function.__qualname__
+    position = list(inspect.signature(function).parameters).index("stats")
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if (len(args) > position):
+            stats = args[position]
+        else:
+            stats = kwargs.get("stats")
+
+        if (stats is None and not _profiles):
+            return function(*args, **kwargs)
+
+        fresh = SearchStats()
+
+        if (len(args) > position):
+            args = args[:position] + (fresh,) + args[position + 1:]
+        else:
+            kwargs["stats"] = fresh
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            if (stats is not None):
+                stats.merge(fresh)
+
+            if (_profiles):
+                _profiles[-1]._record(name, fresh)
+
+    return wrapper
@@ -0,0 +1,275 @@
+import random
+import struct
+import sys
+import zlib
+from array import array
+from math import inf
+from typing import Tuple, List
+
+from ..Data import Graph
+from .Instrumentation import SearchStats
+from .ShortestPath import astar, _shortest_path_tree
+
+_MAGIC = b"SGALT"
+_VERSION = 2
+_HEADER = struct.Struct("<5sBqqqI")
+
+
+def _little_endian(typecode: str, values) -> memoryview:
+    """
+    A helper function to get the bytes of an array in little-endian order, whatever the byte order of the machine.
+    """
+    if (sys.byteorder == "big"):
+        values = array(typecode, values)
+        values.byteswap()
+
+    return memoryview(values).cast('B')
+
+
+def _fingerprint(graph: Graph) -> int:
+    """
+    A helper function computing a CRC32 checksum of the vertex IDs, CSR arrays and weights of a graph, stored in
+    index files so that an index is only loaded for the graph it was built for.
+    """
+    offsets, targets, weights = graph.csr
+    checksum = 0
+
+    for typecode, values in (('q', array('q', graph.vertices)), ('q', offsets), ('q', targets), ('d', weights)):
+        checksum = zlib.crc32(_little_endian(typecode, values), checksum)
+
+    return checksum
+
+
+class LandmarkIndex():
+    """
+    Precomputed landmark distances for ALT (A*, Landmarks, Triangle inequality) queries.
+
+    For every landmark L the index stores d(L, v) and d(v, L) for all vertices v. By the triangle inequality
+    d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L), the largest of these bounds over all
+    landmarks is used as an A* heuristic.
+
+    The bounds only hold for the edge weights the index was built with, so the index raises once the graph
+    has changed and has to be built again.
+
+    Protected Variables:
+        _graph (Graph): Graph the index was built for
+        _version (int): Version of _graph the distances were computed at
+        _landmarks (array[int]): Slot indices of the landmarks
+        _from_landmark (List[array[float]]): d(L, v) for every landmark, indexed by slot index of v
+        _to_landmark (List[array[float]]): d(v, L) for every landmark, indexed by slot index of v
+    """
+
+    def __init__(self, graph: Graph, landmarks: array, from_landmark: List[array], to_landmark: List[array]):
+        """
+        Constructor, use LandmarkIndex.build or LandmarkIndex.load to create an index.
+
+        Params:
+            graph (Graph): Graph the index was built for
+            landmarks (array[int]): Slot indices of the landmarks
+            from_landmark (List[array[float]]): Distances from every landmark
+            to_landmark (List[array[float]]): Distances to every landmark
+        """
+        self._graph = graph
+        self._version = graph.version
+        self._landmarks = landmarks
+        self._from_landmark = from_landmark
+        self._to_landmark = to_landmark
+
+        self._end_index = -1
+        self._end_bounds: List[Tuple[float, float]] = []
+
+    @staticmethod
+    def build(graph: Graph, num_landmarks: int = 8, seed: int | None = None) -> "LandmarkIndex":
+        """
+        Selects landmarks and computes their distance arrays.
+
+        Landmarks are chosen by farthest selection: the first one is a random vertex, every next one is
+        the vertex farthest away from the landmarks chosen so far, preferring vertices they cannot reach.
+
+        Params:
+            graph (Graph): Graph to be preprocessed, edge weights should be non-negative
+            num_landmarks (int): Number of landmarks, at most graph.graph_size
+            seed (int): Seed for the choice of the first landmark
+
+        Returns:
+            LandmarkIndex: Index for the graph
+        """
+        if(not isinstance(graph, Graph)):
+            raise Exception("Graph should be an instance of Graph class")
+
+        size = graph.graph_size
+        num_landmarks = min(num_landmarks, size)
+
+        forward = graph.csr
+        backward = graph.reverse_csr
+
+        landmarks = array('q')
+        from_landmark = []
+        to_landmark = []
+
+        closest = size * [inf]
+        candidate = random.Random(seed).randrange(size) if size else -1
+
+        for _ in range(num_landmarks):
+            landmarks.append(candidate)
+
+            distances, _ = _shortest_path_tree(*forward, size, candidate)
+            from_landmark.append(array('d', distances))
+            to_landmark.append(array('d', _shortest_path_tree(*backward, size, candidate)[0]))
+
+            for i in range(size):
+                if (distances[i] < closest[i]):
+                    closest[i] = distances[i]
+
+            chosen = set(landmarks)
+            candidate = max((i for i in range(size) if i not in chosen), key=closest.__getitem__, default=-1)
+
+        return LandmarkIndex(graph, landmarks, from_landmark, to_landmark)
+
+    def save(self, file_path: str) -> None:
+        """
+        Writes the index to a binary file, so that it can be loaded next to the graph without recomputing.
+
+        The file holds a header (magic, version, vertex count, edge count, landmark count, checksum of the
+        graph), then the little-endian landmark slot indices and distance arrays, 8 bytes per item.
+
+        Params:
+            file_path (str): Path of the file to be written
+
+        Raises:
+            Exception: If the graph has changed since the index was built
+        """
+        self._check_version()
+
+        with open(file_path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, self._graph.graph_size, self._graph.num_edges,
+                                    len(self._landmarks), _fingerprint(self._graph)))
+            file.write(_little_endian('q', self._landmarks))
+
+            for distances in self._from_landmark + self._to_landmark:
+                file.write(_little_endian('d', distances))
+
+    @staticmethod
+    def load(file_path: str, graph: Graph) -> "LandmarkIndex":
+        """
+        Reads an index written by save.
+
+        Params:
+            file_path (str): Path of the index file
+            graph (Graph): Graph the index was built for
+
+        Raises:
+            Exception: If the file is not a landmark index, was written by an unsupported version or was built for
+                a different graph, including the same graph with other edges or weights
+
+        Returns:
+            LandmarkIndex: Index for the graph
+        """
+        with open(file_path, "rb") as file:
+            header = file.read(_HEADER.size)
+
+            if (len(header) < _HEADER.size or header[:len(_MAGIC)] != _MAGIC):
+                raise Exception("File is not a landmark index")
+
+            _, version, size, num_edges, num_landmarks, checksum = _HEADER.unpack(header)
+
+            if (version != _VERSION):
+                raise Exception("Landmark index version " + str(version) + " is not supported")
+
+            if (size != graph.graph_size or num_edges != graph.num_edges or checksum != _fingerprint(graph)):
+                raise Exception("Landmark index was built for a different graph")
+
+            landmarks = array('q')
+            landmarks.fromfile(file, num_landmarks)
+
+            distances = []
+            for _ in range(2 * num_landmarks):
+                row = array('d')
+                row.fromfile(file, size)
+                distances.append(row)
+
+        if (sys.byteorder == "big"):
+            for values in [landmarks] + distances:
+                values.byteswap()
+
+        return LandmarkIndex(graph, landmarks, distances[:num_landmarks], distances[num_landmarks:])
+
+    @property
+    def landmarks(self) -> List[int]:
+        """
+        Retrieves the landmarks of the index.
+
+        Returns:
+            List[int]: IDs of the landmark vertices
+        """
+        return [self._graph.get_vertex_id(landmark) for landmark in self._landmarks]
+
+    def _check_version(self) -> None:
+        """
+        A helper function to raise if the graph has changed since the index was built.
+        """
+        if (self._graph.version != self._version):
+            raise Exception("Landmark index is out of date, the graph has changed since it was built")
+
+    def heuristic(self, vertex_id: int, end: int) -> float:
+        """
+        Lower bound on the distance from a vertex to the end vertex, usable as an astar heuristic.
+
+        Params:
+            vertex_id (int): id of the vertex
+            end (int): id of the end vertex
+
+        Raises:
+            Exception: If the graph has changed since the index was built
+
+        Returns:
+            float: Largest triangle inequality bound over all landmarks, inf if end is unreachable
+        """
+        self._check_version()
+
+        end_index = self._graph.get_vertex_index(end)
+
+        if (end_index != self._end_index):
+            self._end_index = end_index
+            self._end_bounds = [(from_landmark[end_index], to_landmark[end_index])
+                                for from_landmark, to_landmark in zip(self._from_landmark, self._to_landmark)]
+
+        index = self._graph.get_vertex_index(vertex_id)
+
+        bound = 0
+        for (landmark_to_end, end_to_landmark), from_landmark, to_landmark in zip(self._end_bounds,
+                                                                                  self._from_landmark,
+                                                                                  self._to_landmark):
+            landmark_to_vertex = from_landmark[index]
+            if (landmark_to_vertex != inf and landmark_to_end - landmark_to_vertex > bound):
+                bound = landmark_to_end - landmark_to_vertex
+
+            if (end_to_landmark != inf and to_landmark[index] - end_to_landmark > bound):
+                bound = to_landmark[index] - end_to_landmark
+
+        return bound
+
+
+def alt(graph: Graph, start: int, end: int, index: LandmarkIndex,
+        stats: SearchStats | None = None) -> Tuple[Tuple[int], float]:
+    """
+    Runs an A* search guided by landmark distance bounds to find the shortest path from start to end.
+
+    Params:
+        graph (Graph): Graph to be searched for
+        start (int): id of the start vertex
+        end (int): id of the end vertex
+        index (LandmarkIndex): Landmark index built for graph
+        stats (SearchStats): Optional counters to be filled in by the search
+
+    Raises:
+        Exception: If index was built for another graph, or graph has changed since index was built
+
+    Returns:
+        Tuple[Tuple[int], float]: path from start vertex to end vertex and its length,
+        an empty path and inf if end is unreachable
+    """
+    if (index._graph is not graph):
+        raise Exception("Landmark index was built for a different graph")
+
+    return astar(graph, start, end, index.heuristic, stats)
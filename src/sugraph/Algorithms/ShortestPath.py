@@ -1,8 +1,62 @@
-from typing import Tuple, List
-from src.sugraph.Data import Graph
-from math import inf
+from typing import Tuple, List, Callable, Any, Iterable
+from heapq import heappush, heappop
+from collections import deque
+from ..Data import Graph
+from .Heap import IndexedHeap
+from .Instrumentation import SearchStats, _instrumented
+from .Components import _unreachable
+from math import inf, hypot
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class NegativeCycleError(Exception):
+    """
+    Raised when a negative weight cycle is reachable from the start vertex of a search.
+
+    Attributes:
+        cycle (Tuple[int]): IDs of the vertices on the cycle in edge order, the first vertex is repeated at the end
+    """
+
+    def __init__(self, cycle: Tuple[int]):
+        super().__init__("Graph contains a negative weight cycle: " + str(cycle))
+        self.cycle = cycle
+
+
+def _negative_cycle(graph: Graph, parents, vertex_index: int) -> Tuple[int]:
+    """
+    A helper function to extract a negative cycle from parent pointers, starting at a vertex that could still be
+    relaxed after graph_size - 1 passes.
+
+    Params:
+        graph (Graph): Graph that was searched
+        parents (List[int]): Slot index of the parent of every vertex
+        vertex_index (int): Slot index of a vertex whose parent chain runs into the cycle
 
-def belmannford(graph: Graph, start: int, end: int) -> Tuple[int]:
+    Returns:
+        Tuple[int]: IDs of the vertices on the cycle in edge order, the first vertex is repeated at the end
+    """
+    for _ in range(graph.graph_size):
+        vertex_index = int(parents[vertex_index])
+
+    cycle = [graph.get_vertex_id(vertex_index)]
+    temp = int(parents[vertex_index])
+
+    while (temp != vertex_index):
+        cycle.append(graph.get_vertex_id(temp))
+        temp = int(parents[temp])
+
+    cycle.append(graph.get_vertex_id(vertex_index))
+
+    return tuple(reversed(cycle))
+
+
+@_instrumented
+def belmannford(graph: Graph, start: int, end: int, mode: str = "standard",
+                stats: SearchStats | None = None) -> Tuple[Tuple[int], float]:
     """
     Runs the Bellman-Ford Algorithm to find the shortest path from start vertex to end vertex.
 
@@ -10,133 +64,867 @@ def belmannford(graph: Graph, start: int, end: int) -> Tuple[int]:
         graph (Graph): Graph to be searched for
         start (int): id of the start vertex
         end (int): id of the end vertex
+        mode (str): How edges are relaxed:
+            "standard": passes over all edges, stopping early after a pass that changes nothing
+            "spfa": only edges of vertices whose distance changed are relaxed, using a FIFO queue
+            "numpy": every pass relaxes all edges at once over numpy views of the CSR arrays
+        stats (SearchStats): Optional counters to be filled in by the search
+
+    Raises:
+        NegativeCycleError: If a negative weight cycle is reachable from the start vertex
+
+    Returns:
+        Tuple[Tuple[int], float]: path from start vertex to end vertex and its length,
+        an empty path and inf if end is unreachable
+    """
+
+    #TODO: Add Support for adjacency matrix input
+    if(not isinstance(graph, Graph)):
+        raise Exception("Graph should be an instance of Graph class")
+
+    start_index = _get_index(graph, start)
+    end_index = _get_index(graph, end)
+
+    if (mode == "standard"):
+        search = _belmannford_standard
+    elif (mode == "spfa"):
+        search = _belmannford_spfa
+    elif (mode == "numpy"):
+        if (np is None):
+            raise ImportError("numpy is required for mode=\"numpy\"")
+        search = _belmannford_numpy
+    else:
+        raise Exception("mode Should be one of \"standard\", \"spfa\" or \"numpy\"")
+
+    if (stats is not None):
+        stats.lap("prepare")
+
+    distances, parents = search(graph, start_index, stats)
+
+    if (stats is not None):
+        stats.lap("search")
+
+    if (distances[end_index] == inf):
+        return tuple(), inf
+
+    path = _reconstruct_path(graph, parents, start_index, end_index)
+
+    if (stats is not None):
+        stats.lap("path")
+
+    return path, float(distances[end_index])
+
+
+def _belmannford_standard(graph: Graph, start_index: int,
+                          stats: SearchStats | None = None) -> Tuple[List[float], List[int]]:
+    """
+    A helper function running Bellman-Ford passes over the CSR arrays until a pass changes nothing.
+
+    Params:
+        graph (Graph): Graph to be searched for
+        start_index (int): Slot index of the start vertex
+        stats (SearchStats): Optional counters to be filled in by the search
+
+    Raises:
+        NegativeCycleError: If a negative weight cycle is reachable from the start vertex
+
+    Returns:
+        Tuple[List[float], List[int]]: distance from the start and parent slot index of every vertex
+    """
+    size = graph.graph_size
+    offsets, targets, weights = graph.csr
+
+    distances = size * [inf]
+    distances[start_index] = 0
+
+    parents = size * [-1]
+
+    for i in range(size):
+        changed = -1
+
+        for source in range(size):
+            source_distance = distances[source]
+
+            if (source_distance == inf):
+                continue
+
+            if (stats is not None):
+                stats.relaxed += offsets[source + 1] - offsets[source]
+
+            for position in range(offsets[source], offsets[source + 1]):
+                target = targets[position]
+                new_distance = source_distance + weights[position]
+
+                if (new_distance < distances[target]):
+                    distances[target] = new_distance
+                    parents[target] = source
+                    changed = target
+
+        if (changed == -1):
+            return distances, parents
+
+    raise NegativeCycleError(_negative_cycle(graph, parents, changed))
+
+
+def _belmannford_spfa(graph: Graph, start_index: int,
+                      stats: SearchStats | None = None) -> Tuple[List[float], List[int]]:
+    """
+    A helper function running the queue based Shortest Path Faster Algorithm variant of Bellman-Ford.
+
+    Params:
+        graph (Graph): Graph to be searched for
+        start_index (int): Slot index of the start vertex
+        stats (SearchStats): Optional counters to be filled in by the search
+
+    Raises:
+        NegativeCycleError: If a negative weight cycle is reachable from the start vertex
+
+    Returns:
+        Tuple[List[float], List[int]]: distance from the start and parent slot index of every vertex
+    """
+    size = graph.graph_size
+    offsets, targets, weights = graph.csr
+
+    distances = size * [inf]
+    distances[start_index] = 0
+
+    parents = size * [-1]
+    lengths = size * [0]
+
+    queued = size * [False]
+    queued[start_index] = True
+    queue = deque([start_index])
+
+    while queue:
+        source = queue.popleft()
+        queued[source] = False
+
+        if (stats is not None):
+            stats.pops += 1
+            stats.relaxed += offsets[source + 1] - offsets[source]
+
+        source_distance = distances[source]
+
+        for position in range(offsets[source], offsets[source + 1]):
+            target = targets[position]
+            new_distance = source_distance + weights[position]
+
+            if (new_distance < distances[target]):
+                distances[target] = new_distance
+                parents[target] = source
+                lengths[target] = lengths[source] + 1
+
+                if (lengths[target] >= size):
+                    raise NegativeCycleError(_negative_cycle(graph, parents, target))
+
+                if (not queued[target]):
+                    queued[target] = True
+                    queue.append(target)
+
+    if (stats is not None):
+        stats.pushes += stats.pops
+
+    return distances, parents
+
+
+def _belmannford_numpy(graph: Graph, start_index: int, stats: SearchStats | None = None):
+    """
+    A helper function running Bellman-Ford passes that relax every edge at once with numpy.
+
+    Params:
+        graph (Graph): Graph to be searched for
+        start_index (int): Slot index of the start vertex
+        stats (SearchStats): Optional counters to be filled in by the search
+
+    Raises:
+        NegativeCycleError: If a negative weight cycle is reachable from the start vertex
+
+    Returns:
+        Tuple[List[float], List[int]]: distance from the start and parent slot index of every vertex
+    """
+    size = graph.graph_size
+    offsets, targets, weights = graph.csr
+
+    sources = np.repeat(np.arange(size), np.diff(np.frombuffer(offsets, dtype=np.int64)))
+    targets = np.frombuffer(targets, dtype=np.int64)
+    weights = np.frombuffer(weights, dtype=np.float64)
+
+    distances = np.full(size, inf)
+    distances[start_index] = 0
+
+    parents = np.full(size, -1, dtype=np.int64)
+
+    for i in range(size):
+        candidates = distances[sources] + weights
+
+        if (stats is not None):
+            stats.relaxed += len(targets)
+
+        new_distances = distances.copy()
+        np.minimum.at(new_distances, targets, candidates)
+
+        improved = new_distances < distances
+        if (not improved.any()):
+            return distances, parents
+
+        tight = improved[targets] & (candidates == new_distances[targets])
+        parents[targets[tight]] = sources[tight]
+
+        distances = new_distances
+
+    raise NegativeCycleError(_negative_cycle(graph, parents, int(np.flatnonzero(improved)[0])))
+
+
+def _get_index(graph: Graph, vertex_id: int) -> int:
+    """
+    A helper function to convert a vertex ID to its slot index in the graph.
+
+    Params:
+        graph (Graph): Graph containing the vertex
+        vertex_id (int): ID of the vertex
+
+    Raises:
+        Exception: If the vertex doesn't exist in the graph
+
+    Returns:
+        int: Slot index of the vertex
+    """
+    index = graph.get_vertex_index(vertex_id)
+
+    if (index is None):
+        raise Exception("Vertex " + str(vertex_id) + " Doesn't Exist in Vertex Set")
+
+    return index
+
+
+def _slot_path(parents: List[int], start_index: int, end_index: int) -> List[int]:
+    """
+    A helper function to follow parent pointers from the end vertex back to the start vertex, for callers
+    without access to the graph such as worker processes.
+
+    Params:
+        parents (List[int]): Slot index of the parent of every vertex, -1 if it has none
+        start_index (int): Slot index of the start vertex
+        end_index (int): Slot index of the end vertex
+
+    Returns:
+        List[int]: path of slot indices from start vertex to end vertex
+    """
+    path = []
+    temp = end_index
+
+    while (temp != start_index):
+        path.append(temp)
+        temp = parents[temp]
+
+    path.append(start_index)
+    path.reverse()
+
+    return path
+
+
+def _reconstruct_path(graph: Graph, parents: List[int], start_index: int, end_index: int) -> Tuple[int]:
+    """
+    A helper function to follow parent pointers from the end vertex back to the start vertex.
+
+    Params:
+        graph (Graph): Graph that was searched
+        parents (List[int]): Slot index of the parent of every vertex, -1 if it has none
+        start_index (int): Slot index of the start vertex
+        end_index (int): Slot index of the end vertex
+
+    Returns:
+        Tuple[int]: path of vertex IDs from start vertex to end vertex
+    """
+    return tuple(graph.get_vertex_id(index) for index in _slot_path(parents, start_index, end_index))
+
+
+def _shortest_path_tree(offsets, targets, weights, size: int, source_index: int,
+                        target_indices: Iterable[int] | None = None) -> Tuple[List[float], List[int]]:
+    """
+    A helper function to run a single source Dijkstra search over CSR arrays.
+
+    Params:
+        offsets, targets, weights (array): CSR arrays to be searched, e.g. graph.csr or graph.reverse_csr
+        size (int): Number of vertices
+        source_index (int): Slot index of the source vertex
+        target_indices (Iterable[int] | None): Slot indices whose distances are needed, the search stops once all
+            of them are settled. None to search the whole graph
+
+    Returns:
+        Tuple[List[float], List[int]]: distance from the source and parent slot index of every vertex,
+        inf and -1 for unreachable vertices. After an early stop only the targets and the vertices settled
+        before them are final
+    """
+    distances = size * [inf]
+    distances[source_index] = 0
+
+    parents = size * [-1]
+
+    remaining = set(target_indices) if target_indices is not None else None
+
+    queue = [(0, source_index)]
+
+    while queue:
+        current_distance, current_index = heappop(queue)
+
+        if (current_distance > distances[current_index]):
+            continue
+
+        if (remaining is not None):
+            remaining.discard(current_index)
+            if (not remaining):
+                break
+
+        for position in range(offsets[current_index], offsets[current_index + 1]):
+            target = targets[position]
+            new_distance = current_distance + weights[position]
+
+            if (new_distance < distances[target]):
+                distances[target] = new_distance
+                parents[target] = current_index
+                heappush(queue, (new_distance, target))
+
+    return distances, parents
+
+
+@_instrumented
+def dijkstra(graph: Graph, start: int, end: int, indexed_heap: bool = False,
+             stats: SearchStats | None = None) -> Tuple[Tuple[int], float]:
+    """
+    Runs the Dijkstra Algorithm to find the shortest path from start vertex to end vertex.
+
+    The search uses a binary heap and stops as soon as the end vertex is settled. Edge weights should be
+    non-negative.
+
+    Params:
+        graph (Graph): Graph to be searched for
+        start (int): id of the start vertex
+        end (int): id of the end vertex
+        indexed_heap (bool): Use an IndexedHeap with decrease-key instead of heapq with lazy deletion,
+            which keeps the heap at most V entries large
+        stats (SearchStats): Optional counters to be filled in by the search
 
     Returns:
-        Tuple[int]: path from start vertex to end vertex
+        Tuple[Tuple[int], float]: path from start vertex to end vertex and its length,
+        an empty path and inf if end is unreachable
     """
 
     #TODO: Add Support for adjacency matrix input
-    if(isinstance(graph, Graph)):
+    if(not isinstance(graph, Graph)):
         raise Exception("Graph should be an instance of Graph class")
 
+    start_index = _get_index(graph, start)
+    end_index = _get_index(graph, end)
+
+    if (_unreachable(graph, start_index, end_index)):
+        return tuple(), inf
+
+    offsets, targets, weights = graph.csr
+
+    if (stats is not None):
+        stats.lap("prepare")
+
     distances = graph.graph_size * [inf]
-    distances[start - 1] = 0
+    distances[start_index] = 0
 
     parents = graph.graph_size * [-1]
 
-    for i in range(graph.graph_size):
+    settled = graph.graph_size * [False]
+
+    if (indexed_heap):
+        queue = IndexedHeap(graph.graph_size)
+        queue.push(start_index, 0)
+        pop = queue.pop
+    else:
+        queue = [(0, start_index)]
+
+    if (stats is not None):
+        stats.pushes += 1
+
+    while queue:
 
-        for edge in graph.edges:
-            source, target, weight = edge
-            if (distances[target - 1] > distances[source - 1] + weight):
-                distances[target - 1] = distances[source - 1] + weight
-                parents[target - 1] = source
+        if (indexed_heap):
+            current_index, current_distance = pop()
+        else:
+            current_distance, current_index = heappop(queue)
 
-        for edge in graph.edges:
-            source, target, weight = edge
-            if (distances[target - 1] > distances[source - 1] + weight):
-                return []
+            if (settled[current_index]):
+                if (stats is not None):
+                    stats.pops += 1
+                continue
 
-        temp = end
-        path = []
+        settled[current_index] = True
 
-        while (temp != start):
-            path.append(temp)
-            temp = parents[temp - 1]
+        if (stats is not None):
+            stats.settled += 1
+            stats.pops += 1
+            stats.relaxed += offsets[current_index + 1] - offsets[current_index]
 
-        path.append(start)
+        if (current_index == end_index):
+            break
 
-        return tuple(reversed(path))
+        for position in range(offsets[current_index], offsets[current_index + 1]):
+            target = targets[position]
+            new_distance = current_distance + weights[position]
 
+            if (new_distance < distances[target] and not settled[target]):
+                distances[target] = new_distance
+                parents[target] = current_index
 
-def dijkstra(graph: Graph, start: int, end: int):
+                if (indexed_heap):
+                    queue.push(target, new_distance)
+                else:
+                    heappush(queue, (new_distance, target))
+
+                if (stats is not None):
+                    stats.pushes += 1
+
+    if (stats is not None):
+        stats.lap("search")
+
+    if (not settled[end_index]):
+        return tuple(), inf
+
+    path = _reconstruct_path(graph, parents, start_index, end_index)
+
+    if (stats is not None):
+        stats.lap("path")
+
+    return path, distances[end_index]
+
+
+@_instrumented
+def bidirectional_dijkstra(graph: Graph, start: int, end: int,
+                           stats: SearchStats | None = None) -> Tuple[Tuple[int], float]:
     """
-    Runs the Dijkstra Algorithm to find the shortest path from start vertex to end vertex.
+    Runs Dijkstra Algorithm simultaneously forward from the start vertex and backward from the end vertex.
+
+    The backward search walks the in-edges given by graph.reverse_csr. The search stops once the sum of the
+    smallest queued distances of both sides is not smaller than the best path found through a meeting
+    vertex. Edge weights should be non-negative.
 
     Params:
         graph (Graph): Graph to be searched for
         start (int): id of the start vertex
         end (int): id of the end vertex
+        stats (SearchStats): Optional counters to be filled in by the search, settled counts both sides
 
     Returns:
-        Tuple[int]: path from start vertex to end vertex
+        Tuple[Tuple[int], float]: path from start vertex to end vertex and its length,
+        an empty path and inf if end is unreachable
     """
+    if(not isinstance(graph, Graph)):
+        raise Exception("Graph should be an instance of Graph class")
 
+    start_index = _get_index(graph, start)
+    end_index = _get_index(graph, end)
 
-    #TODO: Add Support for adjacency matrix input
-    if(isinstance(graph, Graph)):
+    if (start_index == end_index):
+        return (start,), 0
+
+    if (_unreachable(graph, start_index, end_index)):
+        return tuple(), inf
+
+    csrs = (graph.csr, graph.reverse_csr)
+
+    if (stats is not None):
+        stats.lap("prepare")
+
+    distances = (graph.graph_size * [inf], graph.graph_size * [inf])
+    distances[0][start_index] = 0
+    distances[1][end_index] = 0
+
+    parents = (graph.graph_size * [-1], graph.graph_size * [-1])
+    settled = (graph.graph_size * [False], graph.graph_size * [False])
+
+    queues = ([(0, start_index)], [(0, end_index)])
+
+    best_distance = inf
+    meeting_index = -1
+
+    while queues[0] and queues[1]:
+
+        if (queues[0][0][0] + queues[1][0][0] >= best_distance):
+            break
+
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+
+        current_distance, current_index = heappop(queues[side])
+
+        if (settled[side][current_index]):
+            if (stats is not None):
+                stats.pops += 1
+            continue
+
+        settled[side][current_index] = True
+
+        offsets, targets, weights = csrs[side]
+
+        if (stats is not None):
+            stats.settled += 1
+            stats.pops += 1
+            stats.relaxed += offsets[current_index + 1] - offsets[current_index]
+        side_distances = distances[side]
+        other_distances = distances[1 - side]
+        side_parents = parents[side]
+        side_settled = settled[side]
+        queue = queues[side]
+
+        for position in range(offsets[current_index], offsets[current_index + 1]):
+            target = targets[position]
+            new_distance = current_distance + weights[position]
+
+            if (new_distance < side_distances[target] and not side_settled[target]):
+                side_distances[target] = new_distance
+                side_parents[target] = current_index
+                heappush(queue, (new_distance, target))
+
+            if (new_distance + other_distances[target] < best_distance):
+                best_distance = new_distance + other_distances[target]
+                meeting_index = target
+
+    if (stats is not None):
+        stats.pushes = stats.pops + len(queues[0]) + len(queues[1])
+        stats.lap("search")
+
+    if (meeting_index == -1):
+        return tuple(), inf
+
+    forward_path = _reconstruct_path(graph, parents[0], start_index, meeting_index)
+
+    backward_path = []
+    temp = parents[1][meeting_index]
+
+    while (temp != -1):
+        backward_path.append(graph.get_vertex_id(temp))
+        temp = parents[1][temp]
+
+    if (stats is not None):
+        stats.lap("path")
+
+    return forward_path + tuple(backward_path), best_distance
+
+
+def coordinate_heuristic(graph: Graph, coordinates: Callable[[Any], Tuple[float, float]] | None = None,
+                         scale: float = 1.0) -> Callable[[int, int], float]:
+    """
+    Creates an A* heuristic from planar coordinates stored in the vertex values of a graph.
+
+    The heuristic is the straight line distance multiplied by scale. It is admissible as long as no edge is
+    shorter than scale times the straight line distance between its end points. Vertices hidden by a
+    SubgraphView get no coordinates, A* never reaches them.
+
+    Params:
+        graph (Graph): Graph whose vertex values hold the coordinates
+        coordinates (Callable[[Any], Tuple[float, float]]): Extracts (x, y) from a vertex value, by default
+            the value itself is used as an (x, y) pair
+        scale (float): Factor applied to the straight line distance
+
+    Returns:
+        Callable[[int, int], float]: heuristic taking a vertex id and the end vertex id
+    """
+    if (coordinates is None):
+        coordinates = lambda value: (value[0], value[1])
+
+    points = {vertex_id: coordinates(graph.get_vertex_data(vertex_id)) for vertex_id in graph.vertices
+              if graph.get_vertex_index(vertex_id) is not None}
+
+    def heuristic(vertex_id: int, end: int) -> float:
+        x1, y1 = points[vertex_id]
+        x2, y2 = points[end]
+        return scale * hypot(x2 - x1, y2 - y1)
+
+    return heuristic
+
+
+@_instrumented
+def astar(graph: Graph, start: int, end: int, heuristic: Callable[[int, int], float] | None = None,
+          stats: SearchStats | None = None) -> Tuple[Tuple[int], float]:
+    """
+    Runs the A* Algorithm to find the shortest path from start vertex to end vertex.
+
+    Vertices are expanded in order of distance from start plus the heuristic estimate of the remaining
+    distance to end. With an admissible heuristic the returned path is a shortest path, a vertex is
+    expanded again if a shorter path to it is found later. Edge weights should be non-negative.
+
+    Params:
+        graph (Graph): Graph to be searched for
+        start (int): id of the start vertex
+        end (int): id of the end vertex
+        heuristic (Callable[[int, int], float]): Lower bound on the distance from a vertex id to the end
+            vertex id, see coordinate_heuristic. Without a heuristic the search is equivalent to dijkstra
+        stats (SearchStats): Optional counters to be filled in by the search
+
+    Returns:
+        Tuple[Tuple[int], float]: path from start vertex to end vertex and its length,
+        an empty path and inf if end is unreachable
+    """
+    if(not isinstance(graph, Graph)):
         raise Exception("Graph should be an instance of Graph class")
 
+    start_index = _get_index(graph, start)
+    end_index = _get_index(graph, end)
+
+    if (_unreachable(graph, start_index, end_index)):
+        return tuple(), inf
+
+    offsets, targets, weights = graph.csr
+
+    if (stats is not None):
+        stats.lap("prepare")
+
+    estimates = graph.graph_size * [None]
 
     distances = graph.graph_size * [inf]
-    distances[start - 1] = 0
+    distances[start_index] = 0
 
     parents = graph.graph_size * [-1]
 
-    to_be_covered = graph.vertices
+    queue = [(0, 0, start_index)]
 
-    while to_be_covered:
+    while queue:
+        _, current_distance, current_index = heappop(queue)
 
-        min_distanced_vertex = to_be_covered[0]
-        min_distance = 0
+        if (current_distance > distances[current_index]):
+            if (stats is not None):
+                stats.pops += 1
+            continue
 
-        for i in range(1, len(to_be_covered)):
+        if (stats is not None):
+            stats.settled += 1
+            stats.pops += 1
+            stats.relaxed += offsets[current_index + 1] - offsets[current_index]
 
-            vertex = to_be_covered[i]
+        if (current_index == end_index):
+            break
 
-            if (min_distance > distances[vertex - 1]):
-                min_distanced_vertex = vertex
-                min_distance = distances[vertex - 1]
+        for position in range(offsets[current_index], offsets[current_index + 1]):
+            target = targets[position]
+            new_distance = current_distance + weights[position]
 
-        to_be_covered.remove(min_distanced_vertex)
+            if (new_distance < distances[target]):
+                distances[target] = new_distance
+                parents[target] = current_index
 
-        for neighbour in graph.get_neighbours(min_distanced_vertex):
-            target = neighbour.target
-            weight = neighbour.weight
+                estimate = estimates[target]
+                if (estimate is None):
+                    estimate = heuristic(graph.get_vertex_id(target), end) if heuristic is not None else 0
+                    estimates[target] = estimate
 
-            if (distances[target - 1] > distances[min_distanced_vertex - 1] + weight):
-                distances[target - 1] = distances[min_distanced_vertex - 1] + weight
-                parents[target - 1] = min_distanced_vertex
+                heappush(queue, (new_distance + estimate, new_distance, target))
 
-    temp = end
-    path = []
+    if (stats is not None):
+        stats.pushes = stats.pops + len(queue)
+        stats.lap("search")
 
-    while (temp != start):
-        path.append(temp)
-        temp = parents[temp - 1]
+    if (distances[end_index] == inf):
+        return tuple(), inf
 
-    path.append(start)
+    path = _reconstruct_path(graph, parents, start_index, end_index)
 
-    return tuple(reversed(path))
+    if (stats is not None):
+        stats.lap("path")
+
+    return path, distances[end_index]
+
+
+def _floydwarshall_python(graph: Graph, with_predecessors: bool):
+    """
+    A helper function running Floyd-Warshall on lists, used when numpy is not installed.
+
+    Params:
+        graph (Graph): Graph to be searched for
+        with_predecessors (bool): Whether to track the predecessor matrix
+
+    Returns:
+        Tuple[List[List[float]], List[List[int]]]: distance matrix and predecessor matrix (None if not tracked)
+    """
+    size = graph.graph_size
+    offsets, targets, weights = graph.csr
+
+    distances = [size * [inf] for _ in range(size)]
+    predecessors = [size * [-1] for _ in range(size)] if with_predecessors else None
+
+    for i in range(size):
+        distances[i][i] = 0
+        for position in range(offsets[i], offsets[i + 1]):
+            j = targets[position]
+            if (weights[position] < distances[i][j]):
+                distances[i][j] = weights[position]
+                if (with_predecessors):
+                    predecessors[i][j] = i
 
+    for m in range(size):
+        row_m = distances[m]
+        for i in range(size):
+            row_i = distances[i]
+            distance_im = row_i[m]
 
-def floydwarshall(graph: Graph):
+            if (distance_im == inf):
+                continue
+
+            for j in range(size):
+                candidate = distance_im + row_m[j]
+                if (candidate < row_i[j]):
+                    row_i[j] = candidate
+                    if (with_predecessors):
+                        predecessors[i][j] = predecessors[m][j]
+
+    return distances, predecessors
+
+
+def _relax_panel(distances, predecessors, rows: slice, columns: slice, k_range: range) -> None:
+    """
+    A helper function relaxing distances[rows, columns] in place through every intermediate vertex in k_range,
+    one vertex at a time, using a numpy broadcast per vertex.
+    """
+    panel = distances[rows, columns]
+    predecessor_panel = predecessors[rows, columns] if predecessors is not None else None
+
+    candidate = np.empty_like(panel)
+    improved = np.empty(panel.shape, dtype=bool)
+
+    for k in k_range:
+        np.add(distances[rows, k, None], distances[None, k, columns], out=candidate)
+
+        if (predecessor_panel is None):
+            np.minimum(panel, candidate, out=panel)
+        else:
+            np.less(candidate, panel, out=improved)
+            np.copyto(panel, candidate, where=improved)
+            np.copyto(predecessor_panel, predecessors[None, k, columns], where=improved)
+
+
+@_instrumented
+def floydwarshall(graph: Graph, predecessors: bool = False, block_size: int | None = None,
+                  stats: SearchStats | None = None):
     """
     Runs the Floyd-Warshall Algorithm to find the shortest paths between all pairs of vertices.
 
+    Row and column i of the result belong to the vertex at slot index i, i.e. graph.vertices[i]. With numpy
+    installed every intermediate vertex k relaxes the whole matrix at once as
+    D = min(D, D[:, k, None] + D[None, k, :]). For large graphs the blocked variant processes the matrix in
+    block_size x block_size tiles that stay in cache. A negative value on the diagonal indicates that the
+    vertex lies on a negative cycle.
+
     Params:
         graph (Graph): Graph to be searched for
+        predecessors (bool): Also return the predecessor matrix, see floydwarshall_path
+        block_size (int): Tile size of the blocked variant, by default the blocked variant is used for graphs
+            with more than 1024 vertices with tiles of 256. Has no effect without numpy or with predecessors,
+            since the tile order can leave cyclic predecessor chains along zero weight cycles
+        stats (SearchStats): Optional phase timings to be filled in, "prepare" covers building the dense
+            matrices
 
     Returns:
-        List[List[float]]: matrix of shortest path lengths between all pairs of vertices
+        np.ndarray[float] | List[List[float]]: matrix of shortest path lengths between all pairs of vertices,
+        a numpy array if numpy is installed. If predecessors is True, a tuple of the distance matrix and a
+        matrix whose entry [i][j] is the slot index of the vertex before j on the shortest path from i to j,
+        -1 if there is none
     """
-    adj_matrix = graph.adjacency_matrix
+    if(not isinstance(graph, Graph)):
+        raise Exception("Graph should be an instance of Graph class")
+
+    if (np is None):
+        distances, predecessor_matrix = _floydwarshall_python(graph, predecessors)
+
+        if (stats is not None):
+            stats.lap("search")
+
+        return (distances, predecessor_matrix) if predecessors else distances
+
+    size = graph.graph_size
+    offsets, targets, weights = graph.csr
+
+    rows = np.repeat(np.arange(size), np.diff(np.frombuffer(offsets, dtype=np.int64)))
+    columns = np.frombuffer(targets, dtype=np.int64)
+    edge_weights = np.frombuffer(weights, dtype=np.float64)
+
+    distances = np.full((size, size), inf)
+    np.fill_diagonal(distances, 0)
+    np.minimum.at(distances, (rows, columns), edge_weights)
+
+    predecessor_matrix = None
+    if (predecessors):
+        predecessor_matrix = np.full((size, size), -1, dtype=np.int64)
+        has_edge = np.zeros((size, size), dtype=bool)
+        has_edge[rows, columns] = True
+        np.fill_diagonal(has_edge, False)
+        predecessor_matrix[has_edge] = np.nonzero(has_edge)[0]
+
+    if (stats is not None):
+        stats.lap("prepare")
+
+    if (predecessors):
+        block_size = size
+    elif (block_size is None):
+        block_size = 256 if size > 1024 else size
+
+    everything = slice(0, size)
+
+    for block_start in range(0, size, max(block_size, 1)):
+        block = slice(block_start, min(block_start + block_size, size))
+        k_range = range(block.start, block.stop)
+
+        if (block_size >= size):
+            _relax_panel(distances, predecessor_matrix, everything, everything, k_range)
+            continue
+
+        _relax_panel(distances, predecessor_matrix, block, everything, k_range)
+        _relax_panel(distances, predecessor_matrix, everything, block, k_range)
+
+        for tile_start in range(0, size, block_size):
+            row_tile = slice(tile_start, min(tile_start + block_size, size))
+            if (row_tile == block):
+                continue
 
-    path_lenght_matrix = [[adj_matrix[i][j] if adj_matrix[i][j] != 0 else inf for j in range(graph.graph_size)]
-                          for i in range(graph.graph_size)]
+            for other_start in range(0, size, block_size):
+                column_tile = slice(other_start, min(other_start + block_size, size))
+                if (column_tile == block):
+                    continue
 
-    temp = [[None for j in range(graph.graph_size)]
-            for i in range(graph.graph_size)]
+                _relax_panel(distances, predecessor_matrix, row_tile, column_tile, k_range)
 
-    for m in range(graph.graph_size):
-        for i in range(graph.graph_size):
-            for j in range(graph.graph_size):
+    if (stats is not None):
+        stats.lap("search")
 
-                temp[i][j] = min(path_lenght_matrix[i][j], path_lenght_matrix[i][m] + path_lenght_matrix[i][m])
+    return (distances, predecessor_matrix) if predecessors else distances
 
-        path_lenght_matrix = temp
 
-    return path_lenght_matrix
+def floydwarshall_path(graph: Graph, predecessors, start: int, end: int) -> Tuple[int]:
+    """
+    Reconstructs a shortest path from the predecessor matrix returned by floydwarshall.
+
+    Params:
+        graph (Graph): Graph that was searched
+        predecessors (np.ndarray[int] | List[List[int]]): predecessor matrix returned by floydwarshall
+        start (int): id of the start vertex
+        end (int): id of the end vertex
+
+    Returns:
+        Tuple[int]: path from start vertex to end vertex, empty if end is unreachable
+    """
+    start_index = _get_index(graph, start)
+    end_index = _get_index(graph, end)
+
+    if (start_index == end_index):
+        return (start,)
+
+    row = predecessors[start_index]
+    if (row[end_index] == -1):
+        return tuple()
+
+    path = []
+    temp = end_index
+
+    while (temp != start_index):
+        path.append(graph.get_vertex_id(temp))
+        temp = int(row[temp])
+
+    path.append(start)
+
+    return tuple(reversed(path))
 
 if __name__ == "__main__":
     vertices = [1, 2, 3, 4, 5, 6, 7]
@@ -1,117 +1,430 @@
 from typing import Tuple,List
-from src.sugraph.Data import Graph
-from collections import deque
+from array import array
+from ..Data import Graph
+from ..Data.Graph import _build_csr
+from .Instrumentation import SearchStats, _instrumented
+from .Components import _unreachable
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def BFS(graph: Graph, start: int, end: int) -> Tuple[int]:
+
+def _matrix_to_csr(adj_matrix: List[List[float]]) -> Tuple[array, array]:
     """
-        Runs Breadth-First Search (BFS) Algorithm to find a path from start vertex to end vertex.
+    A helper function to convert an adjacency matrix to CSR offset and target arrays, row i is the vertex with
+    id i + 1. Runs once per call in O(V^2), the traversals themselves only see the CSR arrays.
 
-        Args:
-            graph: Graph -> Graph to be searched for
-            start: int -> id of the start vertex
-            end: int -> id of the end vertex
+    Params:
+        adj_matrix (List[List[float]]): Adjacency matrix, non-zero entries are edges
 
-        Returns:
-            Tuple[int] -> path from start vertex to end vertex
+    Returns:
+        Tuple[array, array]: offsets and targets arrays
     """
+    offsets = array('q', [0])
+    targets = array('q')
+
+    for row in adj_matrix:
+        targets.extend(i for i, entry in enumerate(row) if entry != 0)
+        offsets.append(len(targets))
+
+    return offsets, targets
+
+
+def _traversal_arrays(graph: Graph | List[List[float]], start: int) -> Tuple[array, array, List[int], int]:
+    """
+    A helper function to get the CSR arrays a traversal runs on, for a Graph or an adjacency matrix.
+
+    Params:
+        graph (Graph | List[List[float]]): Graph or adjacency matrix to be traversed
+        start (int): id of the start vertex
+
+    Raises:
+        Exception: If graph is neither a Graph nor a List[List[float]], or start doesn't exist
 
+    Returns:
+        Tuple[array, array, List[int], int]: offsets and targets arrays, the id of every slot index and the slot
+        index of the start vertex
+    """
     if (isinstance(graph, Graph)):
-        adj_matrix = graph.adjacency_matrix
+        offsets, targets, _ = graph.csr
+        ids = graph.vertices
+        start_index = graph.get_vertex_index(start)
 
     elif (isinstance(graph, list)):
         for row in graph:
             if (isinstance(row, list)):
-                if all(isinstance(entry, float | int) for entry in row):
-                    adj_matrix = graph
-                else:
+                if not all(isinstance(entry, float | int) for entry in row):
                     raise Exception("graph Should be of type Graph|List[List[float]]")
             else:
                 raise Exception("graph Should be of type Graph|List[List[float]]")
+
+        offsets, targets = _matrix_to_csr(graph)
+        ids = list(range(1, len(graph) + 1))
+        start_index = start - 1 if 0 < start <= len(graph) else None
+
     else:
         raise Exception("graph Should be of type Graph|List[List[float]]")
 
-    graph_size = len(adj_matrix)
+    if (start_index is None):
+        raise Exception("Vertex " + str(start) + " Doesn't Exist in Vertex Set")
 
+    return offsets, targets, ids, start_index
 
-    start_index=start-1
 
-    visited = graph_size * [False]
+def _trace_path(ids: List[int], parent: List[int], end_index: int) -> Tuple[int]:
+    """
+    A helper function to follow parent pointers from the end vertex back to the vertex without a parent.
+
+    Params:
+        ids (List[int]): id of every slot index
+        parent (List[int]): Slot index of the parent of every vertex, -1 if it has none
+        end_index (int): Slot index of the end vertex
+
+    Returns:
+        Tuple[int]: path of vertex ids ending at the end vertex
+    """
+    path: List[int] = []
+
+    temp = end_index
+    while (temp != -1):
+        path.append(ids[temp])
+        temp = parent[temp]
+
+    return tuple(reversed(path))
+
+
+def _reverse_arrays(graph: Graph | List[List[float]], offsets: array, targets: array) -> Tuple[array, array]:
+    """
+    A helper function to get the in-edge CSR offset and source arrays used by bottom-up BFS steps.
+
+    Params:
+        graph (Graph | List[List[float]]): Graph or adjacency matrix being traversed
+        offsets (array): CSR offsets returned by _traversal_arrays
+        targets (array): CSR targets returned by _traversal_arrays
+
+    Returns:
+        Tuple[array, array]: offsets and sources arrays of the transposed graph
+    """
+    if (isinstance(graph, Graph)):
+        reverse_offsets, sources, _ = graph.reverse_csr
+        return reverse_offsets, sources
+
+    size = len(offsets) - 1
+    rows = array('q', bytes(8 * len(targets)))
+    for row in range(size):
+        for position in range(offsets[row], offsets[row + 1]):
+            rows[position] = row
+
+    reverse_offsets, sources, _ = _build_csr(size, targets, rows, array('d', bytes(8 * len(targets))))
+    return reverse_offsets, sources
+
+
+def _frontier_bfs_python(offsets, targets, reverse_offsets, sources, start_index: int, stop_index: int,
+                         alpha: float, beta: float, stats: SearchStats | None = None) -> Tuple[array, array]:
+    """
+    A helper function running direction-optimizing BFS with bytearray bitmaps, used when numpy is not installed.
+    See BFS_levels for the parameters.
+    """
+    size = len(offsets) - 1
+    num_edges = len(targets)
+
+    levels = array('q', [-1]) * size
+    parents = array('q', [-1]) * size
+    visited = bytearray(size)
+
+    levels[start_index] = 0
+    visited[start_index] = 1
+
+    frontier = [start_index]
+    frontier_edges = offsets[start_index + 1] - offsets[start_index]
+    unexplored_edges = num_edges - frontier_edges
+    bottom_up = False
+    level = 0
+
+    while frontier and (stop_index == -1 or not visited[stop_index]):
+        level += 1
+
+        if (not bottom_up and frontier_edges > unexplored_edges / alpha):
+            bottom_up = True
+        elif (bottom_up and len(frontier) < size / beta):
+            bottom_up = False
+
+        next_frontier = []
+
+        if (stats is not None):
+            stats.pops += len(frontier)
+
+            if (bottom_up):
+                stats.relaxed += sum(reverse_offsets[vertex + 1] - reverse_offsets[vertex]
+                                     for vertex in range(size) if not visited[vertex])
+            else:
+                stats.relaxed += frontier_edges
+
+        if (bottom_up):
+            in_frontier = bytearray(size)
+            for vertex in frontier:
+                in_frontier[vertex] = 1
+
+            for vertex in range(size):
+                if (visited[vertex]):
+                    continue
+
+                for position in range(reverse_offsets[vertex], reverse_offsets[vertex + 1]):
+                    source = sources[position]
+                    if (in_frontier[source]):
+                        visited[vertex] = 1
+                        levels[vertex] = level
+                        parents[vertex] = source
+                        next_frontier.append(vertex)
+                        break
+        else:
+            for vertex in frontier:
+                for position in range(offsets[vertex], offsets[vertex + 1]):
+                    target = targets[position]
+                    if (not visited[target]):
+                        visited[target] = 1
+                        levels[target] = level
+                        parents[target] = vertex
+                        next_frontier.append(target)
+
+        frontier = next_frontier
+        frontier_edges = sum(offsets[vertex + 1] - offsets[vertex] for vertex in frontier)
+        unexplored_edges -= frontier_edges
+
+        if (stats is not None):
+            stats.settled += len(frontier)
+            stats.pushes += len(frontier)
+
+    return levels, parents
+
+
+def _gather_ranges(offsets, rows):
+    """
+    A helper function returning the positions of all CSR entries of the given rows, and the row of each.
+    """
+    begins = offsets[rows]
+    counts = offsets[rows + 1] - begins
+    total = int(counts.sum())
+
+    run_starts = np.cumsum(counts) - counts
+    positions = np.repeat(begins - run_starts, counts) + np.arange(total)
+
+    return positions, np.repeat(rows, counts)
+
+
+def _frontier_bfs_numpy(offsets, targets, reverse_offsets, sources, start_index: int, stop_index: int,
+                        alpha: float, beta: float, stats: SearchStats | None = None):
+    """
+    A helper function running direction-optimizing BFS where every level is expanded with vectorized numpy
+    operations on bool arrays. See BFS_levels for the parameters.
+    """
+    offsets = np.frombuffer(offsets, dtype=np.int64)
+    targets = np.frombuffer(targets, dtype=np.int64)
+    reverse_offsets = np.frombuffer(reverse_offsets, dtype=np.int64)
+    sources = np.frombuffer(sources, dtype=np.int64)
+
+    size = len(offsets) - 1
+    degrees = np.diff(offsets)
+
+    levels = np.full(size, -1, dtype=np.int64)
+    parents = np.full(size, -1, dtype=np.int64)
+    visited = np.zeros(size, dtype=bool)
+
+    levels[start_index] = 0
     visited[start_index] = True
 
-    parent = graph_size * [-1]
+    frontier = np.array([start_index], dtype=np.int64)
+    frontier_edges = int(degrees[start_index])
+    unexplored_edges = len(targets) - frontier_edges
+    bottom_up = False
+    level = 0
 
-    queue = deque()
+    while len(frontier) and (stop_index == -1 or not visited[stop_index]):
+        level += 1
 
+        if (not bottom_up and frontier_edges > unexplored_edges / alpha):
+            bottom_up = True
+        elif (bottom_up and len(frontier) < size / beta):
+            bottom_up = False
 
-    queue.append(start)
+        if (bottom_up):
+            in_frontier = np.zeros(size, dtype=bool)
+            in_frontier[frontier] = True
 
-    path:List[int] = []
+            positions, owners = _gather_ranges(reverse_offsets, np.flatnonzero(~visited))
+            candidates = sources[positions]
+            hit = in_frontier[candidates]
 
-    while queue:
-        current_vertex= queue.popleft()
+            found, first = np.unique(owners[hit], return_index=True)
+            parents[found] = candidates[hit][first]
+        else:
+            positions, owners = _gather_ranges(offsets, frontier)
+            candidates = targets[positions]
+            fresh = ~visited[candidates]
 
-        current_vertex_index=current_vertex-1
+            found, first = np.unique(candidates[fresh], return_index=True)
+            parents[found] = owners[fresh][first]
 
-        neighbours_indices=[i for i in range(graph_size) if adj_matrix[current_vertex_index][i]!=0]
+        visited[found] = True
+        levels[found] = level
 
-        for neighbour_index in neighbours_indices:
+        if (stats is not None):
+            stats.pops += len(frontier)
+            stats.relaxed += len(positions)
+            stats.settled += len(found)
+            stats.pushes += len(found)
 
+        frontier = found
+        frontier_edges = int(degrees[frontier].sum())
+        unexplored_edges -= frontier_edges
 
-            if(not visited[neighbour_index]):
+    return levels, parents
 
-                parent[neighbour_index]=current_vertex
-                visited[neighbour_index]=True
 
-                if(neighbour_index+1==end):
+def _frontier_bfs(graph: Graph | List[List[float]], offsets: array, targets: array, start_index: int,
+                  stop_index: int, alpha: float, beta: float, stats: SearchStats | None = None):
+    """
+    A helper function dispatching direction-optimizing BFS to the numpy or the pure Python implementation.
+
+    Params:
+        graph (Graph | List[List[float]]): Graph or adjacency matrix being traversed
+        offsets (array): CSR offsets returned by _traversal_arrays
+        targets (array): CSR targets returned by _traversal_arrays
+        start_index (int): Slot index of the start vertex
+        stop_index (int): Slot index of a vertex whose level ends the search once complete, -1 to search the
+            whole graph
+        alpha (float): top-down to bottom-up switching threshold
+        beta (float): bottom-up to top-down switching threshold
+        stats (SearchStats): Optional counters to be filled in by the search, the start vertex counts as settled
+            and pushed. Bottom-up levels count every in-edge of the unvisited vertices as examined
+
+    Returns:
+        Tuple[np.ndarray | array, np.ndarray | array]: level and parent slot index of every slot index
+    """
+    reverse_offsets, sources = _reverse_arrays(graph, offsets, targets)
 
-                    temp=neighbour_index+1
+    if (stats is not None):
+        stats.lap("prepare")
+        stats.settled += 1
+        stats.pushes += 1
 
-                    while(parent[temp-1]!=-1):
-                        path.append(temp)
-                        temp=parent[temp-1]
-                    path.append(start)
+    if (np is not None):
+        search = _frontier_bfs_numpy
+    else:
+        search = _frontier_bfs_python
 
-                    return tuple(reversed(path))
+    levels, parents = search(offsets, targets, reverse_offsets, sources, start_index, stop_index, alpha, beta,
+                             stats)
 
-                queue.append(neighbour_index+1)
-    return tuple()
+    if (stats is not None):
+        stats.lap("search")
 
+    return levels, parents
 
-def DFS(graph: Graph|List[List[float]], start: int, end: int) -> Tuple[int]:
 
+@_instrumented
+def BFS_levels(graph: Graph | List[List[float]], start: int, alpha: float = 14, beta: float = 24,
+               stats: SearchStats | None = None):
     """
-        Runs Depth-First Search (DFS) Algorithm to find a path from start vertex to end vertex.
+        Runs a level synchronous, direction-optimizing Breadth-First Search from the start vertex to the whole graph.
+
+        Every level is expanded either top-down, scanning the out-edges of the frontier, or bottom-up, scanning
+        the in-edges of the unvisited vertices for a frontier vertex. The search switches to bottom-up once the
+        frontier has more than 1 / alpha of the unexplored edges, and back once it has fewer than 1 / beta of
+        the vertices. With numpy installed every level is expanded with vectorized operations on bool arrays,
+        otherwise with bytearray bitmaps.
 
         Args:
-            graph: Graph -> Graph to be searched for
+            graph: Graph | List[List[float]] -> Graph or adjacency matrix to be searched for
+            start: int -> id of the start vertex
+            alpha: float -> top-down to bottom-up switching threshold
+            beta: float -> bottom-up to top-down switching threshold
+            stats: SearchStats -> Optional counters to be filled in by the search, "prepare" covers converting
+            an adjacency matrix and building the in-edge arrays
+
+        Returns:
+            Tuple[np.ndarray | array, np.ndarray | array] -> level (number of edges from start) and parent slot
+            index of every slot index, -1 for unreachable vertices and for the parent of start
+    """
+    offsets, targets, _, start_index = _traversal_arrays(graph, start)
+
+    return _frontier_bfs(graph, offsets, targets, start_index, -1, alpha, beta, stats)
+
+
+@_instrumented
+def BFS(graph: Graph | List[List[float]], start: int, end: int, stats: SearchStats | None = None) -> Tuple[int]:
+    """
+        Runs Breadth-First Search (BFS) Algorithm to find a path from start vertex to end vertex.
+
+        Runs BFS_levels until the level containing the end vertex is complete and follows its parent array, an
+        adjacency matrix is accepted with row i being the vertex with id i + 1.
+
+        Args:
+            graph: Graph | List[List[float]] -> Graph or adjacency matrix to be searched for
             start: int -> id of the start vertex
             end: int -> id of the end vertex
+            stats: SearchStats -> Optional counters to be filled in by the search, see BFS_levels
 
         Returns:
             Tuple[int] -> path from start vertex to end vertex
     """
+    offsets, targets, ids, start_index = _traversal_arrays(graph, start)
 
+    if (isinstance(graph, Graph)):
+        end_index = graph.get_vertex_index(end)
+    else:
+        end_index = end - 1 if 0 < end <= len(ids) else None
 
+    if (end_index is None or end_index == start_index):
+        return tuple()
 
-    if(isinstance(graph,Graph)):
-        adj_matrix=graph.adjacency_matrix
+    if (isinstance(graph, Graph) and _unreachable(graph, start_index, end_index)):
+        return tuple()
 
-    elif(isinstance(graph,list)):
-        for row in graph:
-            if(isinstance(row,list)):
-                if all(isinstance(entry,float|int) for entry in row):
-                    adj_matrix=graph
-                else:
-                    raise Exception("graph Should be of type Graph|List[List[float]]")
-            else:
-                raise Exception("graph Should be of type Graph|List[List[float]]")
-    else:
-        raise Exception("graph Should be of type Graph|List[List[float]]")
+    levels, parents = _frontier_bfs(graph, offsets, targets, start_index, end_index, 14, 24, stats)
+
+    if (levels[end_index] == -1):
+        return tuple()
+
+    path = _trace_path(ids, parents, end_index)
+
+    if (stats is not None):
+        stats.lap("path")
+
+    return path
 
 
-    graph_size = len(adj_matrix)
-    start_index = start - 1
+@_instrumented
+def DFS(graph: Graph | List[List[float]], start: int, end: int, stats: SearchStats | None = None) -> Tuple[int]:
+
+    """
+        Runs Depth-First Search (DFS) Algorithm to find a path from start vertex to end vertex.
+
+        The search walks the CSR arrays of the graph in O(V + E), an adjacency matrix is converted to CSR arrays
+        first, row i being the vertex with id i + 1.
+
+        Args:
+            graph: Graph | List[List[float]] -> Graph or adjacency matrix to be searched for
+            start: int -> id of the start vertex
+            end: int -> id of the end vertex
+            stats: SearchStats -> Optional counters to be filled in by the search
+
+        Returns:
+            Tuple[int] -> path from start vertex to end vertex
+    """
+    offsets, targets, ids, start_index = _traversal_arrays(graph, start)
+
+    if (isinstance(graph, Graph)):
+        end_index = graph.get_vertex_index(end)
+        if (end_index is not None and _unreachable(graph, start_index, end_index)):
+            return tuple()
+
+    if (stats is not None):
+        stats.lap("prepare")
+
+    graph_size = len(ids)
 
     visited = graph_size * [False]
     visited[start_index] = True
@@ -120,42 +433,40 @@ def DFS(graph: Graph|List[List[float]], start: int, end: int) -> Tuple[int]:
 
     stack = []
 
-    stack.append(start)
-
-    path = []
+    stack.append(start_index)
 
     while stack:
 
-        current_vertex = stack.pop()
+        current_index = stack.pop()
 
-        current_vertex_index=current_vertex-1
+        if (stats is not None):
+            stats.settled += 1
+            stats.pops += 1
+            stats.relaxed += offsets[current_index + 1] - offsets[current_index]
 
-        neighbours_indices=[i for i in range(graph_size) if adj_matrix[current_vertex_index][i]!=0]
-
-        for neighbour_index in neighbours_indices:
+        for position in range(offsets[current_index], offsets[current_index + 1]):
+            neighbour_index = targets[position]
 
             if (not visited[neighbour_index]):
 
-                parent[neighbour_index] = current_vertex
+                parent[neighbour_index] = current_index
                 visited[neighbour_index] = True
 
-                if (neighbour_index+1 == end):
-
-                    temp = neighbour_index+1
+                if (ids[neighbour_index] == end):
+                    if (stats is not None):
+                        stats.pushes = stats.pops + len(stack)
+                        stats.lap("search")
 
-                    while (parent[temp-1] != -1):
-                        path.append(temp)
-                        temp = parent[temp - 1]
-                    path.append(start)
+                    return _trace_path(ids, parent, neighbour_index)
 
-                    return tuple(reversed(path))
+                stack.append(neighbour_index)
 
-                stack.append(neighbour_index+1)
+    if (stats is not None):
+        stats.pushes = stats.pops
+        stats.lap("search")
 
     return tuple()
 
-    return []
-
 
 if __name__ == "__main__":
     vertices = [1, 2, 3, 4,5,6]
@@ -1 +1 @@
-__all__=["Flow.fordfulkerson","ShortestPath.belmannford","ShortestPath.dijkstra","Traversal.DFS","Traversal.BFS"]
\ No newline at end of file
+__all__=["Flow.fordfulkerson","Flow.dinic","Flow.push_relabel","Flow.min_cut","Flow.ResidualGraph","Flow.max_flow","Flow.FlowResult","ShortestPath.belmannford","ShortestPath.NegativeCycleError","ShortestPath.dijkstra","ShortestPath.floydwarshall","Traversal.DFS","Traversal.BFS","Traversal.BFS_levels","ShortestPath.bidirectional_dijkstra","ShortestPath.astar","Landmarks.LandmarkIndex","Landmarks.alt","ContractionHierarchy.ContractionHierarchy","Batch.batch_dijkstra","Batch.multi_source_dijkstra","Heap.IndexedHeap","Dynamic.DynamicShortestPaths","Cache.QueryCache","Cache.CacheStats","Instrumentation.SearchStats","Instrumentation.Profile","Instrumentation.instrument","Components.weakly_connected_components","Components.strongly_connected_components"]
\ No newline at end of file
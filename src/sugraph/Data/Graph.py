@@ -1,7 +1,16 @@
 import dataclasses
+from array import array
 from collections import defaultdict
+from bisect import bisect_right
+from itertools import repeat
+from math import inf
 from typing import Any, Set, Iterable, Tuple, List, DefaultDict, Dict
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 @dataclasses.dataclass
 class Vertex():
@@ -41,13 +50,169 @@ class Edge():
     weight: float
 
 
+_CHANGE_LOG_SIZE = 4096
+
+
+def _to_array(typecode: str, values) -> array:
+    """
+    A helper function to copy a numpy array into a stdlib array of the matching typecode in one pass.
+
+    Params:
+        typecode (str): 'q' for int64 or 'd' for float64 values
+        values (np.ndarray): Values to be copied
+
+    Returns:
+        array: stdlib array holding values
+    """
+    result = array(typecode)
+    result.frombytes(np.ascontiguousarray(values, dtype=np.int64 if typecode == 'q' else np.float64).tobytes())
+    return result
+
+
+def _build_csr(num_rows: int, sources: array, targets: array, weights: array) -> Tuple[array, array, array]:
+    """
+    A helper function to pack coordinate (source, target, weight) arrays into compressed sparse row form.
+
+    Params:
+        num_rows (int): Number of rows (vertices) of the resulting structure
+        sources (array): Row index of every edge
+        targets (array): Column index of every edge
+        weights (array): Weight of every edge
+
+    Returns:
+        Tuple[array, array, array]: offsets, targets and weights arrays, where the neighbours of row i are
+        stored in targets[offsets[i]:offsets[i + 1]], in the order they were given
+    """
+    if (np is not None and len(sources) > 0):
+        source_array = np.frombuffer(sources, dtype=np.int64)
+        order = np.argsort(source_array, kind="stable")
+
+        offsets = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source_array, minlength=num_rows), out=offsets[1:])
+
+        return (_to_array('q', offsets),
+                _to_array('q', np.frombuffer(targets, dtype=np.int64)[order]),
+                _to_array('d', np.frombuffer(weights, dtype=np.float64)[order]))
+
+    offsets = array('q', bytes(8 * (num_rows + 1)))
+
+    for source in sources:
+        offsets[source + 1] += 1
+
+    for i in range(num_rows):
+        offsets[i + 1] += offsets[i]
+
+    cursor = array('q', offsets)
+    csr_targets = array('q', bytes(8 * len(targets)))
+    csr_weights = array('d', bytes(8 * len(weights)))
+
+    for source, target, weight in zip(sources, targets, weights):
+        position = cursor[source]
+        csr_targets[position] = target
+        csr_weights[position] = weight
+        cursor[source] = position + 1
+
+    return offsets, csr_targets, csr_weights
+
+
+def _as_numpy(values, dtype) -> "np.ndarray":
+    """
+    A helper function to convert a sequence, buffer or iterator to a numpy array, iterators are consumed once.
+
+    Params:
+        values (Iterable): Values to be converted
+        dtype (np.dtype): Type of the resulting array
+
+    Returns:
+        np.ndarray: values as a one dimensional array, shared with values when possible
+    """
+    if (hasattr(values, "__len__")):
+        return np.asarray(values, dtype=dtype).reshape(-1)
+
+    return np.fromiter(values, dtype=dtype)
+
+
+def _csr_rows(offsets) -> "np.ndarray":
+    """
+    A helper function to expand CSR offsets into the row index of every edge.
+
+    Params:
+        offsets (array[int]): Offsets array of a CSR structure
+
+    Returns:
+        np.ndarray: row index of every position of the targets array
+    """
+    offsets = np.frombuffer(offsets, dtype=np.int64)
+    return np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))
+
+
+def _lookup_slots(vertex_ids: "np.ndarray", ids: "np.ndarray") -> "np.ndarray":
+    """
+    A helper function to translate vertex IDs to slot indices with a vectorized binary search.
+
+    Params:
+        vertex_ids (np.ndarray): Unique vertex IDs, in slot order
+        ids (np.ndarray): Vertex IDs to be translated
+
+    Raises:
+        Exception: If an ID is not in vertex_ids
+
+    Returns:
+        np.ndarray: slot index of every ID
+    """
+    if (len(ids) == 0):
+        return np.zeros(0, dtype=np.int64)
+
+    order = np.argsort(vertex_ids)
+    sorted_ids = vertex_ids[order]
+
+    positions = np.minimum(np.searchsorted(sorted_ids, ids), max(len(sorted_ids) - 1, 0))
+
+    if (len(sorted_ids) == 0 or np.any(sorted_ids[positions] != ids)):
+        raise Exception("An End Point of Vertex Doesn't Exist in Vertex Set")
+
+    return order[positions]
+
+
+def _first_occurrences(keys: "np.ndarray") -> "np.ndarray":
+    """
+    A helper function to find the first occurrence of every distinct key with a sort.
+
+    Params:
+        keys (np.ndarray): Keys, possibly repeated
+
+    Returns:
+        np.ndarray: positions of the first occurrence of every distinct key, in increasing order
+    """
+    _, first = np.unique(keys, return_index=True)
+    return np.sort(first)
+
+
 class Graph():
     """
     Graph Data Structure
 
+    Vertex IDs are arbitrary integers, internally every vertex is stored at a contiguous slot index given
+    by its position in _vertices. Edges are stored in compressed sparse row (CSR) form over slot indices:
+    the neighbours of the vertex at slot i are _targets[_offsets[i]:_offsets[i + 1]] with weights
+    _weights[_offsets[i]:_offsets[i + 1]]. The CSR arrays are stdlib arrays, or read-only memoryviews of a
+    memory mapped file for graphs loaded from the binary format, which are replaced by arrays on mutation.
+
     Protected Variables:
-        _vertices (Set[Vertex]): Set of Vertices
-        _edges (List[Tuple[Vertex, Vertex]]): List of edges of graph, where each edge is a Vertex, Vertex pair
+        _vertices (List[Vertex]): List of Vertices, in slot order
+        _index (Dict[int, int]): Lookup table from vertex ID to slot index
+        _offsets (array[int]): Start of the neighbour range of every slot, of length graph_size + 1
+        _targets (array[int]): Slot index of the target of every edge
+        _weights (array[float]): Weight of every edge
+        _pending (DefaultDict[int, List[Tuple[int, float]]]): Edges added after construction, merged into
+            the CSR arrays on next read
+        _adjacency_matrix (List[List[float]] | None): Dense matrix cache, built on first access
+        _adjacency_array (np.ndarray | None): Read-only numpy matrix cache, built on first access
+        _reverse_csr (Tuple[array, array, array] | None): CSR arrays of the in-edges, built on first access
+        _version (int): Number of changes made to the vertices and edges since construction
+        _change_log (List[Tuple[int, int, int, float, float]]): (version, source index, target index, old weight,
+            new weight) of the latest edge changes, old weight is inf for added edges
+        _log_start (int): Oldest version whose later edge changes are all in _change_log
     """
 
     def __init__(self,
@@ -58,8 +223,10 @@ class Graph():
         Constructor
 
         Params:
-            vertices (Iterable[Vertex | Any]): List of vertices of graph, duplicate vertices will be eliminated
-            edges (Iterable[Tuple[int, int, float]]): List of vertex pairs, representing the edges of graph
+            vertices (Iterable[Vertex | int]): List of vertices of graph, integers are used as vertex IDs.
+                Vertices with duplicate IDs will be eliminated, keeping the first occurrence
+            edges (Iterable[Tuple[int, int, float]]): List of vertex pairs, representing the edges of graph.
+                Both arguments are iterated once, so generators can be passed
 
         Raises:
             Exception: If a node of a vertex doesn't exist in the vertex set
@@ -68,61 +235,100 @@ class Graph():
             Initializes the following variables:
                 Protected:
                     _vertices (List[Vertex]): List of Unique Vertices
-                    _edges (DefaultDict[int, List[Edge]]): Lookup table for neighbours of a vertex
+                    _index (Dict[int, int]): Vertex ID to slot index lookup table
+                    _offsets, _targets, _weights (array): CSR representation of the edges
                     _size (int): Number of vertices
                     _num_edges (int): Number of edges between vertices
+                    _adjacency_matrix, _adjacency_array, _reverse_csr (None): Derived caches, built lazily
         """
-        if (isinstance(vertices, Iterable)):
-            if(not vertices):
-                self._vertices: List[Vertex] = []
-
-            elif all(isinstance(vertex, Vertex) for vertex in vertices):
-                self._vertices: List[Vertex] = [vertex for vertex in set(vertices)]
+        if (not isinstance(vertices, Iterable)):
+            raise Exception("Vertices Should be of type Iterable[Vertex | Any]")
 
-            elif all(isinstance(vertex, int) for vertex in vertices):
-                self._vertices: List[Vertex] = [Vertex(v_id=idx + 1, value=data) for idx, data in
-                                                enumerate(set(vertices))]
+        index: Dict[int, int] = {}
+        unique_vertices: List[Vertex] = []
+        vertex_type = None
 
+        for vertex in vertices:
+            if (isinstance(vertex, Vertex)):
+                current_type = Vertex
+            elif (isinstance(vertex, int)):
+                current_type = int
+                vertex = Vertex(v_id=vertex, value=vertex)
             else:
                 raise Exception("Vertices Should be of type Iterable[Vertex | Any]")
-        else:
-            raise Exception("Vertices Should be of type Iterable[Vertex | Any]")
 
-        if (isinstance(edges, Iterable)):
-
-            if(not edges):
-                self._edges: DefaultDict[int, List[Edge]] = defaultdict(list)
-
-            elif all(isinstance(edge, Tuple) for edge in edges):
-                if all(isinstance(edge[0], int) and isinstance(edge[1], int) for edge in edges):
-                    self._edges: DefaultDict[int, List[Edge]] = defaultdict(list)
-                    for edge_tuple in edges:
-                        source = edge_tuple[0]
-                        target = edge_tuple[1]
-                        if (len(edge_tuple) == 3):
-                            weight = edge_tuple[2]
-                        elif (len(edge_tuple) == 2):
-                            weight = 1
-                        else:
-                            raise Exception(
-                                "Edges Should be of type Iterable[Tuple[int, int]] or Iterable[Tuple[int, int, float]]")
-
-                        if not (self.does_vertex_exist(source) != None and self.does_vertex_exist(target) != None):
-                            raise Exception("An End Point of Vertex Doesn't Exist in Vertex Set")
-
-                        edge = Edge(target=target, weight=weight)
-                        self._edges[source].append(edge)
-                else:
-                    raise Exception("Edges Should be of type Iterable[Tuple[int, int]]")
-            else:
-                raise Exception("Edges Should be of type Iterable[Tuple[int, int]]")
-        else:
+            if (vertex_type is None):
+                vertex_type = current_type
+            elif (vertex_type is not current_type):
+                raise Exception("Vertices Should be of type Iterable[Vertex | Any]")
+
+            if (vertex.v_id not in index):
+                index[vertex.v_id] = len(unique_vertices)
+                unique_vertices.append(vertex)
+
+        sources = array('q')
+        targets = array('q')
+        weights = array('d')
+
+        if (not isinstance(edges, Iterable)):
             raise Exception("Edges Should be of type Iterable[Tuple[int, int]]")
 
-        self._size: int = len(self._vertices)
-        self._num_edges: int = len(self._edges)
+        for edge_tuple in edges:
+            if (not (isinstance(edge_tuple, Tuple) and len(edge_tuple) >= 2
+                     and isinstance(edge_tuple[0], int) and isinstance(edge_tuple[1], int))):
+                raise Exception("Edges Should be of type Iterable[Tuple[int, int]]")
+
+            source = edge_tuple[0]
+            target = edge_tuple[1]
+            if (len(edge_tuple) == 3):
+                weight = edge_tuple[2]
+            elif (len(edge_tuple) == 2):
+                weight = 1
+            else:
+                raise Exception(
+                    "Edges Should be of type Iterable[Tuple[int, int]] or Iterable[Tuple[int, int, float]]")
+
+            if not (source in index and target in index):
+                raise Exception("An End Point of Vertex Doesn't Exist in Vertex Set")
+
+            sources.append(index[source])
+            targets.append(index[target])
+            weights.append(weight)
+
+        self._assemble(unique_vertices, index, *_build_csr(len(unique_vertices), sources, targets, weights))
+
+    def _assemble(self, vertices: List[Vertex], index: Dict[int, int],
+                  offsets: array, targets: array, weights: array) -> None:
+        """
+        A helper function to set the storage of graph from unique vertices and validated CSR arrays.
+
+        Params:
+            vertices (List[Vertex]): Unique vertices, in slot order
+            index (Dict[int, int]): Vertex ID to slot index lookup table of vertices
+            offsets (array[int] | memoryview): Start of the neighbour range of every slot
+            targets (array[int] | memoryview): Slot index of the target of every edge
+            weights (array[float] | memoryview): Weight of every edge
+
+        Functionality:
+            Initializes every protected variable listed in the constructor
+        """
+        self._vertices: List[Vertex] = vertices
+        self._index: Dict[int, int] = index
+
+        self._size: int = len(vertices)
+        self._next_id: int = max(index, default=0) + 1
+
+        self._offsets, self._targets, self._weights = offsets, targets, weights
+        self._pending: DefaultDict[int, List[Tuple[int, float]]] = defaultdict(list)
+        self._num_edges: int = len(self._targets)
 
-        self._create_adjacency_matrix()
+        self._adjacency_matrix: List[List[float]] | None = None
+        self._adjacency_array = None
+        self._reverse_csr: Tuple[array, array, array] | None = None
+
+        self._version: int = 0
+        self._change_log: List[Tuple[int, int, int, float, float]] = []
+        self._log_start: int = 0
 
     @staticmethod
     def from_adjacency_matrix(adj_matrix: [List[List[float]]]):
@@ -145,30 +351,153 @@ class Graph():
 
         return graph
 
+    @staticmethod
+    def from_arrays(sources, targets, weights=None, vertices=None) -> "Graph":
+        """
+        Builds a graph from parallel arrays of edge end points, validating and deduplicating them with
+        vectorized sorts instead of per-edge checks.
+
+        Params:
+            sources (Iterable[int]): ID of the source vertex of every edge
+            targets (Iterable[int]): ID of the target vertex of every edge
+            weights (Iterable[float] | None): Weight of every edge, 1 for every edge if None
+            vertices (Iterable[int] | None): Vertex IDs, duplicates are eliminated keeping the first occurrence.
+                If None, the IDs appearing in sources and targets in increasing order
+            Every argument may be a numpy array, a sequence or a generator, each is iterated once.
+
+        Raises:
+            Exception: If the arrays have different lengths or an end point doesn't exist in vertices
+
+        Returns:
+            Graph: Graph of the edges, repeated (source, target) pairs keep their first occurrence
+        """
+        if (np is None):
+            edges = {}
+            for source, target, weight in zip(sources, targets, weights if weights is not None else repeat(1)):
+                edges.setdefault((source, target), weight)
+
+            if (vertices is None):
+                vertices = sorted({v_id for edge in edges for v_id in edge})
+
+            return Graph(vertices, [(source, target, weight) for (source, target), weight in edges.items()])
+
+        sources = _as_numpy(sources, np.int64)
+        targets = _as_numpy(targets, np.int64)
+        weights = np.ones(len(sources)) if weights is None else _as_numpy(weights, np.float64)
+
+        if (len(sources) != len(targets) or len(weights) != len(sources)):
+            raise Exception("Edge arrays should have the same length")
 
+        if (vertices is None):
+            vertex_ids, slots = np.unique(np.concatenate((sources, targets)), return_inverse=True)
+            source_slots, target_slots = slots[:len(sources)], slots[len(sources):]
+        else:
+            vertex_ids = _as_numpy(vertices, np.int64)
+            vertex_ids = vertex_ids[_first_occurrences(vertex_ids)]
+
+            source_slots = _lookup_slots(vertex_ids, sources)
+            target_slots = _lookup_slots(vertex_ids, targets)
+
+        size = len(vertex_ids)
+
+        kept = _first_occurrences(source_slots * size + target_slots)
+
+        vertex_list = vertex_ids.tolist()
 
-    def _create_adjacency_matrix(self) -> None:
+        graph = Graph.__new__(Graph)
+        graph._assemble([Vertex(v_id=v_id, value=v_id) for v_id in vertex_list],
+                        {v_id: slot for slot, v_id in enumerate(vertex_list)},
+                        *_build_csr(size, source_slots[kept], target_slots[kept],
+                                    np.ascontiguousarray(weights[kept])))
+
+        return graph
+
+    def _compact(self) -> None:
         """
-        A helper function to create adjacency matrix representation of graph during constructor call.
+        A helper function to merge edges added through add_edge into the CSR arrays.
 
         Params:
             None
 
         Functionality:
-            Creates adjacency matrix:
-                _adjacency_matrix (np.ndarray[int])
+            Rebuilds _offsets, _targets and _weights in O(V + E) and clears _pending
         """
+        if (not self._pending):
+            return
+
+        if (np is not None):
+            pending_sources = [row for row, edges in self._pending.items() for _ in edges]
+            pending_edges = [edge for edges in self._pending.values() for edge in edges]
+
+            sources = np.concatenate((_csr_rows(self._offsets),
+                                      np.array(pending_sources, dtype=np.int64)))
+            targets = np.concatenate((np.frombuffer(self._targets, dtype=np.int64),
+                                      np.array([target for target, _ in pending_edges], dtype=np.int64)))
+            weights = np.concatenate((np.frombuffer(self._weights, dtype=np.float64),
+                                      np.array([weight for _, weight in pending_edges], dtype=np.float64)))
+
+            self._offsets, self._targets, self._weights = _build_csr(self._size, sources, targets, weights)
+            self._pending = defaultdict(list)
+            return
+
+        sources = array('q')
+        targets = array('q')
+        weights = array('d')
+
+        for row in range(self._size):
+            for position in range(self._offsets[row], self._offsets[row + 1]):
+                sources.append(row)
+                targets.append(self._targets[position])
+                weights.append(self._weights[position])
+
+            for target, weight in self._pending.get(row, ()):
+                sources.append(row)
+                targets.append(target)
+                weights.append(weight)
+
+        self._offsets, self._targets, self._weights = _build_csr(self._size, sources, targets, weights)
+        self._pending = defaultdict(list)
+
+    def _create_adjacency_matrix(self) -> List[List[float]]:
+        """
+        A helper function to create adjacency matrix representation of graph from the CSR arrays.
+
+        Params:
+            None
+
+        Returns:
+            List[List[float]]: Dense V x V adjacency matrix
+        """
+        offsets, targets, weights = self.csr
 
         adjacency_matrix = [[0] * self.graph_size for _ in range(self.graph_size)]
 
-        for vertex in self._vertices:
-            current_index = vertex.v_id - 1
-            for neighbour in self._edges[vertex.v_id]:
-                neighbour_index = neighbour.target - 1
+        for current_index in range(self.graph_size):
+            row = adjacency_matrix[current_index]
+            for position in range(offsets[current_index], offsets[current_index + 1]):
+                row[targets[position]] = weights[position]
 
-                adjacency_matrix[current_index][neighbour_index] = neighbour.weight
+        return adjacency_matrix
 
-        self._adjacency_matrix = adjacency_matrix
+    def _create_adjacency_array(self):
+        """
+        A helper function to create a numpy adjacency matrix of graph from the CSR arrays.
+
+        Params:
+            None
+
+        Returns:
+            np.ndarray[float]: Dense V x V adjacency matrix
+        """
+        offsets, targets, weights = self.csr
+
+        adjacency_array = np.zeros((self.graph_size, self.graph_size), dtype=np.float64)
+
+        if (len(targets)):
+            rows = np.repeat(np.arange(self.graph_size), np.diff(np.frombuffer(offsets, dtype=np.int64)))
+            adjacency_array[rows, np.frombuffer(targets, dtype=np.int64)] = np.frombuffer(weights, dtype=np.float64)
+
+        return adjacency_array
 
     def get_vertex_data(self, vertex_id: int) -> Vertex | None:
         """
@@ -180,42 +509,247 @@ class Graph():
         Returns:
             Vertex: Data associated with the vertex, or None if the vertex does not exist.
         """
-        for v in self._vertices:
-            if (v.v_id == vertex_id):
-                return v.value
-        return None
+        slot = self._index.get(vertex_id)
+        if (slot is None):
+            return None
+        return self._vertices[slot].value
 
     def set_vertex_data(self, vertex_id, value: Any) -> None:
-        for v in self._vertices:
-            if v.v_id == vertex_id:
-                v.value = value
+        slot = self._index.get(vertex_id)
+        if (slot is not None):
+            self._vertices[slot].value = value
 
-    def add_vertex(self, data):
+    def get_vertex_index(self, vertex_id: int) -> int | None:
+        """
+        Retrieves the slot index of a vertex, which is its row in the CSR arrays and the adjacency matrix.
 
-        self._size += 1
+        Params:
+            vertex_id (int): ID of the vertex.
 
-        vertex = Vertex(self.graph_size, data)
+        Returns:
+            int: Slot index of the vertex, or None if the vertex does not exist.
+        """
+        return self._index.get(vertex_id)
+
+    def get_vertex_id(self, vertex_index: int) -> int:
+        """
+        Retrieves the ID of the vertex stored at a slot index.
+
+        Params:
+            vertex_index (int): Slot index of the vertex.
+
+        Returns:
+            int: ID of the vertex.
+        """
+        return self._vertices[vertex_index].v_id
 
+    def add_vertex(self, data) -> int:
+        """
+        Adds a new vertex to the graph, its ID is one larger than the largest ID in the graph.
+
+        Params:
+            data (Any): Value associated with the vertex.
+
+        Returns:
+            int: ID of the new vertex.
+        """
+        vertex = Vertex(self._next_id, data)
+        self._next_id += 1
+
+        self._index[vertex.v_id] = self._size
         self._vertices.append(vertex)
 
-        for row in self._adjacency_matrix:
-            row.append(0)
+        self._size += 1
+
+        if (not isinstance(self._offsets, array)):
+            self._offsets = array('q', self._offsets)
+        self._offsets.append(self._offsets[-1])
 
-        self._adjacency_matrix.append([0]*self.graph_size)
+        self._adjacency_matrix = None
+        self._adjacency_array = None
+        self._reverse_csr = None
+
+        self._version += 1
+
+        return vertex.v_id
 
     def add_edge(self, source: int, target: int, weight: float):
 
-        targets = [edge.target for edge in self._edges[source]]
+        source_index = self._index.get(source)
+        target_index = self._index.get(target)
+
+        if (source_index is None or target_index is None):
+            raise Exception("An End Point of Vertex Doesn't Exist in Vertex Set")
+
+        pending = self._pending[source_index]
+
+        if (target_index in self._targets[self._offsets[source_index]:self._offsets[source_index + 1]]):
+            return
+
+        if (any(pending_target == target_index for pending_target, _ in pending)):
+            return
+
+        pending.append((target_index, weight))
+
+        self._num_edges += 1
+
+        if (self._adjacency_matrix is not None):
+            self._adjacency_matrix[source_index][target_index] = weight
+        self._adjacency_array = None
+        self._reverse_csr = None
 
-        if (target not in targets):
+        self._log_change(source_index, target_index, inf, weight)
 
-            self._edges[source].append(Edge(target=target, weight=weight))
+    def set_edge_weight(self, source: int, target: int, weight: float) -> None:
+        """
+        Changes the weight of the edge from source to target, the first one if there are parallel edges.
+
+        Params:
+            source (int): ID of the source vertex
+            target (int): ID of the target vertex
+            weight (float): New weight of the edge
+
+        Raises:
+            Exception: If there is no edge from source to target
+        """
+        source_index = self._index.get(source)
+        target_index = self._index.get(target)
+
+        if (source_index is None or target_index is None):
+            raise Exception("An End Point of Vertex Doesn't Exist in Vertex Set")
+
+        self._compact()
+
+        for position in range(self._offsets[source_index], self._offsets[source_index + 1]):
+            if (self._targets[position] == target_index):
+                break
+        else:
+            raise Exception("Edge Doesn't Exist in Edge Set")
+
+        if (not isinstance(self._weights, array)):
+            self._weights = array('d', self._weights)
+
+        old_weight = self._weights[position]
+        self._weights[position] = weight
+
+        # The dense matrices hold the last of parallel edges, so the cached one only changes if this edge is it
+        end = self._offsets[source_index + 1]
+        if (self._adjacency_matrix is not None and target_index not in self._targets[position + 1:end]):
+            self._adjacency_matrix[source_index][target_index] = weight
+        self._adjacency_array = None
+        self._reverse_csr = None
+
+        self._log_change(source_index, target_index, old_weight, weight)
+
+    def _log_change(self, source_index: int, target_index: int, old_weight: float, new_weight: float) -> None:
+        """
+        A helper function to count a new version of graph and record the edge change that caused it.
+
+        Params:
+            source_index (int): Slot index of the source of the edge
+            target_index (int): Slot index of the target of the edge
+            old_weight (float): Weight before the change, inf for an added edge
+            new_weight (float): Weight after the change
+
+        Functionality:
+            Increments _version and appends to _change_log, dropping its older half once it holds
+            _CHANGE_LOG_SIZE entries
+        """
+        self._version += 1
+        self._change_log.append((self._version, source_index, target_index, old_weight, new_weight))
+
+        if (len(self._change_log) >= _CHANGE_LOG_SIZE):
+            dropped = len(self._change_log) // 2
+            self._log_start = self._change_log[dropped - 1][0]
+            del self._change_log[:dropped]
+
+    def changes_since(self, version: int) -> List[Tuple[int, int, float, float]] | None:
+        """
+        Retrieves the edge changes made after a version of graph, for caches that repair themselves
+        instead of recomputing.
+
+        Params:
+            version (int): Version of graph, as read from the version property
+
+        Returns:
+            List[Tuple[int, int, float, float]] | None: (source index, target index, old weight, new weight) of
+            every edge change in order, old weight is inf for added edges. None if the changes are no longer
+            known, the log being bounded, or not expressible as edge changes
+        """
+        if (version < self._log_start):
+            return None
 
+        first = bisect_right(self._change_log, version, key=lambda change: change[0])
 
-            self._adjacency_matrix[source-1][target-1] = weight
+        return [change[1:] for change in self._change_log[first:]]
 
-            self._num_edges += 1
 
+    def add_edges(self, sources, targets, weights=None) -> int:
+        """
+        Adds many edges at once. Like add_edge, edges whose (source, target) pair already exists in the graph
+        or earlier in the arguments are ignored, duplicates are found with vectorized sorts.
+
+        Params:
+            sources (Iterable[int]): ID of the source vertex of every edge
+            targets (Iterable[int]): ID of the target vertex of every edge
+            weights (Iterable[float] | None): Weight of every edge, 1 for every edge if None
+            Every argument may be a numpy array, a sequence or a generator, each is iterated once.
+
+        Raises:
+            Exception: If the arrays have different lengths or an end point doesn't exist in the vertex set
+
+        Returns:
+            int: Number of edges added
+        """
+        if (np is None):
+            num_edges = self._num_edges
+            for source, target, weight in zip(sources, targets, weights if weights is not None else repeat(1)):
+                self.add_edge(source, target, weight)
+            return self._num_edges - num_edges
+
+        sources = _as_numpy(sources, np.int64)
+        targets = _as_numpy(targets, np.int64)
+        weights = np.ones(len(sources)) if weights is None else _as_numpy(weights, np.float64)
+
+        if (len(sources) != len(targets) or len(weights) != len(sources)):
+            raise Exception("Edge arrays should have the same length")
+
+        vertex_ids = np.fromiter(self._index.keys(), dtype=np.int64, count=self._size)
+        source_slots = _lookup_slots(vertex_ids, sources)
+        target_slots = _lookup_slots(vertex_ids, targets)
+
+        offsets, current_targets, current_weights = self.csr
+        current_targets = np.frombuffer(current_targets, dtype=np.int64)
+        current_sources = _csr_rows(offsets)
+
+        keys = source_slots * self._size + target_slots
+        kept = _first_occurrences(keys)
+        kept = kept[~np.isin(keys[kept], current_sources * self._size + current_targets)]
+
+        if (len(kept) == 0):
+            return 0
+
+        self._offsets, self._targets, self._weights = _build_csr(
+            self._size,
+            np.concatenate((current_sources, source_slots[kept])),
+            np.concatenate((current_targets, target_slots[kept])),
+            np.concatenate((np.frombuffer(current_weights, dtype=np.float64), weights[kept])))
+        self._num_edges = len(self._targets)
+
+        self._adjacency_matrix = None
+        self._adjacency_array = None
+        self._reverse_csr = None
+
+        if (len(kept) >= _CHANGE_LOG_SIZE):
+            self._version += 1
+            self._change_log = []
+            self._log_start = self._version
+        else:
+            for source_index, target_index, weight in zip(source_slots[kept].tolist(), target_slots[kept].tolist(),
+                                                          weights[kept].tolist()):
+                self._log_change(source_index, target_index, inf, weight)
+
+        return len(kept)
 
     def get_neighbours(self, vertex_id: int) -> List[Edge]:
         """
@@ -227,7 +761,15 @@ class Graph():
         Returns:
             List[Edge]: List of edges representing the neighbours of the vertex.
         """
-        return self._edges[vertex_id]
+        row = self._index.get(vertex_id)
+        if (row is None):
+            return []
+
+        offsets, targets, weights = self.csr
+        vertices = self._vertices
+
+        return [Edge(target=vertices[targets[position]].v_id, weight=weights[position])
+                for position in range(offsets[row], offsets[row + 1])]
 
     def does_vertex_exist(self, vertex_id: int) -> bool:
         """
@@ -239,7 +781,50 @@ class Graph():
         Returns:
             bool: True if the vertex exists, False otherwise.
         """
-        return vertex_id in [v.v_id for v in self._vertices]
+        return vertex_id in self._index
+
+    @property
+    def csr(self) -> Tuple[array, array, array]:
+        """
+        Retrieves the compressed sparse row arrays of the graph.
+
+        The neighbours of the vertex at slot index i are targets[offsets[i]:offsets[i + 1]], stored as slot
+        indices, with the matching weights at the same positions. Slot indices are converted to and from
+        vertex IDs through get_vertex_id and get_vertex_index. The arrays are shared with the graph
+        and support the buffer protocol, so numpy.frombuffer can view them without copying.
+
+        Returns:
+            Tuple[array, array, array]: offsets, targets and weights arrays
+        """
+        self._compact()
+        return self._offsets, self._targets, self._weights
+
+    @property
+    def reverse_csr(self) -> Tuple[array, array, array]:
+        """
+        Retrieves the compressed sparse row arrays of the transposed graph.
+
+        The vertices with an edge into the vertex at slot index i are sources[offsets[i]:offsets[i + 1]],
+        with the matching weights at the same positions. The arrays are built on first access and cached
+        until the graph changes.
+
+        Returns:
+            Tuple[array, array, array]: offsets, sources and weights arrays
+        """
+        if (self._reverse_csr is None):
+            offsets, targets, weights = self.csr
+
+            if (np is not None):
+                sources = _to_array('q', _csr_rows(offsets))
+            else:
+                sources = array('q', bytes(8 * len(targets)))
+                for row in range(self.graph_size):
+                    for position in range(offsets[row], offsets[row + 1]):
+                        sources[position] = row
+
+            self._reverse_csr = _build_csr(self.graph_size, targets, sources, weights)
+
+        return self._reverse_csr
 
     @property
     def edges(self):
@@ -249,10 +834,13 @@ class Graph():
         Returns:
             List[Tuple[int, int, float]]: List of edges in the graph.
         """
+        offsets, targets, weights = self.csr
+        ids = self.vertices
+
         edge_list = []
-        for source, s_edges in self._edges.items():
-            for e in s_edges:
-                edge_list.append((source, e.target, e.weight))
+        for row in range(self.graph_size):
+            for position in range(offsets[row], offsets[row + 1]):
+                edge_list.append((ids[row], ids[targets[position]], weights[position]))
         return edge_list
 
     @property
@@ -261,7 +849,7 @@ class Graph():
         Retrieves the list of vertices in the graph.
 
         Returns:
-            List[int]: List of vertex IDs in the graph.
+            List[int]: List of vertex IDs in the graph, in slot index order.
         """
         return [vertex.v_id for vertex in self._vertices]
 
@@ -275,15 +863,215 @@ class Graph():
         """
         return self._size
 
+    @property
+    def num_edges(self):
+        """
+        Retrieves the number of edges of the graph.
+
+        Returns:
+            int: Number of edges in the graph.
+        """
+        return self._num_edges
+
+    @property
+    def version(self) -> int:
+        """
+        Retrieves the version of the graph, incremented by every change of its vertices or edges, so that
+        results computed at an older version can be recognised as stale.
+
+        Returns:
+            int: Version of graph
+        """
+        return self._version
+
     @property
     def adjacency_matrix(self):
         """
         Retrieves the adjacency matrix of the graph.
 
+        Row and column i belong to the vertex at slot index i. The matrix is built from the CSR arrays on
+        first access and cached until the graph changes.
+        The rows returned are copies, so callers may modify them freely.
+
+        Returns:
+            List[List[float]]: Adjacency matrix of the graph.
+        """
+        if (self._adjacency_matrix is None):
+            self._adjacency_matrix = self._create_adjacency_matrix()
+
+        return [row.copy() for row in self._adjacency_matrix]
+
+    @property
+    def adjacency_array(self):
+        """
+        Retrieves the adjacency matrix of the graph as a read-only numpy array.
+
+        The array is built on first access and cached until the graph changes. It is returned without
+        copying, a modified copy can be obtained through adjacency_array.copy().
+
+        Raises:
+            ImportError: If numpy is not installed
+
         Returns:
-            np.ndarray[int]: Adjacency matrix of the graph.
+            np.ndarray[float]: Read-only V x V adjacency matrix of the graph.
+        """
+        if (np is None):
+            raise ImportError("numpy is required for adjacency_array")
+
+        if (self._adjacency_array is None):
+            self._adjacency_array = self._create_adjacency_array()
+            self._adjacency_array.flags.writeable = False
+
+        return self._adjacency_array
+
+
+
+class GraphBuilder():
+    """
+    Collects vertices and edges one at a time into flat arrays and assembles them into a Graph in one pass,
+    for readers that stream large files and cannot hold an intermediate list of tuples.
+
+    Edges may be added before their end points, they are checked when the graph is built.
+
+    Protected Variables:
+        _vertices (List[Vertex]): Unique vertices, in order of addition
+        _index (Dict[int, int]): Vertex ID to slot index lookup table
+        _sources (array[int]): Source vertex ID of every edge
+        _targets (array[int]): Target vertex ID of every edge
+        _weights (array[float]): Weight of every edge
+    """
+
+    def __init__(self):
+        """
+        Constructor, creates an empty builder.
         """
-        return self._adjacency_matrix.copy()
+        self._vertices: List[Vertex] = []
+        self._index: Dict[int, int] = {}
+        self._sources = array('q')
+        self._targets = array('q')
+        self._weights = array('d')
+
+    def add_vertex(self, v_id: int, value: Any = None) -> None:
+        """
+        Adds a vertex, a vertex with an already added ID is ignored.
+
+        Params:
+            v_id (int): ID of the vertex
+            value (Any): Value associated with the vertex
+        """
+        if (v_id not in self._index):
+            self._index[v_id] = len(self._vertices)
+            self._vertices.append(Vertex(v_id=v_id, value=value))
+
+    def add_edge(self, source: int, target: int, weight: float = 1) -> None:
+        """
+        Adds a directed edge.
+
+        Params:
+            source (int): ID of the source vertex
+            target (int): ID of the target vertex
+            weight (float): Weight of the edge
+        """
+        self._sources.append(source)
+        self._targets.append(target)
+        self._weights.append(weight)
+
+    def add_vertices(self, v_ids) -> None:
+        """
+        Adds many vertices without values, already added IDs are ignored.
+
+        Params:
+            v_ids (Iterable[int] | np.ndarray): IDs of the vertices
+        """
+        index = self._index
+        vertices = self._vertices
+
+        for v_id in (v_ids.tolist() if hasattr(v_ids, "tolist") else v_ids):
+            if (v_id not in index):
+                index[v_id] = len(vertices)
+                vertices.append(Vertex(v_id=v_id, value=None))
+
+    def add_edges(self, sources, targets, weights=None) -> None:
+        """
+        Adds many directed edges at once, parsers hand over whole chunks as arrays.
+
+        Params:
+            sources (array[int] | np.ndarray): ID of the source vertex of every edge
+            targets (array[int] | np.ndarray): ID of the target vertex of every edge
+            weights (array[float] | np.ndarray | None): Weight of every edge, 1 for every edge if None
+
+        Raises:
+            Exception: If the arrays have different lengths
+        """
+        if (len(sources) != len(targets) or (weights is not None and len(weights) != len(sources))):
+            raise Exception("Edge arrays should have the same length")
+
+        if (np is not None):
+            self._sources.frombytes(np.ascontiguousarray(sources, dtype=np.int64).tobytes())
+            self._targets.frombytes(np.ascontiguousarray(targets, dtype=np.int64).tobytes())
+
+            if (weights is None):
+                weights = np.ones(len(sources))
+            self._weights.frombytes(np.ascontiguousarray(weights, dtype=np.float64).tobytes())
+        else:
+            self._sources.extend(sources)
+            self._targets.extend(targets)
+            self._weights.extend(weights if weights is not None else [1.0] * len(sources))
+
+    @property
+    def num_edges(self) -> int:
+        """
+        Retrieves the number of edges added so far.
+
+        Returns:
+            int: Number of edges
+        """
+        return len(self._sources)
+
+    def build(self) -> Graph:
+        """
+        Assembles the collected vertices and edges into a graph.
+
+        Raises:
+            Exception: If an end point of an edge was never added as a vertex
+
+        Returns:
+            Graph: Graph of the collected vertices and edges, in order of addition
+        """
+        index = self._index
+
+        if (np is not None and len(self._sources) > 0):
+            sources, targets = self._slot_indices()
+        else:
+            try:
+                sources = array('q', [index[source] for source in self._sources])
+                targets = array('q', [index[target] for target in self._targets])
+            except KeyError:
+                raise Exception("An End Point of Vertex Doesn't Exist in Vertex Set") from None
+
+        graph = Graph.__new__(Graph)
+        graph._assemble(list(self._vertices), dict(index),
+                        *_build_csr(len(self._vertices), sources, targets, self._weights))
+
+        return graph
+
+    def _slot_indices(self) -> Tuple[array, array]:
+        """
+        A helper function to translate the end points of the collected edges from vertex IDs to slot indices.
+
+        Raises:
+            Exception: If an end point of an edge was never added as a vertex
+
+        Returns:
+            Tuple[array, array]: slot index of the source and of the target of every edge
+        """
+        vertex_ids = np.fromiter(self._index.keys(), dtype=np.int64, count=len(self._index))
+
+        result = []
+        for ids in (self._sources, self._targets):
+            result.append(_to_array('q', _lookup_slots(vertex_ids, np.frombuffer(ids, dtype=np.int64))))
+
+        return result[0], result[1]
 
 
 
@@ -307,4 +1095,3 @@ if (__name__ == "__main__"):
         [0, 0, 1, 1, 0]]
 
     g = Graph.from_adjacency_matrix(adj_matrix)
-
@@ -1,65 +1,533 @@
-from .Graph import Graph,Vertex,Edge
-import fnmatch
-from xml.dom import minidom
+from .Graph import Graph,GraphBuilder,Vertex
+import gzip
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import Any, Callable, Dict, List, Tuple, IO as TextFile
+from xml.etree.ElementTree import iterparse
 
-def read_graph(file_path: str,directed=False) ->Graph:
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_GRAPHML_TYPES: Dict[str, Callable[[str], Any]] = {
+    "boolean": lambda text: text.strip().lower() == "true",
+    "int": int,
+    "long": int,
+    "float": float,
+    "double": float,
+    "string": str,
+}
+
+_EXTENSIONS = {
+    ".graphml": "graphml",
+    ".mtx": "mtx",
+    ".csv": "csv",
+    ".txt": "edgelist",
+    ".tsv": "edgelist",
+    ".el": "edgelist",
+    ".edges": "edgelist",
+    ".edgelist": "edgelist",
+    ".sgb": "binary",
+}
+
+_BINARY_MAGIC = b"SUGRAPH"
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<7sBqqq")
+_BINARY_HEADER_SIZE = 64
+
+_CHUNK_LINES = 1 << 20
+
+def read_graph(file_path: str,directed: bool | None = None,weight: str = "weight",format: str | None = None) ->Graph:
     """
     A function to read graph from a file and return a graph object.
-    Supports GraphML Format
+    Supports GraphML, whitespace separated edge list, CSV and Matrix Market coordinate formats,
+    gzip compressed files are decompressed transparently, and the binary format written by write_graph.
     Params:
         file_path:str -> path to file containing graph data
+        directed:bool | None -> True or False to treat every edge as directed or undirected,
+            None to follow the file, edge lists and CSV files are directed by default
+        weight:str -> name of the edge attribute or CSV header column holding edge weights,
+            edges without it get weight 1
+        format:str | None -> one of "graphml", "edgelist", "csv", "mtx" or "binary",
+            None to choose by file extension
     Returns:
         g:Graph -> graph object constructed from file data
     """
 
-    if fnmatch.fnmatch(file_path, "*.graphml"):
+    if (format is None):
+        name = file_path[:-3] if file_path.endswith(".gz") else file_path
+        format = _EXTENSIONS.get(os.path.splitext(name)[1].lower())
 
-        g = _process_graph_ml(file_path,directed)
+    if format == "graphml":
+
+        g = _process_graph_ml(file_path,directed,weight)
 
         return g
 
+    elif format in ("edgelist", "csv"):
+        return _process_edge_list(file_path, directed, weight, "," if format == "csv" else None)
+
+    elif format == "mtx":
+        return _process_matrix_market(file_path, directed)
+
+    elif format == "binary":
+        return _process_binary(file_path)
+
     else:
         raise Exception("File Format Not Supported")
 
 
-def _process_graph_ml(file_path: str,directed=False) -> Graph:
+def write_graph(graph: Graph, file_path: str) -> None:
+    """
+    A function to write a graph to a file in the sugraph binary format, to be loaded again by read_graph.
+
+    The file holds a 64 byte header (magic, version, vertex count, edge count, attribute table size), then
+    the little-endian vertex ID, CSR offset, target and weight arrays, each 8 bytes per item, and finally
+    the vertex values as a JSON list in slot order.
+    Params:
+        graph:Graph -> graph to be written
+        file_path:str -> path of the file to be written, conventionally ending in .sgb
+    Raises:
+        Exception: If a vertex value cannot be represented in JSON
+    """
+    offsets, targets, weights = graph.csr
+    ids = array('q', graph.vertices)
+
+    try:
+        attributes = json.dumps([graph.get_vertex_data(v_id) for v_id in ids]).encode()
+    except TypeError:
+        raise Exception("Vertex values should be JSON serializable to be written") from None
+
+    header = _BINARY_HEADER.pack(_BINARY_MAGIC, _BINARY_VERSION, graph.graph_size, len(targets), len(attributes))
+
+    with open(file_path, "wb") as file:
+        file.write(header.ljust(_BINARY_HEADER_SIZE, b"\0"))
+
+        for typecode, values in (('q', ids), ('q', offsets), ('q', targets), ('d', weights)):
+            if (sys.byteorder == "big"):
+                values = array(typecode, values)
+                values.byteswap()
+
+            file.write(memoryview(values).cast('B'))
+
+        file.write(attributes)
+
+
+def _process_binary(file_path: str) -> Graph:
+    """
+    A helper function to load a graph written by write_graph.
+
+    The CSR arrays are not read but memory mapped (np.memmap if numpy is installed), so loading costs
+    O(V) for the vertices whatever the number of edges, and processes opening the same file share its
+    pages through the OS page cache. The arrays are read-only views of the file.
+    Params:
+        file_path:str -> path to a file written by write_graph
+    Raises:
+        Exception: If the file is not a binary graph or was written by an unsupported version
+    Returns:
+        g:Graph -> graph object backed by the file
+    """
+    with open(file_path, "rb") as file:
+        header = file.read(_BINARY_HEADER_SIZE)
+
+        if (len(header) < _BINARY_HEADER_SIZE or header[:len(_BINARY_MAGIC)] != _BINARY_MAGIC):
+            raise Exception("File is not a sugraph binary graph")
+
+        _, version, size, num_edges, attribute_size = _BINARY_HEADER.unpack_from(header)
+
+        if (version != _BINARY_VERSION):
+            raise Exception("Binary graph version " + str(version) + " is not supported")
+
+        if (np is not None):
+            mapped = memoryview(np.memmap(file, dtype=np.uint8, mode="r"))
+        else:
+            mapped = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    arrays = []
+    position = _BINARY_HEADER_SIZE
+    for typecode, length in (('q', size), ('q', size + 1), ('q', num_edges), ('d', num_edges)):
+        values = mapped[position:position + 8 * length].cast(typecode)
+        position += 8 * length
+
+        if (sys.byteorder == "big"):
+            values = array(typecode, values.tobytes())
+            values.byteswap()
+
+        arrays.append(values)
+
+    ids, offsets, targets, weights = arrays
+    values = json.loads(bytes(mapped[position:position + attribute_size]))
+
+    vertices = [Vertex(v_id=v_id, value=value) for v_id, value in zip(ids.tolist(), values)]
+    index = {vertex.v_id: slot for slot, vertex in enumerate(vertices)}
+
+    graph = Graph.__new__(Graph)
+    graph._assemble(vertices, index, offsets, targets, weights)
+
+    return graph
+
+
+def _open(file_path: str, mode: str = "rt") -> TextFile:
+    """
+    A helper function to open a file for reading, decompressing it if it starts with the gzip magic bytes.
+
+    Params:
+        file_path:str -> path to the file
+        mode:str -> "rt" for text or "rb" for binary
+    Returns:
+        file object -> opened file
+    """
+    with open(file_path, "rb") as file:
+        compressed = file.read(2) == b"\x1f\x8b"
+
+    if (compressed):
+        return gzip.open(file_path, mode)
+
+    return open(file_path, mode)
+
+
+def _data_lines(file: TextFile, comments: str = "#%") -> List[str]:
+    """
+    A helper function to read the next chunk of lines of a text file, skipping blank and comment lines.
+
+    Params:
+        file:TextFile -> file opened in text mode
+        comments:str -> characters starting a comment line
+    Returns:
+        List[str] -> up to _CHUNK_LINES data lines, an empty list at the end of the file
+    """
+    while True:
+        lines = list(islice(file, _CHUNK_LINES))
+
+        if (not lines):
+            return lines
+
+        lines = [line for line in lines if line.strip() and line.lstrip()[0] not in comments]
+
+        if (lines):
+            return lines
+
+
+def _parse_columns(lines: List[str], delimiter: str | None, weight_column: int):
+    """
+    A helper function to parse a chunk of edge lines into source, target and weight arrays in bulk.
+
+    Params:
+        lines:List[str] -> data lines, every line holds a source ID, a target ID and optional further columns
+        delimiter:str | None -> column separator, None for whitespace
+        weight_column:int -> column of the edge weights, -1 for weight 1 on every edge
+    Returns:
+        Tuple -> sources, targets and weights arrays, numpy arrays if numpy is installed
+    """
+    if (np is not None):
+        columns = (0, 1) if weight_column == -1 else (0, 1, weight_column)
+        dtype = [("source", np.int64), ("target", np.int64)]
+        if (weight_column != -1):
+            dtype.append(("weight", np.float64))
+
+        data = np.loadtxt(lines, dtype=dtype, delimiter=delimiter, usecols=columns, ndmin=1)
+
+        weights = data["weight"] if weight_column != -1 else np.ones(len(data))
+        return data["source"], data["target"], weights
+
+    sources = array('q')
+    targets = array('q')
+    weights = array('d')
+
+    for line in lines:
+        fields = line.split(delimiter)
+
+        sources.append(int(fields[0]))
+        targets.append(int(fields[1]))
+        weights.append(float(fields[weight_column]) if weight_column != -1 else 1.0)
+
+    return sources, targets, weights
+
+
+def _add_chunk(builder: GraphBuilder, sources, targets, weights, directed: bool, mirror_sign: float = 1) -> None:
+    """
+    A helper function to hand a parsed chunk of edges and their end points over to a graph builder.
+
+    Params:
+        builder:GraphBuilder -> builder collecting the graph
+        sources, targets, weights -> arrays returned by _parse_columns
+        directed:bool -> False to add every edge in both directions
+        mirror_sign:float -> factor applied to the weights of the reverse edges
+    """
+    if (np is not None):
+        builder.add_vertices(np.unique(np.concatenate((sources, targets))))
+        builder.add_edges(sources, targets, weights)
+
+        if (not directed):
+            loops = sources != targets
+            builder.add_edges(targets[loops], sources[loops], mirror_sign * weights[loops])
+        return
+
+    builder.add_vertices(sorted(set(sources).union(targets)))
+    builder.add_edges(sources, targets, weights)
+
+    if (not directed):
+        loops = [i for i in range(len(sources)) if sources[i] != targets[i]]
+        builder.add_edges([targets[i] for i in loops], [sources[i] for i in loops],
+                          [mirror_sign * weights[i] for i in loops])
+
+
+def _process_edge_list(file_path: str, directed: bool | None = None, weight: str = "weight",
+                       delimiter: str | None = None) -> Graph:
+    """
+    A helper function to read and process an edge list file to a graph object.
+
+    Every line holds a source ID, a target ID and optionally a weight in the third column, lines starting with
+    # or % are comments. A first line that doesn't start with an integer is read as a header, the column named
+    weight then holds the weights. The file is parsed in chunks of lines, without a Python tuple per edge.
+    Vertices are the IDs appearing in the file, every chunk adds its new IDs in increasing order.
+
+    Params:
+        file_path:str -> path to file containing graph data
+        directed:bool | None -> False to add every edge in both directions, directed if None
+        weight:str -> name of the header column holding edge weights
+        delimiter:str | None -> column separator, None for whitespace
+    Returns:
+        g:Graph -> graph object constructed from file data
+    """
+    builder = GraphBuilder()
+    directed = directed is not False
+
+    with _open(file_path) as file:
+        lines = _data_lines(file)
+        weight_column = -1
+
+        if (lines):
+            fields = [field.strip() for field in lines[0].split(delimiter)]
+
+            if (not fields[0].lstrip("-").isdigit()):
+                lines = lines[1:]
+                weight_column = fields.index(weight) if weight in fields else -1
+            elif (len(fields) > 2):
+                weight_column = 2
+
+        while lines:
+            _add_chunk(builder, *_parse_columns(lines, delimiter, weight_column), directed)
+            lines = _data_lines(file)
+
+    return builder.build()
+
+
+def _process_matrix_market(file_path: str, directed: bool | None = None) -> Graph:
+    """
+    A helper function to read and process a Matrix Market coordinate file to a graph object.
+
+    Entry (i, j, value) becomes the edge i -> j with weight value, pattern matrices get weight 1. Vertices are
+    1..max(rows, columns). Symmetric and hermitian matrices store one triangle, the mirrored edges are added,
+    skew-symmetric mirrors get negated weights.
+
+    Params:
+        file_path:str -> path to file containing graph data
+        directed:bool | None -> False to add every edge in both directions, True to only add the stored
+            entries, None to follow the symmetry of the matrix
+    Raises:
+        Exception: If the file is not a real, integer or pattern coordinate matrix
+    Returns:
+        g:Graph -> graph object constructed from file data
+    """
+    builder = GraphBuilder()
+
+    with _open(file_path) as file:
+        header = file.readline().split()
+
+        if (len(header) < 5 or header[0] != "%%MatrixMarket" or header[1].lower() != "matrix"):
+            raise Exception("File is not a Matrix Market file")
+
+        layout, field, symmetry = (item.lower() for item in header[2:5])
+
+        if (layout != "coordinate" or field not in ("real", "integer", "pattern")):
+            raise Exception("Only real, integer and pattern coordinate Matrix Market files are supported")
+
+        lines = _data_lines(file)
+        rows, columns, _ = (int(item) for item in lines[0].split())
+        lines = lines[1:]
+
+        builder.add_vertices(range(1, max(rows, columns) + 1))
+
+        if (directed is None):
+            directed = symmetry == "general"
+
+        mirror_sign = -1 if symmetry == "skew-symmetric" else 1
+
+        while True:
+            if (lines):
+                sources, targets, weights = _parse_columns(lines, None, -1 if field == "pattern" else 2)
+                _add_chunk(builder, sources, targets, weights, directed, mirror_sign)
+
+            lines = _data_lines(file)
+            if (not lines):
+                break
+
+    return builder.build()
+
+
+def _local_name(tag: str) -> str:
+    """
+    A helper function to strip the XML namespace from a tag.
+
+    Params:
+        tag:str -> tag of an element, possibly of the form {namespace}name
+    Returns:
+        str -> name of the tag without its namespace
+    """
+    return tag.rpartition("}")[2]
+
+
+def _process_graph_ml(file_path: str,directed: bool | None = None,weight: str = "weight") -> Graph:
     """
     A helper function to read and process graphml file to a graph object.
 
+    The file is streamed with iterparse, every node and edge element is cleared and detached as soon as it is
+    processed, so memory stays bounded by the size of the resulting graph rather than the file.
+    <key> definitions give the names, types and defaults of <data> values. Vertex values are dicts of attribute
+    name to typed value, edge weights are read from the attribute named weight.
+    Integer node ids are used as vertex IDs. Every other node id is numbered in order of first appearance after
+    the largest integer node id of the file, from 1 if there is none, and the original id is kept in the vertex
+    value under "id". Files may mix both kinds of ids.
+
     Params:
         file_path:str -> path to file containing graph data
+        directed:bool | None -> True or False to treat every edge as directed or undirected,
+            None to follow the edgedefault of the graph and the directed attribute of the edges
+        weight:str -> name of the edge attribute holding edge weights
     Returns:
         g:Graph -> graph object constructed from file data
     """
-    dom = minidom.parse(file_path)
+    builder = GraphBuilder()
+
+    keys: Dict[str, Tuple[str, Callable[[str], Any]]] = {}
+    defaults: Dict[str, Dict[str, Any]] = {"node": {}, "edge": {}}
+
+    # Vertex IDs of named (non-integer) node ids are only known once the largest integer node id has been seen,
+    # so named ids get a provisional number and vertices and edges referring to them are kept until the end
+    named_ids: Dict[str, int] = {}
+    largest_id = 0
+
+    vertices: List[Tuple[int, bool, Any]] = []
+    pending_sources = array('q')
+    pending_targets = array('q')
+    pending_weights = array('d')
+    pending_named = bytearray()
+
+    def vertex_id(raw: str) -> Tuple[int, bool]:
+        nonlocal largest_id
+
+        digits = raw[1:] if raw.startswith("-") else raw
+        if (digits.isascii() and digits.isdigit()):
+            v_id = int(raw)
+            largest_id = max(largest_id, v_id)
+            return v_id, False
+
+        return named_ids.setdefault(raw, len(named_ids)), True
+
+    def add_edge(source: Tuple[int, bool], target: Tuple[int, bool], edge_weight: float) -> None:
+        if (source[1] or target[1]):
+            pending_sources.append(source[0])
+            pending_targets.append(target[0])
+            pending_weights.append(edge_weight)
+            pending_named.append(source[1] | target[1] << 1)
+        else:
+            builder.add_edge(source[0], target[0], edge_weight)
 
+    def attributes(element, domain: str) -> Dict[str, Any]:
+        values = dict(defaults[domain])
 
-    raw_v = dom.getElementsByTagName('node')
-    raw_e=dom.getElementsByTagName('edge')
+        for child in element:
+            if (_local_name(child.tag) == "data"):
+                name, convert = keys.get(child.get("key"), (child.get("key"), str))
+                values[name] = convert(child.text or "")
 
-    vertices=[]
-    edges=[]
-    for v in raw_v:
+        return values
 
-        v_data={}
-        data=v.getElementsByTagName("data")
-        
-        
-        for d in data:
-            v_data[d.getAttribute("key")]=d.firstChild.nodeValue
-        
+    edge_default = True
+    stack = []
 
-        vertices.append(Vertex(v_id=int(v.attributes['id'].value),value=v_data))
-    
-    for e in raw_e:
+    with _open(file_path, "rb") as file:
+        for event, element in iterparse(file, events=("start", "end")):
+            tag = _local_name(element.tag)
 
-        source=int(e.getAttribute("source"))
-        target=int(e.getAttribute("target"))
+            if (event == "start"):
+                stack.append(element)
+
+                if (tag == "graph"):
+                    edge_default = element.get("edgedefault", "directed") == "directed"
+
+                continue
+
+            stack.pop()
+
+            if (tag == "key"):
+                convert = _GRAPHML_TYPES.get(element.get("attr.type", "string"), str)
+                name = element.get("attr.name", element.get("id"))
+                keys[element.get("id")] = (name, convert)
+
+                for child in element:
+                    if (_local_name(child.tag) == "default"):
+                        for domain in ("node", "edge"):
+                            if (element.get("for", "all") in (domain, "all")):
+                                defaults[domain][name] = convert(child.text or "")
+
+            elif (tag == "node"):
+                raw = element.get("id")
+                v_id, named = vertex_id(raw)
+
+                value = attributes(element, "node")
+                if (named):
+                    value["id"] = raw
+
+                vertices.append((v_id, named, value))
+
+            elif (tag == "edge"):
+                source = vertex_id(element.get("source"))
+                target = vertex_id(element.get("target"))
+
+                edge_weight = float(attributes(element, "edge").get(weight, 1))
+
+                if (directed is None):
+                    edge_directed = element.get("directed", str(edge_default).lower()) == "true"
+                else:
+                    edge_directed = directed
+
+                add_edge(source, target, edge_weight)
+                if (not edge_directed and source != target):
+                    add_edge(target, source, edge_weight)
+
+            else:
+                continue
+
+            element.clear()
+            if (stack):
+                stack[-1].remove(element)
+
+    first_named_id = largest_id + 1
+
+    for v_id, named, value in vertices:
+        builder.add_vertex(v_id + first_named_id if named else v_id, value)
+
+    if (np is not None):
+        named = np.frombuffer(pending_named, dtype=np.uint8).astype(np.int64)
+        builder.add_edges(np.frombuffer(pending_sources, dtype=np.int64) + (named & 1) * first_named_id,
+                          np.frombuffer(pending_targets, dtype=np.int64) + (named >> 1) * first_named_id,
+                          np.frombuffer(pending_weights, dtype=np.float64))
+    else:
+        builder.add_edges([source + (named & 1) * first_named_id
+                           for source, named in zip(pending_sources, pending_named)],
+                          [target + (named >> 1) * first_named_id
+                           for target, named in zip(pending_targets, pending_named)],
+                          pending_weights)
 
-        edges.append(Edge(source,target,directed))
-    
-         
-    return Graph(vertices,edges)
+    return builder.build()
 
 
 
@@ -67,8 +535,8 @@ if(__name__=="__main__"):
 
     g=read_graph("../airlines.graphml")
 
-    for row in g._adjacency_matrix:
+    for row in g.adjacency_matrix:
         for i in row:
             if(i==1):
                 print(row)
-                break
\ No newline at end of file
+                break
@@ -0,0 +1,305 @@
+import dataclasses
+import pickle
+from array import array
+from bisect import bisect_left
+from multiprocessing import shared_memory
+from numbers import Integral
+from typing import Any, List, Sequence, Tuple
+
+from .Graph import Graph, Edge
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _share_arrays(arrays: Sequence[array]) -> Tuple[List[shared_memory.SharedMemory], List[Tuple[str, str, int]]]:
+    """
+    A helper function copying arrays into shared memory blocks, so that other processes can read them without
+    every task pickling them.
+
+    Params:
+        arrays (Sequence[array]): Arrays or typed memoryviews to be shared
+
+    Returns:
+        Tuple[List[SharedMemory], List[Tuple[str, str, int]]]: the blocks, to be closed and unlinked by the
+        caller, and a picklable (name, typecode, length) descriptor of every array
+    """
+    blocks = []
+    descriptor = []
+
+    for values in arrays:
+        data = memoryview(values).cast('B')
+        block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        block.buf[:len(data)] = data
+
+        blocks.append(block)
+        typecode = values.format if isinstance(values, memoryview) else values.typecode
+        descriptor.append((block.name, typecode, len(values)))
+
+    return blocks, descriptor
+
+
+def _attach_arrays(descriptor: List[Tuple[str, str, int]]) -> Tuple[List[shared_memory.SharedMemory], List[memoryview]]:
+    """
+    A helper function attaching to arrays shared by _share_arrays.
+
+    Params:
+        descriptor (List[Tuple[str, str, int]]): Descriptor returned by _share_arrays
+
+    Returns:
+        Tuple[List[SharedMemory], List[memoryview]]: the attached blocks and a read-only typed view of every array
+    """
+    blocks = []
+    views = []
+
+    for name, typecode, length in descriptor:
+        try:
+            block = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            block = shared_memory.SharedMemory(name=name)
+
+        blocks.append(block)
+        views.append(block.buf[:length * array(typecode).itemsize].toreadonly().cast(typecode))
+
+    return blocks, views
+
+
+@dataclasses.dataclass(frozen=True)
+class GraphHandle():
+    """
+    Picklable reference to a graph exported by SharedGraph, a few hundred bytes whatever the size of the graph.
+    Pass it to other processes, e.g. as a pool initializer argument, and call attach there.
+
+    Attributes:
+        descriptor (List[Tuple[str, str, int]]): (block name, typecode, length) of the ids, offsets, targets,
+            weights, reverse offsets, sources, reverse weights, value offsets, values and id order arrays
+        version (int): Version of the graph when it was exported
+        first_id (int | None): ID of slot 0 if the IDs are consecutive integers in slot order, None otherwise
+    """
+    descriptor: List[Tuple[str, str, int]]
+    version: int
+    first_id: int | None
+
+    def attach(self) -> "AttachedGraph":
+        """
+        Attaches to the exported graph in O(1), without copying any array.
+
+        Returns:
+            AttachedGraph: read-only graph backed by the shared memory blocks
+        """
+        return AttachedGraph(self)
+
+
+class SharedGraph():
+    """
+    Copy of a graph in multiprocessing.shared_memory blocks, for serving queries from a pool of worker processes
+    that attach to it instead of each holding their own Graph.
+
+    The blocks hold the CSR and in-edge CSR arrays, the vertex IDs, the vertex values pickled one after the
+    other and a sorted order of the IDs for lookups. Every attached process maps the same physical pages, so N
+    workers cost about one graph in memory plus O(1) each. The export is a snapshot: later changes of the graph
+    are not seen by attached processes.
+
+    The creating process owns the blocks and has to call close, or use the object as a context manager, once
+    no process needs them anymore; the memory is only released when it does.
+
+    Usage:
+        with SharedGraph(graph) as shared:
+            with ProcessPoolExecutor(initializer=init, initargs=(shared.handle,)) as executor:
+                ...
+        where init calls handle.attach() once per worker.
+
+    Protected Variables:
+        _blocks (List[SharedMemory]): Blocks created for the arrays
+    """
+
+    def __init__(self, graph: Graph):
+        """
+        Constructor, copies the arrays of graph into new shared memory blocks in O(V + E).
+
+        Params:
+            graph (Graph): Graph to be exported
+
+        Raises:
+            Exception: If a vertex value cannot be pickled
+        """
+        if(not isinstance(graph, Graph)):
+            raise Exception("Graph should be an instance of Graph class")
+
+        ids = array('q', graph.vertices)
+
+        values = bytearray()
+        value_offsets = array('q', [0])
+        try:
+            for vertex_id in ids:
+                values += pickle.dumps(graph.get_vertex_data(vertex_id))
+                value_offsets.append(len(values))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            raise Exception("Vertex values should be picklable to be shared") from None
+
+        if (np is not None):
+            numpy_ids = np.frombuffer(ids, dtype=np.int64)
+            order = array('q', np.argsort(numpy_ids, kind="stable").tobytes())
+            consecutive = bool(np.array_equal(numpy_ids, np.arange(len(ids)) + (ids[0] if ids else 0)))
+        else:
+            order = array('q', sorted(range(len(ids)), key=ids.__getitem__))
+            consecutive = all(ids[slot] == ids[0] + slot for slot in range(len(ids)))
+
+        self._blocks, descriptor = _share_arrays(
+            (ids, *graph.csr, *graph.reverse_csr, value_offsets, memoryview(values), order))
+
+        self.handle = GraphHandle(descriptor, graph.version, ids[0] if consecutive and ids else None)
+
+    def close(self) -> None:
+        """
+        Releases the shared memory blocks. Processes still attached keep their mapping until they close it.
+        """
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+
+        self._blocks = []
+
+    def __enter__(self) -> "SharedGraph":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+
+class AttachedGraph(Graph):
+    """
+    Read-only graph backed by the shared memory blocks of a SharedGraph, created by GraphHandle.attach.
+
+    It is a Graph, so every algorithm accepts it. No Vertex objects or ID dict are built: vertices is a
+    read-only memoryview of the IDs, IDs are looked up by arithmetic when they are consecutive and by binary
+    search otherwise, and vertex values are unpickled on access. Changing the graph raises.
+
+    Protected Variables:
+        _handle (GraphHandle): Handle the graph was attached from
+        _blocks (List[SharedMemory]): Attached blocks, kept open while the graph is in use
+        _ids, _offsets, _targets, _weights, _reverse_csr, _value_offsets, _values, _order (memoryview): Views of
+            the shared arrays
+        _adjacency_matrix, _adjacency_array: Derived caches, as in Graph
+    """
+
+    def __init__(self, handle: GraphHandle):
+        """
+        Constructor, use GraphHandle.attach.
+
+        Params:
+            handle (GraphHandle): Handle of the exported graph
+        """
+        self._handle = handle
+        self._blocks, views = _attach_arrays(handle.descriptor)
+
+        (self._ids, self._offsets, self._targets, self._weights, reverse_offsets, sources, reverse_weights,
+         self._value_offsets, self._values, self._order) = views
+        self._reverse_csr = (reverse_offsets, sources, reverse_weights)
+
+        self._size = len(self._ids)
+        self._num_edges = len(self._targets)
+
+        self._adjacency_matrix = None
+        self._adjacency_array = None
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory blocks. Arrays retrieved from the graph can't be used afterwards.
+        """
+        views = [self._ids, self._offsets, self._targets, self._weights, *self._reverse_csr,
+                 self._value_offsets, self._values, self._order]
+        self._adjacency_array = None
+
+        for view in views:
+            view.release()
+
+        for block in self._blocks:
+            block.close()
+
+        self._blocks = []
+
+    def _compact(self) -> None:
+        return
+
+    def get_vertex_index(self, vertex_id: int) -> int | None:
+        if (not isinstance(vertex_id, Integral)):
+            return None
+
+        first_id = self._handle.first_id
+        if (first_id is not None):
+            slot = int(vertex_id) - first_id
+            return slot if 0 <= slot < self._size else None
+
+        ids = self._ids
+        position = bisect_left(self._order, vertex_id, key=ids.__getitem__)
+
+        if (position < self._size and ids[self._order[position]] == vertex_id):
+            return self._order[position]
+
+        return None
+
+    def get_vertex_id(self, vertex_index: int) -> int:
+        return self._ids[vertex_index]
+
+    def get_vertex_data(self, vertex_id: int) -> Any:
+        slot = self.get_vertex_index(vertex_id)
+        if (slot is None):
+            return None
+
+        return pickle.loads(self._values[self._value_offsets[slot]:self._value_offsets[slot + 1]])
+
+    def does_vertex_exist(self, vertex_id: int) -> bool:
+        return self.get_vertex_index(vertex_id) is not None
+
+    def get_neighbours(self, vertex_id: int) -> List[Edge]:
+        row = self.get_vertex_index(vertex_id)
+        if (row is None):
+            return []
+
+        ids = self._ids
+
+        return [Edge(target=ids[self._targets[position]], weight=self._weights[position])
+                for position in range(self._offsets[row], self._offsets[row + 1])]
+
+    def changes_since(self, version: int) -> List[Tuple[int, int, float, float]] | None:
+        return [] if version == self._handle.version else None
+
+    def set_vertex_data(self, vertex_id, value: Any) -> None:
+        raise Exception("Attached graphs are read only")
+
+    def add_vertex(self, data) -> int:
+        raise Exception("Attached graphs are read only")
+
+    def add_edge(self, source: int, target: int, weight: float):
+        raise Exception("Attached graphs are read only")
+
+    def add_edges(self, sources, targets, weights=None) -> int:
+        raise Exception("Attached graphs are read only")
+
+    def set_edge_weight(self, source: int, target: int, weight: float) -> None:
+        raise Exception("Attached graphs are read only")
+
+    @property
+    def csr(self) -> Tuple[memoryview, memoryview, memoryview]:
+        return self._offsets, self._targets, self._weights
+
+    @property
+    def reverse_csr(self) -> Tuple[memoryview, memoryview, memoryview]:
+        return self._reverse_csr
+
+    @property
+    def vertices(self) -> memoryview:
+        """
+        Retrieves the vertex IDs of the graph.
+
+        Returns:
+            memoryview: Read-only view of the vertex IDs, in slot index order
+        """
+        return self._ids
+
+    @property
+    def version(self) -> int:
+        return self._handle.version
@@ -0,0 +1,400 @@
+from abc import ABCMeta, abstractmethod
+from array import array
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+from .Graph import Graph, Edge, _to_array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class GraphView(Graph, metaclass=ABCMeta):
+    """
+    Read-only view of a parent graph that shares its vertex storage instead of copying it. Subclasses define
+    their edges by implementing _view_csr.
+
+    A view is a Graph, so it is accepted by every algorithm that takes one. Slot indices of a view are those of
+    its parent, hence results indexed by slot index line up with the parent and vertices lists the parent's
+    vertex IDs, including vertices a SubgraphView hides. Views follow changes of the parent: their arrays are
+    rebuilt on the first read after the parent's version changes. Views of views are allowed. Changing a view
+    raises, change the parent instead.
+
+    Protected Variables:
+        _parent (Graph): Graph the view reads from
+        _synced_version (int): Version of _parent the cached arrays were built for, -1 if none were built
+        _csr (Tuple[array, array, array] | None): CSR arrays of the view
+        _adjacency_matrix, _adjacency_array, _reverse_csr: Derived caches, as in Graph
+    """
+
+    def __init__(self, parent: Graph):
+        """
+        Constructor
+
+        Params:
+            parent (Graph): Graph to be viewed
+        """
+        if(not isinstance(parent, Graph)):
+            raise Exception("Graph should be an instance of Graph class")
+
+        self._parent = parent
+        self._synced_version = -1
+        self._csr: Tuple[array, array, array] | None = None
+
+        self._adjacency_matrix = None
+        self._adjacency_array = None
+        self._reverse_csr = None
+
+    @property
+    def parent(self) -> Graph:
+        """
+        Retrieves the graph the view reads from.
+
+        Returns:
+            Graph: Parent graph
+        """
+        return self._parent
+
+    def _sync(self) -> None:
+        """
+        A helper function to drop the cached arrays of the view once the parent has changed.
+        """
+        if (self._synced_version == self._parent.version):
+            return
+
+        self._csr = None
+        self._adjacency_matrix = None
+        self._adjacency_array = None
+        self._reverse_csr = None
+
+        self._synced_version = self._parent.version
+
+    @abstractmethod
+    def _view_csr(self) -> Tuple[array, array, array]:
+        """
+        A helper function to build the CSR arrays of the view from the parent, implemented by every view.
+
+        Returns:
+            Tuple[array, array, array]: offsets, targets and weights arrays
+        """
+
+    def _compact(self) -> None:
+        return
+
+    @property
+    def csr(self) -> Tuple[array, array, array]:
+        """
+        Retrieves the compressed sparse row arrays of the view, see Graph.csr.
+
+        Returns:
+            Tuple[array, array, array]: offsets, targets and weights arrays
+        """
+        self._sync()
+
+        if (self._csr is None):
+            self._csr = self._view_csr()
+
+        return self._csr
+
+    @property
+    def reverse_csr(self) -> Tuple[array, array, array]:
+        """
+        Retrieves the compressed sparse row arrays of the transposed view, see Graph.reverse_csr.
+
+        Returns:
+            Tuple[array, array, array]: offsets, sources and weights arrays
+        """
+        self._sync()
+        return Graph.reverse_csr.fget(self)
+
+    @property
+    def adjacency_matrix(self):
+        self._sync()
+        return Graph.adjacency_matrix.fget(self)
+
+    @property
+    def adjacency_array(self):
+        self._sync()
+        return Graph.adjacency_array.fget(self)
+
+    def get_vertex_index(self, vertex_id: int) -> int | None:
+        return self._parent.get_vertex_index(vertex_id)
+
+    def get_vertex_id(self, vertex_index: int) -> int:
+        return self._parent.get_vertex_id(vertex_index)
+
+    def get_vertex_data(self, vertex_id: int) -> Any:
+        if (self.get_vertex_index(vertex_id) is None):
+            return None
+        return self._parent.get_vertex_data(vertex_id)
+
+    def set_vertex_data(self, vertex_id, value: Any) -> None:
+        if (self.get_vertex_index(vertex_id) is not None):
+            self._parent.set_vertex_data(vertex_id, value)
+
+    def does_vertex_exist(self, vertex_id: int) -> bool:
+        return self.get_vertex_index(vertex_id) is not None
+
+    def get_neighbours(self, vertex_id: int) -> List[Edge]:
+        row = self.get_vertex_index(vertex_id)
+        if (row is None):
+            return []
+
+        offsets, targets, weights = self.csr
+        ids = self.vertices
+
+        return [Edge(target=ids[targets[position]], weight=weights[position])
+                for position in range(offsets[row], offsets[row + 1])]
+
+    def changes_since(self, version: int) -> List[Tuple[int, int, float, float]] | None:
+        return None
+
+    def add_vertex(self, data) -> int:
+        raise Exception("Graph views are read only, change the parent graph instead")
+
+    def add_edge(self, source: int, target: int, weight: float):
+        raise Exception("Graph views are read only, change the parent graph instead")
+
+    def add_edges(self, sources, targets, weights=None) -> int:
+        raise Exception("Graph views are read only, change the parent graph instead")
+
+    def set_edge_weight(self, source: int, target: int, weight: float) -> None:
+        raise Exception("Graph views are read only, change the parent graph instead")
+
+    @property
+    def vertices(self):
+        return self._parent.vertices
+
+    @property
+    def graph_size(self):
+        return self._parent.graph_size
+
+    @property
+    def num_edges(self):
+        return len(self.csr[1])
+
+    @property
+    def version(self) -> int:
+        return self._parent.version
+
+
+def _filter_csr(csr: Tuple[array, array, array], keep) -> Tuple[array, array, array]:
+    """
+    A helper function to build the CSR arrays holding the edges of csr whose keep flag is set, in their order.
+
+    Params:
+        csr (Tuple[array, array, array]): offsets, targets and weights arrays to be filtered
+        keep (np.ndarray[bool] | Sequence[bool]): Flag of every edge, aligned with the CSR arrays
+
+    Returns:
+        Tuple[array, array, array]: offsets, targets and weights arrays of the kept edges
+    """
+    offsets, targets, weights = csr
+
+    if (np is not None):
+        keep = np.asarray(keep, dtype=bool)
+        kept_before = np.concatenate(([0], np.cumsum(keep)))
+
+        return (_to_array('q', kept_before[np.frombuffer(offsets, dtype=np.int64)]),
+                _to_array('q', np.frombuffer(targets, dtype=np.int64)[keep]),
+                _to_array('d', np.frombuffer(weights, dtype=np.float64)[keep]))
+
+    new_offsets = array('q', [0])
+    new_targets = array('q')
+    new_weights = array('d')
+
+    for row in range(len(offsets) - 1):
+        for position in range(offsets[row], offsets[row + 1]):
+            if (keep[position]):
+                new_targets.append(targets[position])
+                new_weights.append(weights[position])
+        new_offsets.append(len(new_targets))
+
+    return new_offsets, new_targets, new_weights
+
+
+class SubgraphView(GraphView):
+    """
+    Induced subgraph of a parent graph on a set of its vertices: the edges between two of those vertices.
+
+    Hidden vertices keep their slot indices but have no edges, and get_vertex_index returns None for them, so
+    algorithms reject them like missing vertices. Vertices added to the parent later are hidden.
+
+    The view holds its own CSR arrays of the kept edges: building them copies O(E) of the parent's arrays, on
+    the first read and again after every change of the parent.
+
+    Protected Variables:
+        _mask (bytearray): 1 for every slot index of a vertex in the subgraph
+    """
+
+    def __init__(self, parent: Graph, vertices: Iterable[int]):
+        """
+        Constructor
+
+        Params:
+            parent (Graph): Graph to be viewed
+            vertices (Iterable[int]): IDs of the vertices of the subgraph
+
+        Raises:
+            Exception: If a vertex doesn't exist in the parent
+        """
+        super().__init__(parent)
+
+        self._mask = bytearray(parent.graph_size)
+
+        for vertex_id in vertices:
+            index = parent.get_vertex_index(vertex_id)
+            if (index is None):
+                raise Exception("Vertex " + str(vertex_id) + " Doesn't Exist in Vertex Set")
+            self._mask[index] = 1
+
+    @staticmethod
+    def from_mask(parent: Graph, mask: Sequence[bool]) -> "SubgraphView":
+        """
+        Creates the induced subgraph of the slot indices whose mask entry is true.
+
+        Params:
+            parent (Graph): Graph to be viewed
+            mask (Sequence[bool]): Flag of every slot index of parent, e.g. a numpy bool array or a component
+                label comparison such as labels == 0
+
+        Returns:
+            SubgraphView: the induced subgraph
+        """
+        if (len(mask) != parent.graph_size):
+            raise Exception("Vertex mask should have an entry for every vertex")
+
+        view = SubgraphView(parent, ())
+        view._mask = bytearray(bool(flag) for flag in mask)
+
+        return view
+
+    @property
+    def mask(self) -> bytearray:
+        """
+        Retrieves the vertex mask of the subgraph.
+
+        Returns:
+            bytearray: 1 for every slot index of a vertex in the subgraph, 0 otherwise
+        """
+        if (len(self._mask) < self.graph_size):
+            self._mask.extend(bytes(self.graph_size - len(self._mask)))
+        return self._mask
+
+    def _view_csr(self) -> Tuple[array, array, array]:
+        csr = self._parent.csr
+        mask = self.mask
+
+        if (np is not None):
+            flags = np.frombuffer(mask, dtype=np.uint8).astype(bool)
+            offsets = np.frombuffer(csr[0], dtype=np.int64)
+            rows = np.repeat(flags, np.diff(offsets))
+            return _filter_csr(csr, rows & flags[np.frombuffer(csr[1], dtype=np.int64)])
+
+        offsets, targets, _ = csr
+        keep = bytearray(len(targets))
+        for row in range(self.graph_size):
+            if (mask[row]):
+                for position in range(offsets[row], offsets[row + 1]):
+                    keep[position] = mask[targets[position]]
+
+        return _filter_csr(csr, keep)
+
+    def get_vertex_index(self, vertex_id: int) -> int | None:
+        index = self._parent.get_vertex_index(vertex_id)
+
+        if (index is None or index >= len(self._mask) or not self._mask[index]):
+            return None
+
+        return index
+
+    def changes_since(self, version: int) -> List[Tuple[int, int, float, float]] | None:
+        changes = self._parent.changes_since(version)
+        if (changes is None):
+            return None
+
+        mask = self.mask
+        return [change for change in changes if mask[change[0]] and mask[change[1]]]
+
+
+class EdgeFilterView(GraphView):
+    """
+    Subgraph of a parent graph holding the edges that pass a filter, with every vertex of the parent.
+
+    The view holds its own CSR arrays of the kept edges: building them copies O(E) of the parent's arrays, and
+    calls the filter on every edge, on the first read and again after every change of the parent.
+
+    Protected Variables:
+        _predicate (Callable[[int, int, float], bool] | None): Filter called with the source ID, target ID and
+            weight of every edge
+        _keep (Sequence[bool] | None): Fixed flag of every edge of the parent, aligned with its CSR arrays
+    """
+
+    def __init__(self, parent: Graph, predicate: Callable[[int, int, float], bool] | Sequence[bool]):
+        """
+        Constructor
+
+        Params:
+            parent (Graph): Graph to be viewed
+            predicate (Callable[[int, int, float], bool] | Sequence[bool]): Either a function called with the
+                source ID, target ID and weight of every edge, re-evaluated whenever the parent changes, or a
+                flag for every edge of the parent aligned with its CSR arrays, e.g. a numpy expression such as
+                np.frombuffer(graph.csr[2]) < 10. Flags only apply to the parent's current edges, the view
+                raises once the parent has a different number of edges
+
+        Raises:
+            Exception: If flags are passed whose number differs from the number of edges of the parent
+        """
+        super().__init__(parent)
+
+        if (callable(predicate)):
+            self._predicate = predicate
+            self._keep = None
+        else:
+            if (len(predicate) != parent.num_edges):
+                raise Exception("Edge mask should have an entry for every edge")
+            self._predicate = None
+            self._keep = predicate
+
+    def _view_csr(self) -> Tuple[array, array, array]:
+        csr = self._parent.csr
+
+        if (self._predicate is None):
+            if (len(self._keep) != len(csr[1])):
+                raise Exception("Edge mask should have an entry for every edge")
+            return _filter_csr(csr, self._keep)
+
+        offsets, targets, weights = csr
+        ids = self._parent.vertices
+        predicate = self._predicate
+
+        keep = bytearray(len(targets))
+        for row in range(len(offsets) - 1):
+            source = ids[row]
+            for position in range(offsets[row], offsets[row + 1]):
+                keep[position] = bool(predicate(source, ids[targets[position]], weights[position]))
+
+        return _filter_csr(csr, keep)
+
+
+class TransposedView(GraphView):
+    """
+    Parent graph with every edge reversed. The view is backed by the in-edge index of the parent
+    (parent.reverse_csr), which is built once and cached by the parent, and its reverse_csr is the parent's CSR,
+    so no arrays are copied.
+    """
+
+    def _view_csr(self) -> Tuple[array, array, array]:
+        return self._parent.reverse_csr
+
+    @property
+    def reverse_csr(self) -> Tuple[array, array, array]:
+        return self._parent.csr
+
+    def changes_since(self, version: int) -> List[Tuple[int, int, float, float]] | None:
+        changes = self._parent.changes_since(version)
+        if (changes is None):
+            return None
+
+        return [(target, source, old_weight, new_weight) for source, target, old_weight, new_weight in changes]
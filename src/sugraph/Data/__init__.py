@@ -1,2 +1,4 @@
-from .Graph import Graph
-from .IO import read_graph
\ No newline at end of file
+from .Graph import Graph, GraphBuilder
+from .IO import read_graph, write_graph
+from .View import GraphView, SubgraphView, EdgeFilterView, TransposedView
+from .Shared import SharedGraph, GraphHandle, AttachedGraph
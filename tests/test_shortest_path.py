@@ -0,0 +1,178 @@
+import random
+from math import inf, isclose
+
+import pytest
+
+from src.sugraph.Data import Graph, TransposedView
+from src.sugraph.Algorithms import ShortestPath
+from src.sugraph.Algorithms.ShortestPath import belmannford, dijkstra, bidirectional_dijkstra, astar, \
+    floydwarshall, floydwarshall_path, NegativeCycleError
+from src.sugraph.Algorithms.Landmarks import LandmarkIndex, alt
+
+BELLMAN_FORD_MODES = ["standard", "spfa"] + (["numpy"] if ShortestPath.np is not None else [])
+
+
+def _random_graph(seed: int, size: int = 40, num_edges: int = 150, low: float = 1, high: float = 10) -> Graph:
+    rng = random.Random(seed)
+    edges = [(rng.randint(1, size), rng.randint(1, size), rng.uniform(low, high)) for _ in range(num_edges)]
+    return Graph(list(range(1, size + 1)), edges)
+
+
+def _path_length(graph: Graph, path) -> float:
+    return sum(min(edge.weight for edge in graph.get_neighbours(source) if edge.target == target)
+               for source, target in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("mode", BELLMAN_FORD_MODES)
+def test_belmannford_negative_edges(mode):
+    # The shortest path needs several passes, 1 -> 2 -> 3 -> 4 is only found after the negative edges relax
+    graph = Graph([1, 2, 3, 4], [(1, 4, 5), (1, 2, 4), (2, 3, -3), (3, 4, -2), (4, 2, 6)])
+
+    assert belmannford(graph, 1, 4, mode) == ((1, 2, 3, 4), -1.0)
+
+
+@pytest.mark.parametrize("mode", BELLMAN_FORD_MODES)
+def test_belmannford_negative_cycle(mode):
+    graph = Graph([1, 2, 3, 4], [(1, 2, 1), (2, 3, -2), (3, 2, 1), (3, 4, 1)])
+
+    with pytest.raises(NegativeCycleError) as error:
+        belmannford(graph, 1, 4, mode)
+
+    cycle = error.value.cycle
+    assert cycle[0] == cycle[-1]
+    assert set(cycle) == {2, 3}
+
+
+@pytest.mark.parametrize("mode", BELLMAN_FORD_MODES)
+def test_belmannford_unreachable_negative_cycle_is_ignored(mode):
+    graph = Graph([1, 2, 3, 4], [(1, 2, 1), (3, 4, -2), (4, 3, 1)])
+
+    assert belmannford(graph, 1, 2, mode) == ((1, 2), 1.0)
+
+
+@pytest.mark.parametrize("mode", BELLMAN_FORD_MODES)
+def test_belmannford_unreachable_end(mode):
+    graph = Graph([1, 2, 3], [(1, 2, 1), (3, 1, 1)])
+
+    assert belmannford(graph, 1, 3, mode) == (tuple(), inf)
+
+
+@pytest.mark.parametrize("mode", BELLMAN_FORD_MODES)
+def test_belmannford_matches_dijkstra(mode):
+    for seed in range(10):
+        graph = _random_graph(seed)
+        for start, end in ((1, 2), (3, 40), (17, 5)):
+            _, expected = dijkstra(graph, start, end)
+            path, distance = belmannford(graph, start, end, mode)
+
+            assert isclose(distance, expected) or distance == expected == inf
+            if (distance != inf):
+                assert isclose(_path_length(graph, path), distance)
+
+
+def test_belmannford_rejects_non_graph():
+    with pytest.raises(Exception):
+        belmannford([[0, 1], [1, 0]], 1, 2)
+
+
+@pytest.mark.parametrize("indexed_heap", [False, True])
+def test_dijkstra(indexed_heap):
+    graph = Graph([1, 2, 3, 4, 5], [(1, 2, 7), (1, 3, 2), (3, 2, 3), (2, 4, 1), (3, 4, 8)])
+
+    assert dijkstra(graph, 1, 4, indexed_heap) == ((1, 3, 2, 4), 6)
+    assert dijkstra(graph, 1, 1, indexed_heap) == ((1,), 0)
+    assert dijkstra(graph, 1, 5, indexed_heap) == (tuple(), inf)
+    assert dijkstra(graph, 4, 1, indexed_heap) == (tuple(), inf)
+
+
+def test_dijkstra_missing_vertex():
+    graph = Graph([1, 2], [(1, 2, 1)])
+
+    with pytest.raises(Exception):
+        dijkstra(graph, 1, 3)
+
+
+def test_point_to_point_searches_agree():
+    for seed in range(10):
+        graph = _random_graph(seed)
+        index = LandmarkIndex.build(graph, 4, seed)
+
+        for start, end in ((1, 2), (3, 40), (17, 5), (8, 8)):
+            _, expected = dijkstra(graph, start, end)
+
+            for path, distance in (dijkstra(graph, start, end, True), bidirectional_dijkstra(graph, start, end),
+                                   astar(graph, start, end), alt(graph, start, end, index)):
+                assert isclose(distance, expected) or distance == expected == inf
+                if (distance != inf):
+                    assert path[0] == start and path[-1] == end
+                    assert isclose(_path_length(graph, path), distance, abs_tol=1e-9)
+
+
+def test_alt_rejects_index_of_another_graph():
+    graph = _random_graph(0)
+    index = LandmarkIndex.build(graph, 4, 0)
+
+    with pytest.raises(Exception):
+        alt(TransposedView(graph), 1, 2, index)
+
+
+def test_alt_rejects_stale_index():
+    graph = _random_graph(0)
+    index = LandmarkIndex.build(graph, 4, 0)
+    graph.add_edge(1, 2, 0.5)
+
+    with pytest.raises(Exception):
+        alt(graph, 1, 2, index)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def floydwarshall_backend(request, monkeypatch):
+    if (request.param == "numpy" and ShortestPath.np is None):
+        pytest.skip("numpy is not installed")
+    if (request.param == "python"):
+        monkeypatch.setattr(ShortestPath, "np", None)
+    return request.param
+
+
+def test_floydwarshall_matches_dijkstra(floydwarshall_backend):
+    graph = _random_graph(1, size=25, num_edges=80)
+    distances, predecessors = floydwarshall(graph, predecessors=True)
+
+    for start in graph.vertices:
+        for end in graph.vertices:
+            _, expected = dijkstra(graph, start, end)
+            distance = distances[graph.get_vertex_index(start)][graph.get_vertex_index(end)]
+            assert isclose(distance, expected) or distance == expected == inf
+
+            path = floydwarshall_path(graph, predecessors, start, end)
+            if (expected == inf):
+                assert path == tuple()
+            else:
+                assert path[0] == start and path[-1] == end
+                assert isclose(_path_length(graph, path), expected, abs_tol=1e-9)
+
+
+def test_floydwarshall_negative_edges(floydwarshall_backend):
+    graph = Graph([1, 2, 3], [(1, 2, 4), (2, 3, -2), (1, 3, 3)])
+    distances = floydwarshall(graph)
+
+    assert distances[0][2] == 2
+    assert distances[2][0] == inf
+
+
+def test_floydwarshall_negative_cycle_on_diagonal(floydwarshall_backend):
+    graph = Graph([1, 2, 3], [(1, 2, 1), (2, 1, -3), (2, 3, 1)])
+    distances = floydwarshall(graph)
+
+    assert distances[0][0] < 0 and distances[1][1] < 0
+    assert distances[2][2] == 0
+
+
+def test_floydwarshall_blocked_matches_unblocked():
+    if (ShortestPath.np is None):
+        pytest.skip("numpy is not installed")
+
+    graph = _random_graph(2, size=50, num_edges=200)
+
+    # Tiles add the same path lengths in a different order, so results may differ in the last bits
+    assert ShortestPath.np.allclose(floydwarshall(graph, block_size=16), floydwarshall(graph))